@@ -74,48 +74,35 @@ class MockPageLayout(layout.PageLayout):
         ]
 
 
-class MockDocumentLayout(layout.DocumentLayout):
-    @property
-    def pages(self):
-        return [
-            MockPageLayout(number=0, image=Image.new("1", (1, 1))),
-        ]
+def mock_page_layout_from_image(image, number=1, **kwargs):
+    page = MockPageLayout(number=number, image=None)
+    page.image_metadata = {"format": image.format, "width": image.width, "height": image.height}
+    return page
 
 
-@pytest.mark.parametrize(
-    ("filename", "file"),
-    [
-        ("example-docs/example.jpg", None),
-        (None, b"0000"),
-    ],
-)
-def test_partition_image_local(monkeypatch, filename, file):
-    monkeypatch.setattr(
-        layout,
-        "process_data_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        layout,
-        "process_file_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
+@pytest.fixture()
+def mock_from_image(monkeypatch):
+    from_image = mock.MagicMock(side_effect=mock_page_layout_from_image)
+    monkeypatch.setattr(pdf, "_get_layout_model_kwargs", lambda model_name: {})
+    monkeypatch.setattr(layout.PageLayout, "from_image", from_image)
     monkeypatch.setattr(
         ocr,
-        "process_data_with_ocr",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        ocr,
-        "process_data_with_ocr",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-
-    partition_image_response = pdf._partition_pdf_or_image_local(
-        filename,
-        file,
-        is_image=True,
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: page_layout,
     )
+    return from_image
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_partition_image_local(mock_from_image, as_file, filename="example-docs/example.jpg"):
+    if as_file:
+        with open(filename, "rb") as f:
+            partition_image_response = pdf._partition_pdf_or_image_local(
+                file=f.read(),
+                is_image=True,
+            )
+    else:
+        partition_image_response = pdf._partition_pdf_or_image_local(filename, is_image=True)
     assert partition_image_response[0].text == "Charlie Brown and the Great Pumpkin"
 
 
@@ -160,7 +147,7 @@ def test_partition_image_with_multipage_tiff(
 def test_partition_image_with_language_passed(filename="example-docs/example.jpg"):
     with mock.patch.object(
         ocr,
-        "process_file_with_ocr",
+        "supplement_page_layout_with_ocr",
         mock.MagicMock(),
     ) as mock_partition:
         image.partition_image(
@@ -177,7 +164,7 @@ def test_partition_image_from_file_with_language_passed(
 ):
     with mock.patch.object(
         ocr,
-        "process_data_with_ocr",
+        "supplement_page_layout_with_ocr",
         mock.MagicMock(),
     ) as mock_partition, open(filename, "rb") as f:
         image.partition_image(file=f, strategy="hi_res", ocr_languages="eng+swe")
@@ -451,10 +438,10 @@ def test_partition_image_with_ocr_coordinates_are_not_nan_from_filename(
 def test_partition_image_formats_languages_for_tesseract():
     filename = "example-docs/jpn-vert.jpeg"
     with mock.patch(
-        "unstructured.partition.ocr.process_file_with_ocr",
-    ) as mock_process_file_with_ocr:
+        "unstructured.partition.ocr.supplement_page_layout_with_ocr",
+    ) as mock_supplement_page_layout_with_ocr:
         image.partition_image(filename=filename, strategy="hi_res", languages=["jpn_vert"])
-        _, kwargs = mock_process_file_with_ocr.call_args_list[0]
+        _, kwargs = mock_supplement_page_layout_with_ocr.call_args_list[0]
         assert "ocr_languages" in kwargs
         assert kwargs["ocr_languages"] == "jpn_vert"
 
@@ -530,3 +517,59 @@ def test_partition_image_raises_TypeError_for_invalid_languages():
     filename = "example-docs/layout-parser-paper-fast.jpg"
     with pytest.raises(TypeError):
         image.partition_image(filename=filename, strategy="hi_res", languages="eng")
+
+
+class MockFramePageLayout(layout.PageLayout):
+    def __init__(self, text: str, width: int, height: int):
+        self.number = 0
+        self.image = None
+        self.image_metadata = {"format": "TIFF", "width": width, "height": height}
+        self.text = text
+
+    @property
+    def elements(self):
+        return [layout.LayoutElement(type="Title", x1=0, y1=0, x2=2, y2=2, text=self.text)]
+
+
+@pytest.mark.parametrize(
+    ("ocr_workers", "page_numbers", "expected_page_numbers"),
+    [
+        (1, None, [1, 2, 3, 4, 5]),
+        (3, None, [1, 2, 3, 4, 5]),
+        (3, [2, 4], [2, 4]),
+    ],
+)
+def test_partition_multipage_image_local_partitions_frames_one_by_one(
+    monkeypatch,
+    tmp_path,
+    ocr_workers,
+    page_numbers,
+    expected_page_numbers,
+):
+    filename = str(tmp_path / "frames.tiff")
+    frames = [Image.new("RGB", (100 + i, 100)) for i in range(1, 6)]
+    frames[0].save(filename, save_all=True, append_images=frames[1:])
+
+    def mock_from_image(frame, number=1, **kwargs):
+        return MockFramePageLayout(f"Frame {frame.width - 100}", *frame.size)
+
+    monkeypatch.setattr(pdf, "_get_layout_model_kwargs", lambda model_name: {})
+    monkeypatch.setattr(layout.PageLayout, "from_image", mock_from_image)
+    monkeypatch.setattr(
+        ocr,
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: page_layout,
+    )
+
+    elements = pdf._partition_pdf_or_image_local(
+        filename=filename,
+        is_image=True,
+        include_page_breaks=True,
+        page_numbers=page_numbers,
+        ocr_workers=ocr_workers,
+    )
+
+    titles = [element for element in elements if element.category == "Title"]
+    assert [title.text for title in titles] == [f"Frame {i}" for i in expected_page_numbers]
+    assert [title.metadata.page_number for title in titles] == expected_page_numbers
+    assert len(elements) == 2 * len(expected_page_numbers) - 1
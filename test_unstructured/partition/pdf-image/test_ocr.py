@@ -1,7 +1,12 @@
+import sys
+import tempfile
+from unittest import mock
+
+import numpy as np
 import pytest
 import unstructured_pytesseract
-from pdf2image.exceptions import PDFPageCountError
 from PIL import Image, UnidentifiedImageError
+from pypdfium2 import PdfiumError
 from unstructured_inference.inference.elements import EmbeddedTextRegion, TextRegion
 from unstructured_inference.inference.layout import DocumentLayout
 from unstructured_inference.inference.layoutelement import (
@@ -11,13 +16,16 @@ from unstructured_inference.inference.layoutelement import (
 from unstructured.partition import ocr
 from unstructured.partition.ocr import pad_element_bboxes
 from unstructured.partition.utils.ocr_models import paddle_ocr
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.tesseract_ocr import OCRAgentTesseract
+from unstructured.partition.utils.ocr_models.tesserocr_ocr import OCRAgentTesserocr
 
 
 @pytest.mark.parametrize(
     ("is_image", "expected_error"),
     [
         (True, UnidentifiedImageError),
-        (False, PDFPageCountError),
+        (False, PdfiumError),
     ],
 )
 def test_process_data_with_ocr_invalid_file(is_image, expected_error):
@@ -166,6 +174,191 @@ def test_get_ocr_text_from_image_paddle(monkeypatch):
     assert ocr_text == "HelloWorld!"
 
 
+@pytest.mark.parametrize("ocr_workers", [1, 3])
+def test_get_ocr_texts_from_images_tesseract(monkeypatch, ocr_workers):
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "image_to_string",
+        lambda image, **kwargs: {"text": f"width {image.shape[1]}"},
+    )
+    images = [Image.new("RGB", (width, 10)) for width in range(10, 16)]
+
+    ocr_texts = ocr.get_ocr_texts_from_images(images, ocr_workers=ocr_workers)
+
+    assert ocr_texts == [f"width {width}" for width in range(10, 16)]
+
+
+def test_paddle_get_texts_from_images_falls_back_to_public_ocr(monkeypatch):
+    monkeypatch.setattr(
+        paddle_ocr,
+        "load_agent",
+        monkeypatch_load_agent,
+    )
+    images = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(2)]
+
+    assert not paddle_ocr.supports_batched_recognition(paddle_ocr.load_agent())
+    assert paddle_ocr.get_texts_from_images(images) == ["HelloWorld!", "HelloWorld!"]
+
+
+def test_get_ocr_texts_from_images_paddle_batches_images(monkeypatch):
+    batches = []
+
+    def mock_get_texts_from_images(images):
+        batches.append(images)
+        return [f"width {image.shape[1]}" for image in images]
+
+    monkeypatch.setattr(paddle_ocr, "get_texts_from_images", mock_get_texts_from_images)
+    images = [Image.new("RGB", (width, 10)) for width in range(10, 13)]
+
+    ocr_texts = ocr.get_ocr_texts_from_images(images, entire_page_ocr="paddle")
+
+    assert ocr_texts == ["width 10", "width 11", "width 12"]
+    assert len(batches) == 1
+
+
+@pytest.mark.parametrize("ocr_workers", [1, 2])
+def test_supplement_page_layout_with_ocr_individual_blocks(monkeypatch, ocr_workers):
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "image_to_string",
+        lambda image, **kwargs: {"text": f"{image.shape[1]}x{image.shape[0]}"},
+    )
+    elements = [
+        LayoutElement(x1=20, y1=20, x2=30, y2=40, text=""),
+        LayoutElement(x1=40, y1=40, x2=50, y2=50, text="Existing text"),
+        LayoutElement(x1=60, y1=60, x2=80, y2=65, text=""),
+    ]
+    page_layout = mock.MagicMock(elements=elements)
+
+    ocr.supplement_page_layout_with_ocr(
+        page_layout,
+        Image.new("RGB", (100, 100)),
+        ocr_mode="individual_blocks",
+        ocr_workers=ocr_workers,
+    )
+
+    # Each crop is padded by 12 pixels on every side
+    assert [element.text for element in elements] == ["34x44", "Existing text", "44x29"]
+    assert (elements[0].x1, elements[0].y1, elements[0].x2, elements[0].y2) == (20, 20, 30, 40)
+
+
+def test_get_agent_is_loaded_once():
+    ocr_agent = OCRAgent.get_agent("tesseract")
+
+    assert isinstance(ocr_agent, OCRAgentTesseract)
+    assert OCRAgent.get_agent("Tesseract") is ocr_agent
+    assert (
+        OCRAgent.get_agent(
+            "unstructured.partition.utils.ocr_models.tesseract_ocr.OCRAgentTesseract"
+        )
+        is ocr_agent
+    )
+
+
+def test_get_agent_invalid_agent():
+    with pytest.raises(ValueError):
+        OCRAgent.get_agent("invalid_ocr")
+
+
+def test_get_agent_requiring_text_and_boxes():
+    assert OCRAgent.get_agent("tesseract", require_text_and_boxes=True).supports_text_and_boxes
+    assert not OCRAgent.get_agent("paddle").supports_text_and_boxes
+    with pytest.raises(ValueError, match="does not produce the character boxes"):
+        OCRAgent.get_agent("paddle", require_text_and_boxes=True)
+
+
+@pytest.mark.parametrize(
+    ("env_value", "expected"),
+    [
+        ("Tesserocr", "tesserocr"),
+        ("paddle", "paddle"),
+        ("my_package.ocr.MyOCRAgent", "my_package.ocr.MyOCRAgent"),
+    ],
+)
+def test_get_entire_page_ocr(monkeypatch, env_value, expected):
+    monkeypatch.setenv("ENTIRE_PAGE_OCR", env_value)
+    assert ocr.get_entire_page_ocr() == expected
+
+
+@pytest.mark.parametrize(
+    ("entire_page_ocr", "page_count", "ocr_workers", "expected"),
+    [
+        ("tesseract", 10, 4, 4),
+        ("tesseract", 2, 4, 2),
+        ("tesseract", 1, 4, 1),
+        ("tesseract", 10, 1, 1),
+        ("paddle", 10, 4, 1),
+    ],
+)
+def test_get_page_ocr_workers(monkeypatch, entire_page_ocr, page_count, ocr_workers, expected):
+    monkeypatch.setenv("ENTIRE_PAGE_OCR", entire_page_ocr)
+    assert ocr.get_page_ocr_workers(page_count, ocr_workers) == expected
+
+
+class MockTessBaseAPI:
+    instances = []
+
+    def __init__(self, lang):
+        self.lang = lang
+        self.images = []
+        MockTessBaseAPI.instances.append(self)
+
+    def SetImageBytes(self, imagedata, width, height, bytes_per_pixel, bytes_per_line):
+        assert len(imagedata) == height * bytes_per_line == height * width * bytes_per_pixel
+        self.images.append((width, height, bytes_per_pixel))
+
+    def GetUTF8Text(self):
+        return f"{self.lang} {self.images[-1]}"
+
+    def GetTSVText(self, page_number):
+        return "\n".join(
+            [
+                "1\t1\t0\t0\t0\t0\t0\t0\t100\t100\t-1\t",
+                "5\t1\t1\t1\t1\t1\t10\t5\t15\t10\t96.5\tHello",
+                "5\t1\t1\t1\t1\t2\t30\t25\t35\t30\t91\tWorld",
+            ],
+        )
+
+
+@pytest.fixture()
+def mock_tesserocr(monkeypatch):
+    MockTessBaseAPI.instances = []
+    monkeypatch.setitem(sys.modules, "tesserocr", mock.MagicMock(PyTessBaseAPI=MockTessBaseAPI))
+    return MockTessBaseAPI
+
+
+def test_tesserocr_agent_reuses_engine_per_language(mock_tesserocr):
+    ocr_agent = OCRAgentTesserocr()
+
+    ocr_texts = [
+        ocr_agent.get_text_from_image(Image.new("RGB", (20, 10)), ocr_languages="eng"),
+        ocr_agent.get_text_from_image(Image.new("L", (30, 10)), ocr_languages="eng"),
+        ocr_agent.get_text_from_image(np.zeros((10, 40, 3), dtype=np.uint8), ocr_languages="deu"),
+        ocr_agent.get_text_from_image(Image.new("RGBA", (50, 10)), ocr_languages="eng"),
+    ]
+
+    assert ocr_texts == ["eng (20, 10, 3)", "eng (30, 10, 1)", "deu (40, 10, 3)", "eng (50, 10, 3)"]
+    assert [api.lang for api in mock_tesserocr.instances] == ["eng", "deu"]
+
+
+def test_tesserocr_agent_uses_one_engine_per_thread(mock_tesserocr):
+    images = [Image.new("RGB", (10, 10)) for _ in range(8)]
+
+    OCRAgentTesserocr().get_texts_from_images(images, ocr_workers=4)
+
+    assert 1 <= len(mock_tesserocr.instances) <= 4
+    assert sum(len(api.images) for api in mock_tesserocr.instances) == 8
+
+
+def test_tesserocr_agent_get_layout_from_image(mock_tesserocr):
+    ocr_layout = OCRAgentTesserocr().get_layout_from_image(Image.new("RGB", (100, 100)))
+
+    assert ocr_layout == [
+        TextRegion(10, 5, 25, 15, "Hello", source="OCR-tesseract"),
+        TextRegion(30, 25, 65, 55, "World", source="OCR-tesseract"),
+    ]
+
+
 @pytest.fixture()
 def mock_ocr_regions():
     return [
@@ -413,3 +606,61 @@ def test_pad_element_bboxes(padding, expected_bbox):
     # make sure the original element has not changed
     original_element_bbox = (element.x1, element.y1, element.x2, element.y2)
     assert original_element_bbox == expected_original_element_bbox
+
+
+@pytest.mark.parametrize(
+    ("filename", "is_image"),
+    [
+        ("example-docs/layout-parser-paper-with-empty-pages.pdf", False),
+        ("example-docs/layout-parser-paper-fast.jpg", True),
+    ],
+)
+def test_process_data_with_ocr_does_not_write_temp_files(monkeypatch, filename, is_image):
+    def mock_named_temporary_file(*args, **kwargs):
+        raise AssertionError("process_data_with_ocr should not write temporary files")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", mock_named_temporary_file)
+    monkeypatch.setattr(tempfile, "mkstemp", mock_named_temporary_file)
+    monkeypatch.setattr(tempfile, "TemporaryDirectory", mock_named_temporary_file)
+    monkeypatch.setattr(
+        ocr,
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: image.size,
+    )
+    monkeypatch.setattr(DocumentLayout, "from_pages", lambda pages: pages)
+
+    with open(filename, "rb") as f:
+        page_sizes = ocr.process_data_with_ocr(
+            f,
+            out_layout=mock.MagicMock(),
+            is_image=is_image,
+            pdf_image_dpi=100,
+        )
+
+    assert len(page_sizes) == (1 if is_image else 4)
+
+
+@pytest.mark.parametrize("max_cells", [1, 7, 2**22])
+def test_almost_subregion_matrix_matches_is_almost_subregion_of(max_cells):
+    rng = np.random.default_rng(seed=42)
+
+    def random_regions(n):
+        regions = []
+        for x1, y1, width, height in rng.integers(0, 50, size=(n, 4)):
+            regions.append(TextRegion(x1, y1, x1 + width, y1 + height))
+        # Zero-area and identical regions are edge cases of the containment check
+        regions.append(TextRegion(10, 10, 10, 20))
+        regions.append(regions[0])
+        return regions
+
+    regions, others = random_regions(40), random_regions(15)
+
+    matrix = ocr.almost_subregion_matrix(regions, others, 0.5, max_cells=max_cells)
+
+    assert matrix.tolist() == [
+        [region.is_almost_subregion_of(other, 0.5) for other in others] for region in regions
+    ]
+
+
+def test_almost_subregion_matrix_with_no_regions():
+    assert ocr.almost_subregion_matrix([], [TextRegion(0, 0, 1, 1)], 0.5).shape == (0, 1)
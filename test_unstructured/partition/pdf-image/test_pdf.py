@@ -1,4 +1,8 @@
+import contextlib
+import gc
+import io
 import os
+import weakref
 from tempfile import SpooledTemporaryFile
 from unittest import mock
 
@@ -13,6 +17,7 @@ from unstructured.documents.elements import (
     ElementMetadata,
     ListItem,
     NarrativeText,
+    PageBreak,
     Text,
     Title,
 )
@@ -89,36 +94,36 @@ class MockDocumentLayout(layout.DocumentLayout):
         ]
 
 
-@pytest.mark.parametrize(
-    ("filename", "file"),
-    [
-        ("example-docs/layout-parser-paper-fast.pdf", None),
-        (None, b"0000"),
-    ],
-)
-def test_partition_pdf_local(monkeypatch, filename, file):
-    monkeypatch.setattr(
-        layout,
-        "process_data_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        layout,
-        "process_file_with_model",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
-    monkeypatch.setattr(
-        ocr,
-        "process_data_with_ocr",
-        lambda *args, **kwargs: MockDocumentLayout(),
-    )
+def mock_page_layout_from_image(image, number=1, **kwargs):
+    page = MockPageLayout(number=number, image=None)
+    page.image_metadata = {"format": image.format, "width": image.width, "height": image.height}
+    return page
+
+
+@pytest.fixture()
+def mock_from_image(monkeypatch):
+    from_image = mock.MagicMock(side_effect=mock_page_layout_from_image)
+    monkeypatch.setattr(pdf, "_get_layout_model_kwargs", lambda model_name: {})
+    monkeypatch.setattr(layout.PageLayout, "from_image", from_image)
     monkeypatch.setattr(
         ocr,
-        "process_data_with_ocr",
-        lambda *args, **kwargs: MockDocumentLayout(),
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: page_layout,
     )
+    return from_image
+
 
-    partition_pdf_response = pdf._partition_pdf_or_image_local(filename, file)
+@pytest.mark.parametrize("as_file", [False, True])
+def test_partition_pdf_local(
+    mock_from_image,
+    as_file,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    if as_file:
+        with open(filename, "rb") as f:
+            partition_pdf_response = pdf._partition_pdf_or_image_local(file=f.read())
+    else:
+        partition_pdf_response = pdf._partition_pdf_or_image_local(filename)
     assert partition_pdf_response[0].text == "Charlie Brown and the Great Pumpkin"
 
 
@@ -169,42 +174,38 @@ def test_partition_pdf(
 @mock.patch.dict(os.environ, {"UNSTRUCTURED_HI_RES_MODEL_NAME": "checkbox"})
 def test_partition_pdf_with_model_name_env_var(
     monkeypatch,
+    mock_from_image,
     filename="example-docs/layout-parser-paper-fast.pdf",
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
-        mock.MagicMock(),
-    ) as mock_process:
+        pdf,
+        "_get_layout_model_kwargs",
+        mock.MagicMock(return_value={}),
+    ) as mock_get_model:
         pdf.partition_pdf(filename=filename, strategy="hi_res")
-        mock_process.assert_called_once_with(
-            filename,
-            is_image=False,
-            pdf_image_dpi=200,
-            extract_tables=False,
-            model_name="checkbox",
-        )
+        mock_get_model.assert_called_once_with("checkbox")
+    assert mock_from_image.call_count == 2
+    assert mock_from_image.call_args.kwargs["extract_tables"] is False
+    assert mock_from_image.call_args.args[0].size == (1700, 2200)
 
 
 def test_partition_pdf_with_model_name(
     monkeypatch,
+    mock_from_image,
     filename="example-docs/layout-parser-paper-fast.pdf",
 ):
     monkeypatch.setattr(pdf, "extractable_elements", lambda *args, **kwargs: [])
     with mock.patch.object(
-        layout,
-        "process_file_with_model",
-        mock.MagicMock(),
-    ) as mock_process:
+        pdf,
+        "_get_layout_model_kwargs",
+        mock.MagicMock(return_value={}),
+    ) as mock_get_model:
         pdf.partition_pdf(filename=filename, strategy="hi_res", model_name="checkbox")
-        mock_process.assert_called_once_with(
-            filename,
-            is_image=False,
-            pdf_image_dpi=200,
-            extract_tables=False,
-            model_name="checkbox",
-        )
+        mock_get_model.assert_called_once_with("checkbox")
+    assert mock_from_image.call_count == 2
+    assert mock_from_image.call_args.kwargs["extract_tables"] is False
+    assert mock_from_image.call_args.args[0].size == (1700, 2200)
 
 
 def test_partition_pdf_with_auto_strategy(
@@ -392,13 +393,10 @@ def test_partition_pdf_falls_back_to_ocr_only(
     assert "unstructured_inference is not installed" in caplog.text
 
 
-def test_partition_pdf_uses_table_extraction():
+def test_partition_pdf_uses_table_extraction(mock_from_image):
     filename = "example-docs/layout-parser-paper-fast.pdf"
-    with mock.patch(
-        "unstructured_inference.inference.layout.process_file_with_model",
-    ) as mock_process_file_with_model:
-        pdf.partition_pdf(filename, infer_table_structure=True)
-        assert mock_process_file_with_model.call_args[1]["extract_tables"]
+    pdf.partition_pdf(filename, infer_table_structure=True)
+    assert mock_from_image.call_args[1]["extract_tables"]
 
 
 def test_partition_pdf_with_copy_protection():
@@ -412,17 +410,13 @@ def test_partition_pdf_with_copy_protection():
     assert isinstance(elements[idx].metadata.detection_class_prob, float)
 
 
-def test_partition_pdf_with_dpi():
+def test_partition_pdf_with_dpi(mock_from_image):
     filename = os.path.join("example-docs", "copy-protected.pdf")
-    with mock.patch.object(layout, "process_file_with_model", mock.MagicMock()) as mock_process:
-        pdf.partition_pdf(filename=filename, strategy="hi_res", pdf_image_dpi=100)
-        mock_process.assert_called_once_with(
-            filename,
-            is_image=False,
-            extract_tables=False,
-            model_name=pdf.default_hi_res_model(),
-            pdf_image_dpi=100,
-        )
+    pdf.partition_pdf(filename=filename, strategy="hi_res", pdf_image_dpi=100)
+    assert [call.args[0].size for call in mock_from_image.call_args_list] == [
+        (850, 1100),
+        (850, 1100),
+    ]
 
 
 def test_partition_pdf_requiring_recursive_text_grab(filename="example-docs/reliance.pdf"):
@@ -861,17 +855,15 @@ def test_add_chunking_strategy_by_title_on_partition_pdf(
     assert chunk_elements == chunks
 
 
-def test_partition_pdf_formats_languages_for_tesseract():
+def test_partition_pdf_formats_languages_for_tesseract(mock_from_image):
     filename = "example-docs/DA-1p.pdf"
-    with mock.patch.object(layout, "process_file_with_model", mock.MagicMock()) as mock_process:
+    with mock.patch.object(
+        ocr,
+        "supplement_page_layout_with_ocr",
+        mock.MagicMock(side_effect=lambda page_layout, image, **kwargs: page_layout),
+    ) as mock_ocr:
         pdf.partition_pdf(filename=filename, strategy="hi_res", languages=["en"])
-        mock_process.assert_called_once_with(
-            filename,
-            is_image=False,
-            pdf_image_dpi=200,
-            extract_tables=False,
-            model_name=pdf.default_hi_res_model(),
-        )
+        assert mock_ocr.call_args.kwargs["ocr_languages"] == "eng"
 
 
 def test_partition_pdf_warns_with_ocr_languages(caplog):
@@ -1002,3 +994,839 @@ def test_check_annotations_within_element(threshold, expected):
     filtered = pdf.check_annotations_within_element(annotations, element_bbox, 1, threshold)
     results = [annotation in filtered for annotation in annotations]
     assert results == expected
+
+
+@pytest.mark.parametrize("partition_func", [pdf.partition_pdf, pdf.partition_pdf_iter])
+def test_partition_pdf_with_light_text_backend(
+    partition_func,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    with mock.patch.object(pdf.PDFMinerDocument, "page_layout") as mock_page_layout:
+        elements = list(
+            partition_func(filename=filename, strategy="fast", pdf_text_backend="light")
+        )
+
+    mock_page_layout.assert_not_called()
+    assert elements[0].text == "LayoutParser: A Unified Toolkit for Deep"
+    assert {element.metadata.page_number for element in elements} == {1, 2}
+    assert all(element.metadata.coordinates is None for element in elements)
+    assert all(element.metadata.filetype == "application/pdf" for element in elements)
+
+
+def test_partition_pdf_with_registered_text_backend(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    calls = []
+
+    def mock_backend(source, page_indices):
+        calls.append((source, list(page_indices)))
+        for i in page_indices:
+            yield f"Page {i + 1} of the document\nThis is the text layer of the page."
+
+    monkeypatch.setattr(pdf, "PDF_TEXT_BACKENDS", dict(pdf.PDF_TEXT_BACKENDS))
+    pdf.register_pdf_text_backend("mock", mock_backend)
+
+    elements = pdf.partition_pdf(
+        filename=filename, strategy="fast", pdf_text_backend="mock", pages=[2]
+    )
+
+    assert calls == [(filename, [1])]
+    assert [(element.text, element.metadata.page_number) for element in elements] == [
+        ("Page 2 of the document", 2),
+        ("This is the text layer of the page.", 2),
+    ]
+
+
+def test_partition_pdf_with_invalid_text_backend(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    with pytest.raises(ValueError):
+        pdf.partition_pdf(filename=filename, strategy="fast", pdf_text_backend="invalid")
+
+
+def test_check_annotations_within_elements():
+    annotations = [
+        {"bbox": [0, 0, 1, 1], "page_number": 1},
+        {"bbox": [0, 0, 3, 1], "page_number": 1},
+        {"bbox": [0, 0, 1, 1], "page_number": 2},
+        {"bbox": [0, 0, 0, 1], "page_number": 1},
+        {"bbox": [3, 0, 4, 1], "page_number": 1},
+    ]
+    element_bboxes = [(0, 0, 1, 1), (0, 0, 4, 1), (5, 5, 6, 6), (2.5, 0, 4, 2)]
+
+    filtered = pdf.check_annotations_within_elements(annotations, element_bboxes, 1, 0.4)
+
+    assert filtered == [
+        pdf.check_annotations_within_element(annotations, element_bbox, 1, 0.4)
+        for element_bbox in element_bboxes
+    ]
+    assert filtered == [
+        [annotations[0]],
+        [annotations[0], annotations[1], annotations[4]],
+        [],
+        [annotations[4]],
+    ]
+
+
+def test_map_bboxes_and_indices():
+    words = [
+        {"text": "Hello", "bbox": (0, 0, 10, 5), "start_index": 0},
+        {"text": "linked", "bbox": (12, 0, 22, 5), "start_index": 6},
+        {"text": "world", "bbox": (24, 0, 34, 5), "start_index": 13},
+    ]
+    annots = [
+        {"bbox": (12, 0, 34, 5)},
+        {"bbox": (0, 0, 10, 5)},
+        {"bbox": (24, 0, 10, 5)},
+    ]
+
+    mapped = pdf.map_bboxes_and_indices(words, [dict(annot) for annot in annots])
+
+    assert mapped == [pdf.map_bbox_and_index(words, dict(annot)) for annot in annots]
+    assert [(annot["text"], annot["start_index"]) for annot in mapped] == [
+        ("linked world", 6),
+        ("Hello", 0),
+        ("world", 13),
+    ]
+
+
+def test_map_bboxes_and_indices_without_words():
+    mapped = pdf.map_bboxes_and_indices([], [{"bbox": (0, 0, 1, 1)}])
+    assert mapped == [{"bbox": (0, 0, 1, 1), "text": "", "start_index": -1}]
+
+
+def test_partition_pdf_only_builds_word_boxes_for_linked_text_boxes(
+    filename="example-docs/multi-column-2p.pdf",
+):
+    with mock.patch.object(
+        pdf,
+        "get_word_bounding_box_from_element",
+        side_effect=pdf.get_word_bounding_box_from_element,
+    ) as mock_get_word_bounding_box:
+        elements = pdf.partition_pdf(filename=filename, strategy="fast")
+
+    linked_elements = [element for element in elements if element.metadata.links]
+    assert 0 < len(linked_elements) < len(elements)
+    assert mock_get_word_bounding_box.call_count <= len(linked_elements)
+
+
+def test_partition_pdf_hi_res_skips_pdfminer_extraction(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    monkeypatch.setattr(pdf, "_partition_pdf_or_image_local", lambda *args, **kwargs: [])
+    with mock.patch.object(pdf, "extractable_elements") as mock_extractable_elements:
+        pdf.partition_pdf(filename=filename, strategy="hi_res")
+    mock_extractable_elements.assert_not_called()
+
+
+def test_pdfminer_document_parses_the_document_once(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    with pdf.PDFMinerDocument(filename=filename) as pdf_document, mock.patch.object(
+        pdf.PDFPage,
+        "get_pages",
+        side_effect=pdf.PDFPage.get_pages,
+    ) as mock_get_pages:
+        assert pdf.probe_pdf_text_extractable(pdf_document)
+        first = pdf.extractable_elements(filename=filename, pdf_document=pdf_document)
+        second = pdf.extractable_elements(filename=filename, pdf_document=pdf_document)
+
+        assert pdf_document.page_count == 2
+        assert pdf_document.page_sizes == [(612, 792), (612, 792)]
+        assert mock_get_pages.call_count == 1
+    assert [el.text for el in first] == [el.text for el in second]
+
+
+@pytest.mark.parametrize(
+    ("page_count", "first_pages", "random_pages", "expected"),
+    [
+        (3, 5, 5, [0, 1, 2]),
+        (12, 5, 0, [0, 1, 2, 3, 4]),
+        (12, 0, 0, []),
+    ],
+)
+def test_get_text_probe_page_indices(page_count, first_pages, random_pages, expected):
+    assert pdf.get_text_probe_page_indices(page_count, first_pages, random_pages) == expected
+
+
+def test_get_text_probe_page_indices_samples_random_pages_deterministically():
+    indices = pdf.get_text_probe_page_indices(100, first_pages=2, random_pages=3)
+    assert indices[:2] == [0, 1]
+    assert len(set(indices)) == 5
+    assert all(2 <= i < 100 for i in indices[2:])
+    assert indices == pdf.get_text_probe_page_indices(100, first_pages=2, random_pages=3)
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected"),
+    [
+        ("example-docs/layout-parser-paper-fast.pdf", True),
+        ("example-docs/copy-protected.pdf", True),
+        ("example-docs/loremipsum-flat.pdf", False),
+    ],
+)
+def test_probe_pdf_text_extractable(filename, expected):
+    with pdf.PDFMinerDocument(filename=filename) as pdf_document:
+        assert pdf.probe_pdf_text_extractable(pdf_document) is expected
+
+
+def test_partition_pdf_auto_probes_text_before_extraction(
+    filename="example-docs/loremipsum-flat.pdf",
+):
+    mock_return = [Text("Hello there!")]
+    with mock.patch.object(
+        pdf, "extractable_elements"
+    ) as mock_extractable_elements, mock.patch.object(
+        pdf,
+        "_partition_pdf_or_image_with_ocr",
+        return_value=mock_return,
+    ) as mock_partition_ocr:
+        elements = pdf.partition_pdf(filename=filename, strategy="auto")
+
+    mock_extractable_elements.assert_not_called()
+    mock_partition_ocr.assert_called_once()
+    assert elements == mock_return
+
+
+@pytest.mark.parametrize("from_file", [True, False])
+def test_partition_pdf_with_fast_strategy_in_parallel_matches_serial(
+    from_file,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    def _partition(**kwargs):
+        if from_file:
+            with open(filename, "rb") as f:
+                return pdf.partition_pdf(
+                    file=f, strategy="fast", include_page_breaks=True, **kwargs
+                )
+        return pdf.partition_pdf(
+            filename=filename, strategy="fast", include_page_breaks=True, **kwargs
+        )
+
+    serial_elements = _partition()
+    parallel_elements = _partition(pdfminer_processes=2)
+
+    assert len(parallel_elements) == len(serial_elements)
+    for serial, parallel in zip(serial_elements, parallel_elements):
+        assert parallel == serial
+        assert parallel.metadata.to_dict() == serial.metadata.to_dict()
+
+
+def test_partition_pdf_with_fast_strategy_in_daemonic_process_runs_serially(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    monkeypatch.setattr(pdf.mp, "current_process", lambda: mock.Mock(daemon=True))
+    with mock.patch.object(pdf.mp, "Pool") as mock_pool:
+        elements = pdf.partition_pdf(filename=filename, strategy="fast", pdfminer_processes=2)
+
+    mock_pool.assert_not_called()
+    assert elements == pdf.partition_pdf(filename=filename, strategy="fast")
+
+
+def test_process_pdfminer_page_batch_parses_the_document_once_per_worker(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    with mock.patch.object(
+        pdf.PDFPage,
+        "get_pages",
+        side_effect=pdf.PDFPage.get_pages,
+    ) as mock_get_pages:
+        pdf._open_pdfminer_worker_document(filename)
+        first_batch = pdf._process_pdfminer_page_batch([0], filename=filename)
+        second_batch = pdf._process_pdfminer_page_batch([1], filename=filename)
+
+    assert mock_get_pages.call_count == 1
+    assert [elements[0].metadata.page_number for elements in first_batch + second_batch] == [1, 2]
+
+
+@pytest.mark.parametrize("ocr_workers", [1, 3])
+def test_ocr_pdf_pages_yields_pages_in_order(monkeypatch, ocr_workers):
+    import time
+
+    import unstructured_pytesseract
+
+    images = [Image.new("RGB", (10 + i, 10)) for i in range(8)]
+
+    def mock_run_and_get_multiple_output(image, extensions, lang):
+        width = image.size[0]
+        # Earlier pages take longer so that concurrent results complete out of order
+        time.sleep((20 - width) * 0.001)
+        return f"page {width - 10}", ""
+
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        mock_run_and_get_multiple_output,
+    )
+
+    results = list(pdf._ocr_pdf_pages(iter(images), ocr_workers=ocr_workers))
+
+    assert [image for image, _, _ in results] == images
+    assert [text for _, text, _ in results] == [f"page {i}" for i in range(8)]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"strategy": "fast"},
+        {"strategy": "fast", "include_page_breaks": True},
+        {"strategy": "auto", "metadata_filename": "renamed.pdf"},
+        {"strategy": "fast", "include_metadata": False},
+    ],
+)
+def test_partition_pdf_iter_matches_partition_pdf(
+    kwargs,
+    filename="example-docs/layout-parser-paper-with-empty-pages.pdf",
+):
+    elements = pdf.partition_pdf(filename=filename, **kwargs)
+    iter_elements = list(pdf.partition_pdf_iter(filename=filename, **kwargs))
+
+    assert iter_elements == elements
+    assert [el.metadata.to_dict() for el in iter_elements] == [
+        el.metadata.to_dict() for el in elements
+    ]
+
+
+@pytest.mark.parametrize("partition_func", [pdf.partition_pdf, pdf.partition_pdf_iter])
+def test_partition_pdf_releases_page_layouts(
+    partition_func,
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-with-empty-pages.pdf",
+):
+    page_layouts = []
+    alive_page_counts = []
+    page_layout = pdf.PDFMinerDocument.page_layout
+
+    def spy_page_layout(self, index):
+        gc.collect()
+        alive_page_counts.append(sum(ref() is not None for ref in page_layouts))
+        result = page_layout(self, index)
+        page_layouts.append(weakref.ref(result))
+        return result
+
+    monkeypatch.setattr(pdf.PDFMinerDocument, "page_layout", spy_page_layout)
+    elements = list(partition_func(filename=filename, strategy="fast"))
+
+    assert elements[0].metadata.page_number == 1
+    assert alive_page_counts == [0, 0, 0, 0]
+
+
+def test_partition_pdf_closes_document_when_extraction_fails(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    closed = []
+    close = pdf.PDFMinerDocument.close
+
+    def spy_close(self):
+        closed.append(self._fp)
+        close(self)
+
+    def fail(pdf_document, **kwargs):
+        pdf_document.page_layout(0)
+        raise RuntimeError("extraction failed")
+
+    monkeypatch.setattr(pdf.PDFMinerDocument, "close", spy_close)
+    monkeypatch.setattr(pdf, "_process_pdfminer_pages", fail)
+    with pytest.raises(RuntimeError):
+        pdf.partition_pdf(filename=filename, strategy="fast")
+
+    assert closed
+    assert closed[0] is not None and closed[0].closed
+
+
+def test_partition_pdf_iter_with_ocr_only_yields_pages_lazily(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    import unstructured_pytesseract
+
+    rendered_pages = []
+
+    def mock_convert_pdf_to_images(*args, **kwargs):
+        for page_number in range(1, 4):
+            rendered_pages.append(page_number)
+            yield Image.new("RGB", (10 + page_number, 10))
+
+    monkeypatch.setattr(pdf, "convert_pdf_to_images", mock_convert_pdf_to_images)
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        lambda image, extensions, lang: (f"This is page {image.size[0] - 10}.", ""),
+    )
+
+    elements = pdf.partition_pdf_iter(filename=filename, strategy="ocr_only")
+    first_element = next(elements)
+
+    assert rendered_pages == [1]
+    assert first_element.text == "This is page 1."
+    assert [el.metadata.page_number for el in elements] == [2, 3]
+
+
+def test_iter_pdf_or_image_local_matches_partition_pdf_or_image_local(
+    mock_from_image,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    elements = pdf._partition_pdf_or_image_local(filename, include_page_breaks=True)
+    pages_elements = list(pdf._iter_pdf_or_image_local(filename, include_page_breaks=True))
+
+    assert len(pages_elements) == 2
+    assert [el for page_elements in pages_elements for el in page_elements] == elements
+
+
+def test_partition_pdf_with_ocr_only_resumes_from_checkpoint(
+    monkeypatch,
+    tmp_path,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    import unstructured_pytesseract
+
+    rendered_pages = []
+    failing_pages = {2}
+
+    def mock_convert_pdf_to_images(*args, page_numbers=None, **kwargs):
+        for page_number in page_numbers or [1, 2]:
+            if page_number in failing_pages:
+                raise RuntimeError("The worker was interrupted.")
+            rendered_pages.append(page_number)
+            yield Image.new("RGB", (10 + page_number, 10))
+
+    monkeypatch.setattr(pdf, "convert_pdf_to_images", mock_convert_pdf_to_images)
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        lambda image, extensions, lang: (f"This is page {image.size[0] - 10}.", ""),
+    )
+
+    with pytest.raises(RuntimeError):
+        pdf.partition_pdf(filename=filename, strategy="ocr_only", checkpoint_dir=str(tmp_path))
+    failing_pages.clear()
+    elements = pdf.partition_pdf(
+        filename=filename,
+        strategy="ocr_only",
+        checkpoint_dir=str(tmp_path),
+    )
+
+    assert rendered_pages == [1, 2]
+    assert [el.text for el in elements] == ["This is page 1.", "This is page 2."]
+    assert [el.metadata.page_number for el in elements] == [1, 2]
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_partition_pdf_with_hi_res_strategy_renders_each_page_once(
+    monkeypatch,
+    mock_from_image,
+    as_file,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    from unstructured.partition.utils import rendered_pages
+
+    rendered_page_numbers = []
+    render_pdfium_page = rendered_pages._render_pdfium_page
+
+    def spy_render_pdfium_page(document, page_number, dpi):
+        rendered_page_numbers.append(page_number)
+        return render_pdfium_page(document, page_number, dpi)
+
+    monkeypatch.setattr(rendered_pages, "_render_pdfium_page", spy_render_pdfium_page)
+    ocr_images = []
+    monkeypatch.setattr(
+        ocr,
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: ocr_images.append(image) or page_layout,
+    )
+
+    if as_file:
+        with open(filename, "rb") as f:
+            pdf.partition_pdf(file=f, strategy="hi_res")
+    else:
+        pdf.partition_pdf(filename=filename, strategy="hi_res")
+
+    assert rendered_page_numbers == [1, 2]
+    # OCR is given the very images the layout model was given
+    model_images = [call.args[0] for call in mock_from_image.call_args_list]
+    assert [id(image) for image in ocr_images] == [id(image) for image in model_images]
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_partition_pdf_iter_with_hi_res_strategy_holds_one_page_at_a_time(
+    monkeypatch,
+    tmp_path,
+    as_file,
+):
+    import pypdfium2
+
+    filename = str(tmp_path / "pages.pdf")
+    with contextlib.closing(pypdfium2.PdfDocument.new()) as document:
+        for _ in range(6):
+            document.new_page(612, 792)
+        document.save(filename)
+    page_refs = []
+    alive_page_counts = []
+
+    def count_alive_pages():
+        gc.collect()
+        return sum(ref() is not None for ref in page_refs)
+
+    def spy_from_image(image, **kwargs):
+        alive_page_counts.append(count_alive_pages())
+        page_layout = mock_page_layout_from_image(image, **kwargs)
+        page_refs.extend([weakref.ref(image), weakref.ref(page_layout)])
+        return page_layout
+
+    monkeypatch.setattr(pdf, "_get_layout_model_kwargs", lambda model_name: {})
+    monkeypatch.setattr(layout.PageLayout, "from_image", spy_from_image)
+    monkeypatch.setattr(
+        ocr,
+        "supplement_page_layout_with_ocr",
+        lambda page_layout, image, **kwargs: page_layout,
+    )
+
+    with open(filename, "rb") as f:
+        kwargs = {"file": f} if as_file else {"filename": filename}
+        for element in pdf.partition_pdf_iter(strategy="hi_res", **kwargs):
+            alive_page_counts.append(count_alive_pages())
+
+    # Neither the image nor the layout of a page outlives the page
+    assert len(page_refs) == 12
+    assert alive_page_counts == [0] * 12
+
+
+def test_get_pdfminer_text_regions_matches_unstructured_inference(
+    monkeypatch,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    # The text regions of each page are built as `unstructured_inference` builds them for a whole
+    # file, so a change to its version of them shows up here
+    monkeypatch.setattr(layout.pdf2image, "convert_from_path", lambda *args, **kwargs: [])
+    expected_layouts, _ = layout.load_pdf(filename, dpi=150)
+
+    with pdf.PDFMinerDocument(filename=filename) as pdf_document:
+        layouts = [
+            pdf._get_pdfminer_text_regions(pdf_document.page_layout(i), dpi=150)
+            for i in range(pdf_document.page_count)
+        ]
+
+    assert layouts == expected_layouts
+
+
+def test_partition_pdf_or_image_local_with_checkpoint_matches_without(
+    mock_from_image,
+    tmp_path,
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    elements = pdf._partition_pdf_or_image_local(filename, include_page_breaks=True)
+    checkpointed_elements = pdf._partition_pdf_or_image_local(
+        filename,
+        include_page_breaks=True,
+        checkpoint_dir=str(tmp_path),
+    )
+
+    assert checkpointed_elements == elements
+
+
+@pytest.mark.parametrize(
+    ("pages", "first_page", "last_page", "expected"),
+    [
+        (None, None, None, [1, 2, 3, 4, 5]),
+        ([4, 2, 2], None, None, [2, 4]),
+        (None, 2, 4, [2, 3, 4]),
+        ([1, 3, 5], 2, None, [3, 5]),
+        (None, 6, None, []),
+    ],
+)
+def test_select_page_numbers(pages, first_page, last_page, expected):
+    assert pdf.select_page_numbers(5, pages, first_page, last_page) == expected
+
+
+def test_select_page_numbers_ignores_out_of_range_pages():
+    assert pdf.select_page_numbers(5, [0, 2, 6]) == [2]
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_get_pdf_page_count(as_file, filename="example-docs/multi-column.pdf"):
+    if as_file:
+        with open(filename, "rb") as f:
+            assert pdf.get_pdf_page_count(file=f) == 13
+    else:
+        assert pdf.get_pdf_page_count(filename=filename) == 13
+
+
+@pytest.mark.parametrize(
+    ("strategy", "expected"),
+    [("auto", "fast"), ("fast", "fast"), ("ocr_only", "ocr_only")],
+)
+def test_determine_pdf_strategy(strategy, expected, filename="example-docs/multi-column.pdf"):
+    assert pdf.determine_pdf_strategy(filename=filename, strategy=strategy) == expected
+
+
+def test_group_page_numbers():
+    assert list(pdf._group_page_numbers([1, 2, 3, 5, 6, 9], chunk_size=2)) == [
+        (1, 2),
+        (3, 3),
+        (5, 6),
+        (9, 9),
+    ]
+
+
+def test_convert_pdf_to_images_renders_only_selected_pages(monkeypatch):
+    calls = []
+
+    def mock_render_pages(self, first_page, last_page, dpi):
+        calls.append((first_page, last_page))
+        return [Image.new("1", (1, 1)) for _ in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(pdf.RenderedPDFPages, "render_pages", mock_render_pages)
+    monkeypatch.setattr(
+        pdf.RenderedPDFPages,
+        "page_count",
+        mock.PropertyMock(side_effect=AssertionError("page count should not be looked up")),
+    )
+
+    images = list(pdf.convert_pdf_to_images(filename="fake.pdf", page_numbers=[2, 3, 7]))
+
+    assert len(images) == 3
+    assert calls == [(2, 3), (7, 7)]
+
+
+@pytest.mark.parametrize("as_file", [False, True])
+def test_convert_pdf_to_images_renders_files_and_bytes_alike(as_file):
+    filename = "example-docs/layout-parser-paper-fast.pdf"
+    with open(filename, "rb") as f:
+        kwargs = {"file": f} if as_file else {"filename": filename}
+        images = list(pdf.convert_pdf_to_images(dpi=100, **kwargs))
+
+    with pdf.RenderedPDFPages(filename=filename) as rendered_pages:
+        expected_images = rendered_pages.render_pages(1, 2, dpi=100)
+    assert [image.tobytes() for image in images] == [image.tobytes() for image in expected_images]
+
+
+def test_group_page_numbers_splits_on_dpi_and_pixels():
+    page_dpis = {1: 200, 2: 200, 3: 100, 4: 100, 5: 100}
+    page_pixels = {1: 4, 2: 4, 3: 6, 4: 6, 5: 6}
+
+    assert list(
+        pdf._group_page_numbers(
+            range(1, 6),
+            chunk_size=10,
+            page_dpis=page_dpis,
+            page_pixels=page_pixels,
+            max_chunk_pixels=12,
+        ),
+    ) == [(1, 2), (3, 4), (5, 5)]
+
+
+def test_convert_pdf_to_images_lowers_dpi_of_oversized_pages(monkeypatch, tmp_path):
+    import pypdfium2
+
+    filename = str(tmp_path / "oversized.pdf")
+    with contextlib.closing(pypdfium2.PdfDocument.new()) as document:
+        document.new_page(612, 792)
+        document.new_page(2384, 3370)
+        document.save(filename)
+    calls = []
+
+    def mock_render_pages(self, first_page, last_page, dpi):
+        calls.append((first_page, last_page, dpi))
+        return [Image.new("1", (1, 1)) for _ in range(first_page, last_page + 1)]
+
+    monkeypatch.setattr(pdf.RenderedPDFPages, "render_pages", mock_render_pages)
+
+    images = list(pdf.convert_pdf_to_images(filename=filename, max_pixels=20_000_000))
+
+    assert calls == [(1, 1, 200), (2, 2, 113)]
+    assert [image.info["dpi"] for image in images] == [(200, 200), (113, 113)]
+
+
+def test_partition_pdf_local_lowers_dpi_of_oversized_pages(mock_from_image, tmp_path):
+    import pypdfium2
+
+    filename = str(tmp_path / "oversized.pdf")
+    with contextlib.closing(pypdfium2.PdfDocument.new()) as document:
+        document.new_page(612, 792)
+        document.new_page(2384, 3370)
+        document.save(filename)
+
+    elements = pdf._partition_pdf_or_image_local(filename, max_image_pixels=20_000_000)
+
+    # Only the oversized page is rendered at 113 dpi instead of 200 dpi
+    page_sizes = {1: (612, 792), 2: (2384, 3370)}
+    page_dpis = {1: 200, 2: 113}
+    assert [call.kwargs["number"] for call in mock_from_image.call_args_list] == [1, 2]
+    for call in mock_from_image.call_args_list:
+        width, height = page_sizes[call.kwargs["number"]]
+        dpi = page_dpis[call.kwargs["number"]]
+        assert call.args[0].size == pytest.approx((width * dpi / 72, height * dpi / 72), abs=1)
+    assert {element.metadata.page_number for element in elements} == {1, 2}
+    for element in elements:
+        width, height = page_sizes[element.metadata.page_number]
+        scale = 200 / page_dpis[element.metadata.page_number]
+        coordinates = element.metadata.coordinates
+        assert (coordinates.system.width, coordinates.system.height) == pytest.approx(
+            (width * 200 / 72, height * 200 / 72),
+            abs=2,
+        )
+        assert coordinates.points[2] == pytest.approx((2 * scale, 2 * scale), rel=1e-3)
+
+
+def test_partition_image_with_ocr_only_maps_coordinates_to_original_image(monkeypatch):
+    import unstructured_pytesseract
+
+    file = io.BytesIO()
+    Image.new("RGB", (400, 200)).save(file, format="PNG")
+    file.seek(0)
+    ocr_sizes = []
+
+    def mock_run_and_get_multiple_output(image, extensions, lang):
+        ocr_sizes.append(image.shape[1::-1])
+        return "Hi", "H 10 10 20 20 0\ni 20 10 30 20 0"
+
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        mock_run_and_get_multiple_output,
+    )
+
+    elements = pdf.partition_pdf_or_image(
+        file=file,
+        is_image=True,
+        strategy="ocr_only",
+        max_image_pixels=20_000,
+    )
+
+    assert ocr_sizes == [(200, 100)]
+    coordinates = elements[0].metadata.coordinates
+    assert (coordinates.system.width, coordinates.system.height) == (400, 200)
+    assert [(round(x), round(y)) for x, y in coordinates.points] == [
+        (20, 180),
+        (20, 160),
+        (60, 160),
+        (60, 180),
+    ]
+
+
+def partition_multipage_tiff_with_ocr_only(monkeypatch, tmp_path, **kwargs):
+    import unstructured_pytesseract
+
+    filename = str(tmp_path / "frames.tiff")
+    frames = [Image.new("RGB", (100 + i, 100)) for i in range(1, 4)]
+    frames[0].save(filename, save_all=True, append_images=frames[1:])
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        lambda image, extensions, lang: (f"This is frame {image.shape[1] - 100}.", ""),
+    )
+    return pdf.partition_pdf_or_image(
+        filename=filename,
+        is_image=True,
+        strategy="ocr_only",
+        include_page_breaks=True,
+        **kwargs,
+    )
+
+
+def test_partition_multipage_tiff_with_ocr_only_ocrs_the_first_frame(monkeypatch, tmp_path):
+    elements = partition_multipage_tiff_with_ocr_only(monkeypatch, tmp_path)
+
+    assert [el.text for el in elements] == ["This is frame 1."]
+    assert elements[0].metadata.page_number is None
+
+
+def test_partition_multipage_tiff_with_ocr_only_ocrs_every_selected_frame(monkeypatch, tmp_path):
+    elements = partition_multipage_tiff_with_ocr_only(monkeypatch, tmp_path, pages=[1, 3])
+
+    texts = [el for el in elements if not isinstance(el, PageBreak)]
+    assert [el.text for el in texts] == ["This is frame 1.", "This is frame 3."]
+    assert [el.metadata.page_number for el in texts] == [1, 3]
+    assert len(elements) == 3
+
+
+def test_partition_pdf_with_fast_strategy_and_pages(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    all_elements = pdf.partition_pdf(filename=filename, strategy="fast")
+    elements = pdf.partition_pdf(filename=filename, strategy="fast", pages=[2])
+
+    assert {el.metadata.page_number for el in elements} == {2}
+    assert [el.text for el in elements] == [
+        el.text for el in all_elements if el.metadata.page_number == 2
+    ]
+
+
+def test_partition_pdf_with_empty_page_selection(
+    filename="example-docs/layout-parser-paper-fast.pdf",
+):
+    assert pdf.partition_pdf(filename=filename, strategy="fast", first_page=3) == []
+
+
+def test_partition_pdf_with_hi_res_strategy_and_pages(
+    mock_from_image,
+    filename="example-docs/layout-parser-paper-with-empty-pages.pdf",
+):
+    elements = pdf.partition_pdf(filename=filename, strategy="hi_res", pages=[2, 4])
+
+    assert [call.kwargs["number"] for call in mock_from_image.call_args_list] == [2, 4]
+    assert {el.metadata.page_number for el in elements} == {2, 4}
+
+
+def test_partition_pdf_iter_with_pages(filename="example-docs/layout-parser-paper-fast.pdf"):
+    elements = pdf.partition_pdf(filename=filename, strategy="fast", first_page=2)
+
+    assert (
+        list(pdf.partition_pdf_iter(filename=filename, strategy="fast", first_page=2)) == elements
+    )
+
+
+def test_classify_pdf_pages(filename="example-docs/layout-parser-paper-with-empty-pages.pdf"):
+    with pdf.PDFMinerDocument(filename=filename) as pdf_document:
+        assert pdf.classify_pdf_pages(pdf_document) == ([1, 4], [2, 3])
+        assert pdf.classify_pdf_pages(pdf_document, page_numbers=[3, 4]) == ([4], [3])
+
+
+@pytest.fixture()
+def mock_ocr_pages(monkeypatch):
+    import unstructured_pytesseract
+
+    rendered_pages = []
+
+    def mock_convert_pdf_to_images(*args, page_numbers=None, **kwargs):
+        for page_number in page_numbers:
+            rendered_pages.append(page_number)
+            yield Image.new("RGB", (10 + page_number, 10))
+
+    monkeypatch.setattr(pdf, "convert_pdf_to_images", mock_convert_pdf_to_images)
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        lambda image, extensions, lang: (f"This is scanned page {image.size[0] - 10}.", ""),
+    )
+    return rendered_pages
+
+
+@pytest.mark.parametrize("partition", [pdf.partition_pdf, pdf.partition_pdf_iter])
+def test_partition_pdf_with_hybrid_strategy(
+    mock_ocr_pages,
+    partition,
+    filename="example-docs/layout-parser-paper-with-empty-pages.pdf",
+):
+    fast_elements = pdf.partition_pdf(filename=filename, strategy="fast")
+
+    elements = list(partition(filename=filename, strategy="hybrid", include_page_breaks=True))
+
+    assert mock_ocr_pages == [2, 3]
+    assert len([el for el in elements if isinstance(el, PageBreak)]) == 4
+    elements = [el for el in elements if not isinstance(el, PageBreak)]
+    assert [el.metadata.page_number for el in elements] == sorted(
+        el.metadata.page_number for el in elements
+    )
+    assert [el.text for el in elements if el.metadata.page_number in (2, 3)] == [
+        "This is scanned page 2.",
+        "This is scanned page 3.",
+    ]
+    assert [el.text for el in elements if el.metadata.page_number in (1, 4)] == [
+        el.text for el in fast_elements
+    ]
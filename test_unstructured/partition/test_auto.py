@@ -319,10 +319,15 @@ def test_auto_partition_pdf_from_filename(pass_metadata_filename, content_type,
 def test_auto_partition_pdf_uses_table_extraction():
     filename = os.path.join(EXAMPLE_DOCS_DIRECTORY, "layout-parser-paper-fast.pdf")
     with patch(
-        "unstructured_inference.inference.layout.process_file_with_model",
-    ) as mock_process_file_with_model:
+        "unstructured.partition.pdf._get_layout_model_kwargs",
+        return_value={},
+    ), patch(
+        "unstructured.partition.ocr.supplement_page_layout_with_ocr",
+    ), patch(
+        "unstructured_inference.inference.layout.PageLayout.from_image",
+    ) as mock_from_image:
         partition(filename, pdf_infer_table_structure=True, strategy="hi_res")
-        assert mock_process_file_with_model.call_args[1]["extract_tables"]
+        assert mock_from_image.call_args[1]["extract_tables"]
 
 
 def test_auto_partition_pdf_with_fast_strategy(monkeypatch):
@@ -377,10 +382,10 @@ def test_auto_partition_pdf_from_file(pass_metadata_filename, content_type, requ
 def test_auto_partition_formats_languages_for_tesseract():
     filename = "example-docs/chi_sim_image.jpeg"
     with patch(
-        "unstructured.partition.ocr.process_file_with_ocr",
-    ) as mock_process_file_with_ocr:
+        "unstructured.partition.ocr.supplement_page_layout_with_ocr",
+    ) as mock_supplement_page_layout_with_ocr:
         partition(filename, strategy="hi_res", languages=["zh"])
-        _, kwargs = mock_process_file_with_ocr.call_args_list[0]
+        _, kwargs = mock_supplement_page_layout_with_ocr.call_args_list[0]
         assert "ocr_languages" in kwargs
         assert kwargs["ocr_languages"] == "chi_sim+chi_sim_vert+chi_tra+chi_tra_vert"
 
@@ -71,3 +71,17 @@ def test_determine_pdf_or_image_strategy_fallback_hi_res():
         is_image=True,
     )
     assert strategy == "hi_res"
+
+
+def test_determine_pdf_or_image_strategy_hybrid_falls_back_to_hi_res_for_images():
+    strategy = strategies.determine_pdf_or_image_strategy(
+        strategy="hybrid",
+        is_image=True,
+    )
+    assert strategy == "hi_res"
+
+
+def test_determine_pdf_or_image_strategy_hybrid_falls_back_to_fast(monkeypatch):
+    monkeypatch.setattr(strategies, "dependency_exists", lambda dependency: False)
+    strategy = strategies.determine_pdf_or_image_strategy(strategy="hybrid")
+    assert strategy == "fast"
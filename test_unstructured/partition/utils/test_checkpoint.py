@@ -0,0 +1,47 @@
+import os
+
+from unstructured.documents.elements import NarrativeText, PageBreak, Title
+from unstructured.partition.utils.checkpoint import PageCheckpoint, get_page_checkpoint
+
+
+def test_page_checkpoint_saves_and_loads_pages(tmp_path):
+    checkpoint = PageCheckpoint(str(tmp_path), "key")
+    checkpoint.save(1, [Title("Page one"), PageBreak(text="")])
+    checkpoint.save(2, [NarrativeText("This is the second page.")])
+
+    pages = PageCheckpoint(str(tmp_path), "key").load()
+
+    assert sorted(pages) == [1, 2]
+    assert [type(element) for element in pages[1]] == [Title, PageBreak]
+    assert pages[2][0].text == "This is the second page."
+
+
+def test_page_checkpoint_clear(tmp_path):
+    checkpoint = PageCheckpoint(str(tmp_path), "key")
+    checkpoint.save(1, [Title("Page one")])
+
+    checkpoint.clear()
+
+    assert not os.path.exists(checkpoint.path)
+
+
+def test_page_checkpoint_key_depends_on_document_and_config():
+    key = PageCheckpoint.make_key(file=b"document", config={"strategy": "hi_res"})
+
+    assert key == PageCheckpoint.make_key(file=b"document", config={"strategy": "hi_res"})
+    assert key != PageCheckpoint.make_key(file=b"other document", config={"strategy": "hi_res"})
+    assert key != PageCheckpoint.make_key(file=b"document", config={"strategy": "ocr_only"})
+
+
+def test_get_page_checkpoint_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("UNSTRUCTURED_PAGE_CHECKPOINT_DIR", raising=False)
+
+    assert get_page_checkpoint(None, file=b"document") is None
+
+
+def test_get_page_checkpoint_with_env_var(monkeypatch, tmp_path):
+    monkeypatch.setenv("UNSTRUCTURED_PAGE_CHECKPOINT_DIR", str(tmp_path))
+
+    checkpoint = get_page_checkpoint(None, file=b"document")
+
+    assert os.path.dirname(checkpoint.path) == str(tmp_path)
@@ -0,0 +1,97 @@
+import os
+
+import pytest
+import unstructured_pytesseract
+from PIL import Image
+from unstructured_inference.inference.elements import TextRegion
+
+from unstructured.partition import ocr
+from unstructured.partition.utils.ocr_cache import (
+    OCRCache,
+    get_ocr_cache,
+    text_regions_from_json,
+    text_regions_to_json,
+)
+
+
+def test_ocr_cache_round_trip(tmp_path):
+    cache = OCRCache(str(tmp_path))
+    key = cache.make_key(Image.new("RGB", (10, 10)), "eng", "tesseract", "text")
+
+    assert cache.get(key) is None
+    cache.set(key, "Hello World")
+    assert cache.get(key) == "Hello World"
+    assert OCRCache(str(tmp_path)).get(key) == "Hello World"
+
+
+@pytest.mark.parametrize(
+    ("image", "ocr_languages", "entire_page_ocr", "output"),
+    [
+        (Image.new("RGB", (10, 10), color=(0, 0, 1)), "eng", "tesseract", "text"),
+        (Image.new("RGB", (10, 11)), "eng", "tesseract", "text"),
+        (Image.new("RGB", (10, 10)), "eng+kor", "tesseract", "text"),
+        (Image.new("RGB", (10, 10)), "eng", "paddle", "text"),
+        (Image.new("RGB", (10, 10)), "eng", "tesseract", "layout"),
+    ],
+)
+def test_ocr_cache_key_changes_with_inputs(image, ocr_languages, entire_page_ocr, output):
+    key = OCRCache.make_key(Image.new("RGB", (10, 10)), "eng", "tesseract", "text")
+    assert OCRCache.make_key(image, ocr_languages, entire_page_ocr, output) != key
+
+
+def test_ocr_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = OCRCache(str(tmp_path), max_size_bytes=30)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.set(key, "0123456")
+        os.utime(cache._path(key), (i, i))
+    # Reading "a" makes it the most recently used entry
+    assert cache.get("a") is not None
+
+    cache.set("d", "0123456")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ["a", "c", "d"]] == [True, True, True]
+
+
+def test_ocr_cache_counts_overwritten_entries_once(tmp_path):
+    cache = OCRCache(str(tmp_path), max_size_bytes=1000)
+    for _ in range(5):
+        cache.set("a", "0123456")
+
+    assert cache._size_bytes == os.path.getsize(cache._path("a"))
+
+
+def test_get_ocr_cache_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("UNSTRUCTURED_OCR_CACHE_DIR", raising=False)
+    assert get_ocr_cache() is None
+
+
+def test_text_regions_json_round_trip():
+    text_regions = [TextRegion(1, 2, 3.5, 4, "Hello", source="OCR-tesseract")]
+    assert text_regions_from_json(text_regions_to_json(text_regions)) == text_regions
+
+
+def test_get_ocr_layout_from_image_uses_cache(monkeypatch, tmp_path):
+    monkeypatch.setenv("UNSTRUCTURED_OCR_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def mock_image_to_data(*args, **kwargs):
+        calls.append(args)
+        return {
+            "level": ["word"],
+            "left": [10],
+            "top": [5],
+            "width": [15],
+            "height": [10],
+            "text": ["Hello"],
+        }
+
+    monkeypatch.setattr(unstructured_pytesseract, "image_to_data", mock_image_to_data)
+    image = Image.new("RGB", (100, 100))
+
+    ocr_layout = ocr.get_ocr_layout_from_image(image)
+    cached_ocr_layout = ocr.get_ocr_layout_from_image(image.copy())
+    ocr.get_ocr_layout_from_image(image, ocr_languages="kor")
+
+    assert cached_ocr_layout == ocr_layout
+    assert len(calls) == 2
@@ -0,0 +1,97 @@
+from unittest import mock
+
+import pytest
+from PIL import Image
+
+from unstructured.partition.utils import rendered_pages
+from unstructured.partition.utils.rendered_pages import RenderedPDFPages
+
+
+class MockRenderer:
+    def __init__(self, page_count):
+        self.page_count = page_count
+        self.calls = []
+
+    def open_document(self, source):
+        document = mock.MagicMock()
+        document.__len__.return_value = self.page_count
+        return document
+
+    def render_page(self, document, page_number, dpi):
+        self.calls.append((page_number, dpi))
+        # Each page gets a distinct color so reloaded pages can be told apart
+        return Image.new("RGB", (10, 10), color=(page_number, dpi % 256, 0))
+
+
+@pytest.fixture()
+def renderer(monkeypatch):
+    mock_renderer = MockRenderer(page_count=5)
+    monkeypatch.setattr(rendered_pages, "_open_pdfium_document", mock_renderer.open_document)
+    monkeypatch.setattr(rendered_pages, "_render_pdfium_page", mock_renderer.render_page)
+    return mock_renderer
+
+
+def test_rendered_pdf_pages_renders_each_page_once(renderer):
+    with RenderedPDFPages(filename="fake.pdf", chunk_size=2) as pages:
+        first_pass = list(pages.iter_pages(dpi=200))
+        second_pass = list(pages.iter_pages(dpi=200))
+
+    assert [image.getpixel((0, 0))[0] for image in first_pass] == [1, 2, 3, 4, 5]
+    assert second_pass == first_pass
+    assert renderer.calls == [(page_number, 200) for page_number in range(1, 6)]
+
+
+def test_rendered_pdf_pages_keys_pages_by_dpi(renderer):
+    with RenderedPDFPages(filename="fake.pdf", chunk_size=1) as pages:
+        pages.get_page(1, dpi=200)
+        pages.get_page(1, dpi=300)
+        pages.get_page(1, dpi=200)
+
+    assert renderer.calls == [(1, 200), (1, 300)]
+
+
+def test_rendered_pdf_pages_spills_to_disk(renderer):
+    # Room for two 10x10 RGB pages in memory
+    with RenderedPDFPages(filename="fake.pdf", max_memory_bytes=600, chunk_size=5) as pages:
+        first_pass = [image.copy() for image in pages.iter_pages()]
+        assert len(pages._memory) == 2
+        assert pages._memory_bytes <= 600
+        assert len(pages._spilled) >= 3
+
+        second_pass = list(pages.iter_pages())
+        spill_dir = pages._spill_dir.name
+
+    assert [image.tobytes() for image in second_pass] == [image.tobytes() for image in first_pass]
+    assert renderer.calls == [(page_number, 200) for page_number in range(1, 6)]
+    assert not rendered_pages.os.path.exists(spill_dir)
+
+
+def test_rendered_pdf_pages_releases_pages(renderer):
+    with RenderedPDFPages(filename="fake.pdf", max_memory_bytes=300, chunk_size=2) as pages:
+        pages.get_page(1)
+        assert list(pages._spilled) == [("fake.pdf", 2, 200)]
+        spilled_path = pages._spilled[("fake.pdf", 2, 200)]
+
+        pages.release_page(1)
+        pages.release_page(2)
+
+        assert pages._memory == {}
+        assert pages._memory_bytes == 0
+        assert pages._spilled == {}
+        assert not rendered_pages.os.path.exists(spilled_path)
+
+
+def test_rendered_pdf_pages_renders_files_and_bytes_alike():
+    filename = "example-docs/layout-parser-paper-with-empty-pages.pdf"
+    with open(filename, "rb") as f:
+        pdf_bytes = f.read()
+
+    with RenderedPDFPages(filename=filename, chunk_size=2) as pages:
+        file_images = list(pages.iter_pages(dpi=100))
+    with RenderedPDFPages(file=pdf_bytes, chunk_size=2) as pages:
+        bytes_images = list(pages.iter_pages(dpi=100))
+
+    assert len(file_images) == 4
+    assert all(image.mode == "RGB" for image in file_images)
+    assert file_images[0].size == (850, 1100)
+    assert [image.tobytes() for image in bytes_images] == [image.tobytes() for image in file_images]
@@ -0,0 +1,83 @@
+import contextlib
+
+import pypdfium2
+import pytest
+from PIL import Image
+
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import CoordinatesMetadata, ElementMetadata, Text
+from unstructured.partition.utils.resolution import (
+    downscale_image,
+    get_page_dpi,
+    get_page_pixels,
+    get_pdf_page_sizes,
+    rescale_element_coordinates,
+)
+
+
+@pytest.mark.parametrize(
+    ("width", "height", "dpi", "max_pixels", "expected"),
+    [
+        # A letter page fits at 200 dpi, an A0 page does not
+        (612, 792, 200, 20_000_000, 200),
+        (2384, 3370, 200, 20_000_000, 113),
+        (2384, 3370, 200, None, 200),
+        (2384, 3370, 100, 20_000_000, 100),
+    ],
+)
+def test_get_page_dpi(width, height, dpi, max_pixels, expected):
+    page_dpi = get_page_dpi(width, height, dpi, max_pixels)
+
+    assert page_dpi == expected
+    if max_pixels:
+        assert get_page_pixels(width, height, page_dpi) <= max_pixels
+
+
+def test_get_pdf_page_sizes(tmp_path):
+    filename = str(tmp_path / "sizes.pdf")
+    with contextlib.closing(pypdfium2.PdfDocument.new()) as document:
+        document.new_page(612, 792)
+        document.new_page(2384, 3370)
+        document.save(filename)
+
+    assert get_pdf_page_sizes(filename) == [(612, 792), (2384, 3370)]
+
+
+def test_downscale_image_keeps_small_images():
+    image = Image.new("RGB", (100, 50))
+
+    assert downscale_image(image, max_pixels=5000) == (image, 1.0)
+
+
+def test_downscale_image():
+    image = Image.new("P", (400, 100))
+    image.format = "PNG"
+
+    resized_image, scale = downscale_image(image, max_pixels=10_000)
+
+    assert resized_image.size == (200, 50)
+    assert resized_image.mode == "RGB"
+    assert resized_image.format == "PNG"
+    assert scale == 0.5
+
+
+def test_rescale_element_coordinates():
+    metadata = ElementMetadata(
+        coordinates=CoordinatesMetadata(
+            points=((10, 20), (10, 40), (30, 40), (30, 20)),
+            system=PixelSpace(width=100, height=200),
+        ),
+    )
+    # Both elements share the same metadata, which must only be scaled once
+    elements = [Text("Hello", metadata=metadata), Text("World", metadata=metadata)]
+
+    rescale_element_coordinates(elements, 0.5)
+
+    coordinates = elements[1].metadata.coordinates
+    assert [(round(x), round(y)) for x, y in coordinates.points] == [
+        (20, 40),
+        (20, 80),
+        (60, 80),
+        (60, 40),
+    ]
+    assert (coordinates.system.width, coordinates.system.height) == (200, 400)
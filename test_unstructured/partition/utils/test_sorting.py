@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from unstructured.documents.coordinates import PixelSpace
@@ -6,6 +7,7 @@ from unstructured.partition.utils.constants import SORT_MODE_BASIC, SORT_MODE_XY
 from unstructured.partition.utils.sorting import (
     coord_has_valid_points,
     coordinates_to_bbox,
+    coordinates_to_bboxes,
     shrink_bbox,
     sort_page_elements,
 )
@@ -125,3 +127,57 @@ def test_shrink_bbox():
     shrink_factor = 0.9
     expected_result = (20, 20, 290, 110)
     assert shrink_bbox(bbox, shrink_factor) == expected_result
+
+
+def test_coordinates_to_bboxes():
+    coordinates_list = [
+        MockCoordinatesMetadata([(0, 0), (0, 100), (200, 100), (200, 0)]),
+        MockCoordinatesMetadata([(20.7, 20.2), (20.7, 120.9), (320.5, 120.9), (320.5, 20.2)]),
+    ]
+    expected_result = [
+        shrink_bbox(coordinates_to_bbox(coordinates), 0.9) for coordinates in coordinates_list
+    ]
+    assert coordinates_to_bboxes(coordinates_list, 0.9).tolist() == [
+        list(bbox) for bbox in expected_result
+    ]
+
+
+def test_sort_xycut_keeps_elements_in_gaps():
+    elements = []
+    # The empty box at y=50 starts in the gap between the other two
+    for idx, (top, bottom) in enumerate([(0, 40), (50, 50), (60, 100)]):
+        elem = Text(str(idx))
+        elem.metadata.coordinates = CoordinatesMetadata(
+            [(0, top), (0, bottom), (100, bottom), (100, top)],
+            PixelSpace,
+        )
+        elements.append(elem)
+
+    sorted_page_elements = sort_page_elements(elements, sort_mode=SORT_MODE_XY_CUT)
+    assert [elem.text for elem in sorted_page_elements] == ["0", "2", "1"]
+
+
+def test_sort_xycut_many_elements():
+    elements = []
+    # A table of 100 rows by 40 columns, as pdfminer returns tables of text runs
+    for row in range(100):
+        for col in range(40):
+            elem = Text(f"{row}-{col}")
+            elem.metadata.coordinates = CoordinatesMetadata(
+                [
+                    (col * 30, row * 12),
+                    (col * 30, row * 12 + 10),
+                    (col * 30 + 25, row * 12 + 10),
+                    (col * 30 + 25, row * 12),
+                ],
+                PixelSpace,
+            )
+            elements.append(elem)
+
+    sorted_page_elements = sort_page_elements(elements, sort_mode=SORT_MODE_XY_CUT)
+    assert len(sorted_page_elements) == len(elements)
+    assert [elem.text for elem in sorted_page_elements[:2]] == ["0-0", "1-0"]
+    assert np.array_equal(
+        sorted(elem.text for elem in sorted_page_elements),
+        sorted(elem.text for elem in elements),
+    )
@@ -5,7 +5,9 @@ from unstructured.partition.utils.xycut import (
     projection_by_bboxes,
     recursive_xy_cut,
     recursive_xy_cut_swapped,
+    split_boxes_by_projection,
     split_projection_profile,
+    xy_cut,
 )
 
 
@@ -58,3 +60,62 @@ def test_recursive_xy_cut(recursive_func, expected):
     res = []
     recursive_func(boxes, indices, res)
     assert res == expected
+
+
+def test_split_boxes_by_projection_matches_split_projection_profile():
+    boxes = np.array(
+        [[2, 0, 4, 0], [3, 0, 3, 0], [6, 0, 7, 0], [7, 0, 9, 0], [10, 0, 13, 0], [11, 0, 12, 0]],
+    )
+    expected_result = split_projection_profile(projection_by_bboxes(boxes, 0), 0, 1)
+    result = split_boxes_by_projection(boxes[:, 0], boxes[:, 2])
+    assert np.array_equal(result, expected_result)
+    assert np.array_equal(result, (np.array([2, 6, 10]), np.array([4, 9, 13])))
+
+
+def test_split_boxes_by_projection_with_empty_boxes():
+    assert split_boxes_by_projection(np.array([1, 5]), np.array([1, 5])) is None
+
+
+@pytest.mark.parametrize(
+    ("primary_axis", "recursive_func"),
+    [(1, recursive_xy_cut), (0, recursive_xy_cut_swapped)],
+)
+def test_xy_cut_matches_recursive_xy_cut(primary_axis, recursive_func):
+    boxes = np.array(
+        [
+            [0, 0, 100, 10],
+            [0, 20, 45, 30],
+            [55, 20, 100, 30],
+            [0, 35, 45, 45],
+            [55, 35, 100, 45],
+            [0, 60, 100, 70],
+        ],
+    )
+    res = []
+    recursive_func(boxes, np.arange(len(boxes)), res)
+    assert xy_cut(boxes, np.arange(len(boxes)), primary_axis=primary_axis) == res
+    assert sorted(res) == list(range(len(boxes)))
+
+
+def test_xy_cut_deeply_nested_layout():
+    # Each level is a vertical bar on the left of the remaining area and a horizontal bar on top of
+    # what is right of it, so every level takes one more nested cut. The recursive implementation
+    # hit the recursion limit on this layout.
+    levels = 1200
+    size = 2 * levels + 2
+    boxes = []
+    for level in range(levels):
+        offset = 2 * level
+        boxes.append([offset, offset, offset + 1, size])
+        boxes.append([offset + 2, offset, size, offset + 1])
+    boxes = np.array(boxes)
+
+    res = xy_cut(boxes, np.arange(len(boxes)))
+
+    assert res == list(range(len(boxes)))
+
+
+def test_xy_cut_max_depth():
+    boxes = np.array([[0, 0, 10, 10], [20, 5, 30, 15], [0, 20, 10, 30]])
+    assert xy_cut(boxes, np.arange(3), primary_axis=0, max_depth=0) == [0, 2, 1]
+    assert xy_cut(boxes, np.arange(3), primary_axis=1, max_depth=0) == [0, 1, 2]
@@ -82,3 +82,24 @@ def test_requires_dependencies_decorator_in_class():
             import numpy  # noqa: F401
 
     TestClass()
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_thread_map_yields_results_in_order(max_workers):
+    assert list(utils.thread_map(lambda x: x * 2, range(10), max_workers=max_workers)) == [
+        x * 2 for x in range(10)
+    ]
+
+
+def test_thread_map_takes_items_as_results_are_consumed():
+    taken = []
+
+    def items():
+        for i in range(100):
+            taken.append(i)
+            yield i
+
+    results = utils.thread_map(lambda x: x, items(), max_workers=2)
+
+    assert next(results) == 0
+    assert len(taken) <= 4
@@ -0,0 +1,105 @@
+import contextlib
+import json
+import os
+import pathlib
+
+import pytest
+
+from unstructured.ingest.connector.local import LocalIngestDoc, SimpleLocalConfig
+from unstructured.ingest.interfaces import PartitionConfig, ProcessorConfig, ReadConfig
+from unstructured.ingest.pipeline.interfaces import PipelineContext
+from unstructured.ingest.pipeline.partition import Partitioner
+from unstructured.ingest.pipeline.state import PipelineState
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "../..", "example-docs")
+
+
+def make_pdf(filename: str, text_pages: int, blank_pages: int) -> str:
+    """Saves a PDF with the first `text_pages` pages of a real document followed by blank pages."""
+    import pypdfium2
+
+    with contextlib.closing(
+        pypdfium2.PdfDocument(os.path.join(EXAMPLE_DOCS_DIRECTORY, "multi-column.pdf")),
+    ) as source, contextlib.closing(pypdfium2.PdfDocument.new()) as document:
+        if text_pages:
+            document.import_pages(source, list(range(text_pages)))
+        for _ in range(blank_pages):
+            document.new_page(612, 792)
+        document.save(filename)
+    return filename
+
+
+def get_partitioner(tmp_path, name: str, **partition_config_kwargs) -> Partitioner:
+    work_dir = tmp_path / name
+    pipeline_context = PipelineContext(work_dir=str(work_dir), num_processes=1)
+    work_dir.mkdir()
+    pipeline_context.state = PipelineState(work_dir / "pipeline-state.sqlite3")
+    return Partitioner(
+        pipeline_context=pipeline_context,
+        partition_config=PartitionConfig(**partition_config_kwargs),
+    )
+
+
+def get_doc_json(pdf_path: str) -> str:
+    return LocalIngestDoc(
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        connector_config=SimpleLocalConfig(input_path=pdf_path),
+        path=pdf_path,
+    ).to_json()
+
+
+def load_elements(json_path: str):
+    with open(json_path) as f:
+        elements = json.load(f)
+    for element in elements:
+        element["metadata"]["data_source"].pop("date_processed")
+    return elements
+
+
+def test_partitioner_sharded_output_matches_unsharded_output(monkeypatch, tmp_path):
+    import unstructured_pytesseract
+
+    monkeypatch.setattr(
+        unstructured_pytesseract,
+        "run_and_get_multiple_output",
+        lambda image, extensions, lang: ("Hi", "H 10 10 20 20 0\ni 20 10 30 20 0"),
+    )
+    doc_json = get_doc_json(make_pdf(str(tmp_path / "scanned.pdf"), 0, 5))
+    partitioner = get_partitioner(tmp_path, "unsharded", strategy="ocr_only")
+    sharded_partitioner = get_partitioner(
+        tmp_path,
+        "sharded",
+        strategy="ocr_only",
+        pdf_shard_pages=2,
+    )
+
+    [json_path] = partitioner(iterable=[doc_json])
+    [sharded_json_path] = sharded_partitioner(iterable=[doc_json])
+
+    elements = load_elements(json_path)
+    assert sorted({element["metadata"]["page_number"] for element in elements}) == [1, 2, 3, 4, 5]
+    assert load_elements(sharded_json_path) == elements
+    assert not list(sharded_partitioner.get_shards_path().iterdir())
+
+
+@pytest.mark.parametrize(
+    ("strategy", "text_pages", "expected"),
+    [
+        ("ocr_only", 0, [(1, 2, "ocr_only"), (3, 4, "ocr_only"), (5, 5, "ocr_only")]),
+        ("auto", 0, [(1, 2, "ocr_only"), (3, 4, "ocr_only"), (5, 5, "ocr_only")]),
+        # The blank pages of a PDF with text are not split apart and OCR'd
+        ("auto", 1, [(None, None, None)]),
+        ("fast", 0, [(None, None, None)]),
+    ],
+)
+def test_partitioner_get_work_units(tmp_path, strategy, text_pages, expected):
+    doc_json = get_doc_json(make_pdf(str(tmp_path / "doc.pdf"), text_pages, 5 - text_pages))
+    partitioner = get_partitioner(tmp_path, "sharded", strategy=strategy, pdf_shard_pages=2)
+    partitioner.initialize()
+
+    work_units = partitioner.get_work_units(doc_json)
+
+    assert [work_unit[0] for work_unit in work_units] == [doc_json] * len(expected)
+    assert [work_unit[1:] for work_unit in work_units] == expected
@@ -0,0 +1,227 @@
+import json
+import shutil
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+from unstructured.ingest.connector import registry
+from unstructured.ingest.interfaces import (
+    BaseConnectorConfig,
+    BaseDestinationConnector,
+    BaseIngestDoc,
+    BaseSourceConnector,
+    PartitionConfig,
+    ProcessorConfig,
+    ReadConfig,
+    SourceMetadata,
+    WriteConfig,
+)
+from unstructured.ingest.pipeline.doc_factory import DocFactory
+from unstructured.ingest.pipeline.interfaces import PipelineContext
+from unstructured.ingest.pipeline.partition import Partitioner
+from unstructured.ingest.pipeline.pipeline import Pipeline
+from unstructured.ingest.pipeline.source import Reader
+from unstructured.ingest.pipeline.state import PipelineState
+from unstructured.ingest.pipeline.write import Writer
+
+DOWNLOADED: t.List[str] = []
+
+
+@dataclass
+class TestSourceConfig(BaseConnectorConfig):
+    input_path: str
+    access_token: t.Optional[str] = None
+
+
+@dataclass
+class TestVersionedIngestDoc(BaseIngestDoc):
+    connector_config: TestSourceConfig
+    path: str
+    doc_version: str = "1"
+    registry_name: str = "test-versioned"
+
+    @property
+    def filename(self):
+        return Path(self.read_config.download_dir) / Path(self.path).name
+
+    @property
+    def _output_filename(self):
+        return Path(self.processor_config.output_dir) / f"{Path(self.path).name}.json"
+
+    @property
+    def record_locator(self) -> t.Optional[t.Dict[str, t.Any]]:
+        return {"path": Path(self.path).name}
+
+    def update_source_metadata(self, **kwargs) -> None:
+        self.source_metadata = SourceMetadata(version=self.doc_version)
+
+    def cleanup_file(self):
+        pass
+
+    def get_file(self):
+        DOWNLOADED.append(Path(self.path).name)
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(self.path, self.filename)
+
+
+@dataclass
+class TestSourceConnector(BaseSourceConnector):
+    connector_config: TestSourceConfig
+    versions: t.Dict[str, str] = field(default_factory=dict)
+
+    def cleanup(self, cur_dir=None):
+        pass
+
+    def initialize(self):
+        pass
+
+    def get_ingest_docs(self):
+        return [
+            TestVersionedIngestDoc(
+                processor_config=self.processor_config,
+                read_config=self.read_config,
+                connector_config=self.connector_config,
+                path=str(Path(self.connector_config.input_path) / name),
+                doc_version=version,
+            )
+            for name, version in self.versions.items()
+        ]
+
+
+@dataclass
+class TestDestinationConnector(BaseDestinationConnector):
+    write_config: WriteConfig
+    connector_config: TestSourceConfig
+
+    def initialize(self):
+        pass
+
+    def write(self, docs: t.List[BaseIngestDoc]) -> None:
+        pass
+
+
+@pytest.fixture()
+def versioned_docs(monkeypatch):
+    monkeypatch.setitem(registry.INGEST_DOC_NAME_TO_CLASS, "test-versioned", TestVersionedIngestDoc)
+    DOWNLOADED.clear()
+
+
+def get_pipeline(
+    tmp_path,
+    versions: t.Dict[str, str],
+    input_path: t.Optional[str] = None,
+    access_token: t.Optional[str] = None,
+    destination_token: t.Optional[str] = None,
+    partition_api_key: t.Optional[str] = None,
+) -> Pipeline:
+    input_dir = tmp_path / "input"
+    input_dir.mkdir(exist_ok=True)
+    for name, version in versions.items():
+        (input_dir / name).write_text(f"The text of {name}, version {version}.")
+    processor_config = ProcessorConfig(
+        output_dir=str(tmp_path / "output"),
+        num_processes=1,
+        work_dir=str(tmp_path / "work"),
+    )
+    pipeline_context = PipelineContext.from_dict(
+        {**processor_config.to_dict(), "incremental": True},
+    )
+    source_doc_connector = TestSourceConnector(
+        processor_config=processor_config,
+        read_config=ReadConfig(download_dir=str(tmp_path / "download")),
+        connector_config=TestSourceConfig(
+            input_path=input_path or str(input_dir),
+            access_token=access_token,
+        ),
+        versions=versions,
+    )
+    return Pipeline(
+        pipeline_context=pipeline_context,
+        doc_factory_node=DocFactory(
+            pipeline_context=pipeline_context,
+            source_doc_connector=source_doc_connector,
+        ),
+        source_node=Reader(pipeline_context=pipeline_context),
+        partition_node=Partitioner(
+            pipeline_context=pipeline_context,
+            partition_config=PartitionConfig(strategy="fast", api_key=partition_api_key),
+        ),
+        write_node=Writer(
+            pipeline_context=pipeline_context,
+            dest_doc_connector=TestDestinationConnector(
+                write_config=WriteConfig(),
+                connector_config=TestSourceConfig(
+                    input_path="destination",
+                    access_token=destination_token,
+                ),
+            ),
+        ),
+    )
+
+
+def run_pipeline(tmp_path, versions: t.Dict[str, str]) -> t.Dict[str, t.Any]:
+    pipeline = get_pipeline(tmp_path, versions)
+    pipeline.run()
+    with open(tmp_path / "work" / "incremental-report.json") as report_f:
+        return json.load(report_f)
+
+
+def test_incremental_run_skips_unchanged_docs(tmp_path, versioned_docs):
+    report = run_pipeline(tmp_path, {"a.txt": "1", "b.txt": "1", "c.txt": "1"})
+    assert report["new"] == [{"path": "a.txt"}, {"path": "b.txt"}, {"path": "c.txt"}]
+    assert sorted(DOWNLOADED) == ["a.txt", "b.txt", "c.txt"]
+
+    DOWNLOADED.clear()
+    report = run_pipeline(tmp_path, {"a.txt": "1", "b.txt": "2", "d.txt": "1"})
+
+    assert report == {
+        "unchanged": [{"path": "a.txt"}],
+        "changed": [{"path": "b.txt"}],
+        "new": [{"path": "d.txt"}],
+        "deleted": [{"path": "c.txt"}],
+        "unversioned": 0,
+    }
+    # The previous download and outputs of a changed doc are not reused
+    assert sorted(DOWNLOADED) == ["b.txt", "d.txt"]
+    with open(tmp_path / "output" / "b.txt.json") as output_f:
+        assert "version 2" in json.load(output_f)[0]["text"]
+
+
+def test_incremental_run_updates_the_manifest(tmp_path, versioned_docs):
+    run_pipeline(tmp_path, {"a.txt": "1", "b.txt": "1"})
+    run_pipeline(tmp_path, {"b.txt": "2"})
+
+    source = get_pipeline(tmp_path, {}).get_manifest_source()
+    state = PipelineState(tmp_path / "work" / "pipeline-state.sqlite3")
+    assert state.get_manifest(source) == {json.dumps({"path": "b.txt"}): ("2", None)}
+    state.close()
+
+
+def test_incremental_run_reprocesses_docs_with_no_output(tmp_path, versioned_docs):
+    run_pipeline(tmp_path, {"a.txt": "1", "b.txt": "1"})
+    (tmp_path / "output" / "a.txt.json").unlink()
+
+    report = run_pipeline(tmp_path, {"a.txt": "1", "b.txt": "1"})
+
+    assert report["unchanged"] == [{"path": "b.txt"}]
+    assert report["changed"] == [{"path": "a.txt"}]
+    assert (tmp_path / "output" / "a.txt.json").is_file()
+
+
+def test_manifest_source_leaves_out_credentials(tmp_path):
+    def get_manifest_source(**kwargs) -> str:
+        return get_pipeline(tmp_path, {}, **kwargs).get_manifest_source()
+
+    source = get_manifest_source(
+        access_token="first-token",
+        destination_token="first-token",
+        partition_api_key="first-key",
+    )
+
+    assert get_manifest_source() == source
+    assert get_manifest_source(access_token="second-token") == source
+    assert get_manifest_source(destination_token="second-token") == source
+    assert get_manifest_source(partition_api_key="second-key") == source
+    assert get_manifest_source(input_path="other-path") != source
@@ -0,0 +1,143 @@
+import logging
+import multiprocessing as mp
+import pickle
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+
+import pytest
+
+from unstructured.ingest.interfaces import PartitionConfig
+from unstructured.ingest.pipeline import initialize
+from unstructured.ingest.pipeline.initialize import initialize_worker, warm_up
+from unstructured.ingest.pipeline.interfaces import (
+    PROCESS_EXECUTOR,
+    THREAD_EXECUTOR,
+    PipelineContext,
+    PipelineNode,
+)
+
+ITEMS = list(range(10))
+
+
+@dataclass
+class StubNode(PipelineNode):
+    workers: int = 1
+    executor_type: str = PROCESS_EXECUTOR
+
+    def run(self, item: int) -> t.Tuple[int, str]:
+        time.sleep(0.01)
+        return item * 2, threading.current_thread().name
+
+    def get_workers(self) -> int:
+        return self.workers
+
+    def get_executor_type(self) -> str:
+        return self.executor_type
+
+
+class FakePool:
+    """Runs the tasks given to the shared worker pool in the calling thread, recording how many
+    run at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+
+    def apply(self, func, args):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            return func(*args)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def fail(*args):
+    raise RuntimeError("could not load the model")
+
+
+def double(item: int) -> int:
+    return item * 2
+
+
+def test_pipeline_node_map_uses_the_shared_pool():
+    pipeline_context = PipelineContext(num_processes=8)
+    pipeline_context.pool = FakePool()
+    node = StubNode(pipeline_context=pipeline_context, workers=3)
+
+    results = node.map(node.run, ITEMS)
+
+    assert [result for result, _ in results] == [item * 2 for item in ITEMS]
+    assert pipeline_context.pool.calls == len(ITEMS)
+    # The pool has more processes than the node is allowed to use
+    assert pipeline_context.pool.max_running <= 3
+
+
+def test_pipeline_node_map_with_the_thread_executor():
+    pipeline_context = PipelineContext(num_processes=8)
+    pipeline_context.pool = FakePool()
+    node = StubNode(pipeline_context=pipeline_context, workers=3, executor_type=THREAD_EXECUTOR)
+
+    results = node.map(node.run, ITEMS)
+
+    assert [result for result, _ in results] == [item * 2 for item in ITEMS]
+    assert threading.current_thread().name not in {thread for _, thread in results}
+    assert pipeline_context.pool.calls == 0
+
+
+@pytest.mark.parametrize("executor_type", [THREAD_EXECUTOR, PROCESS_EXECUTOR])
+def test_pipeline_node_map_with_one_worker_runs_in_the_main_thread(monkeypatch, executor_type):
+    monkeypatch.setattr(mp, "Pool", pytest.fail)
+    pipeline_context = PipelineContext(num_processes=8)
+    pipeline_context.pool = FakePool()
+    node = StubNode(pipeline_context=pipeline_context, workers=1, executor_type=executor_type)
+
+    results = node.map(node.run, ITEMS)
+
+    assert results == [(item * 2, threading.current_thread().name) for item in ITEMS]
+    assert pipeline_context.pool.calls == 0
+
+
+def test_pipeline_context_is_pickled_without_the_pool():
+    pipeline_context = PipelineContext(num_processes=3, work_dir="/tmp/work")
+    pipeline_context.pool = threading.Lock()
+
+    unpickled = pickle.loads(pickle.dumps(pipeline_context))
+
+    assert unpickled.pool is None
+    assert unpickled.num_processes == 3
+    assert unpickled.work_dir == "/tmp/work"
+    assert pipeline_context.pool is not None
+
+
+def test_initialize_worker_logs_a_failing_initializer(caplog):
+    with caplog.at_level(logging.INFO, logger="unstructured.ingest"):
+        initialize_worker(logging.INFO, fail, ("hi_res",))
+
+    assert "Worker initializer failed" in caplog.text
+    assert "could not load the model" in caplog.text
+
+
+def test_worker_pool_with_a_failing_initializer_runs_tasks():
+    with mp.Pool(
+        processes=2,
+        initializer=initialize_worker,
+        initargs=(logging.INFO, fail, ()),
+    ) as pool:
+        assert pool.apply_async(double, (2,)).get(timeout=30) == 4
+
+
+def test_warm_up_logs_failures(monkeypatch, caplog):
+    monkeypatch.setattr(initialize, "initialize", fail)
+
+    with caplog.at_level(logging.WARNING, logger="unstructured.ingest"):
+        warm_up(PartitionConfig(strategy="hi_res"))
+
+    assert "Could not warm up worker process: could not load the model" in caplog.text
@@ -0,0 +1,240 @@
+import multiprocessing as mp
+import os
+import pathlib
+import pickle
+import threading
+import typing as t
+from dataclasses import dataclass, field
+
+import pytest
+
+from unstructured.ingest.connector.local import (
+    LocalIngestDoc,
+    LocalSourceConnector,
+    SimpleLocalConfig,
+)
+from unstructured.ingest.interfaces import (
+    BaseConnectorConfig,
+    BaseDestinationConnector,
+    BaseIngestDoc,
+    PartitionConfig,
+    ProcessorConfig,
+    ReadConfig,
+    WriteConfig,
+)
+from unstructured.ingest.pipeline.doc_factory import DocFactory
+from unstructured.ingest.pipeline.interfaces import PipelineContext
+from unstructured.ingest.pipeline.partition import Partitioner
+from unstructured.ingest.pipeline.pipeline import Pipeline
+from unstructured.ingest.pipeline.source import Reader
+from unstructured.ingest.pipeline.state import PARTITION_STAGE, PipelineState
+from unstructured.ingest.pipeline.write import Writer
+
+DIRECTORY = pathlib.Path(__file__).parent.resolve()
+EXAMPLE_DOCS_DIRECTORY = os.path.join(DIRECTORY, "../..", "example-docs")
+TEST_FILE_PATH = os.path.join(EXAMPLE_DOCS_DIRECTORY, "book-war-and-peace-1p.txt")
+DOC_JSON = LocalIngestDoc(
+    processor_config=ProcessorConfig(),
+    read_config=ReadConfig(),
+    connector_config=SimpleLocalConfig(input_path=TEST_FILE_PATH),
+    path=TEST_FILE_PATH,
+).to_json()
+
+
+@dataclass
+class TestDestinationConfig(BaseConnectorConfig):
+    name: str
+    api_key: t.Optional[str] = None
+
+
+@dataclass
+class TestDestinationConnector(BaseDestinationConnector):
+    write_config: WriteConfig
+    connector_config: TestDestinationConfig
+    written: t.List[str] = field(default_factory=list)
+
+    def initialize(self):
+        pass
+
+    def write(self, docs: t.List[BaseIngestDoc]) -> None:
+        self.written.extend(str(doc.filename) for doc in docs)
+
+
+@pytest.fixture()
+def state(tmp_path):
+    state = PipelineState(tmp_path / "pipeline-state.sqlite3")
+    yield state
+    state.close()
+
+
+def get_pipeline_context(tmp_path, state: PipelineState, **kwargs) -> PipelineContext:
+    pipeline_context = PipelineContext(work_dir=str(tmp_path), num_processes=1, **kwargs)
+    pipeline_context.state = state
+    return pipeline_context
+
+
+def get_destination(name: str, api_key: t.Optional[str] = None) -> TestDestinationConnector:
+    return TestDestinationConnector(
+        write_config=WriteConfig(),
+        connector_config=TestDestinationConfig(name=name, api_key=api_key),
+    )
+
+
+def set_doc_in_worker(state: PipelineState):
+    state["worker"] = DOC_JSON
+    state.set_stage_output(DOC_JSON, PARTITION_STAGE, "worker-output")
+    state.close()
+
+
+def test_pipeline_state_opens_a_connection_per_thread(state):
+    connections = []
+    thread = threading.Thread(target=lambda: connections.append(state.connection))
+    thread.start()
+    thread.join()
+
+    assert state.connection is state.connection
+    assert connections[0] is not state.connection
+
+
+def test_pipeline_state_is_shared_with_worker_processes(state):
+    state["main"] = DOC_JSON
+
+    process = mp.get_context("spawn").Process(target=set_doc_in_worker, args=(state,))
+    process.start()
+    process.join(timeout=60)
+
+    assert process.exitcode == 0
+    assert state["worker"] == DOC_JSON
+    assert state.get_stage_output(DOC_JSON, PARTITION_STAGE) == "worker-output"
+
+
+def test_pipeline_state_is_pickled_with_its_path_only(state):
+    state["doc"] = DOC_JSON
+    state.connection
+
+    assert state.__getstate__() == {"path": state.path}
+    unpickled = pickle.loads(pickle.dumps(state))
+    assert unpickled["doc"] == DOC_JSON
+    assert "missing" not in unpickled
+    with pytest.raises(KeyError):
+        unpickled["missing"]
+
+
+def test_partitioner_resumes_from_the_state_of_a_crashed_run(tmp_path, monkeypatch):
+    state_path = tmp_path / "pipeline-state.sqlite3"
+    state = PipelineState(state_path)
+    partitioner = Partitioner(
+        pipeline_context=get_pipeline_context(tmp_path, state),
+        partition_config=PartitionConfig(strategy="fast"),
+    )
+    assert not partitioner.is_done(DOC_JSON)
+    [json_path] = partitioner(iterable=[DOC_JSON])
+    state.close()
+
+    # A new run reads the state left on disk by the previous one
+    state = PipelineState(state_path)
+    partitioner = Partitioner(
+        pipeline_context=get_pipeline_context(tmp_path, state),
+        partition_config=PartitionConfig(strategy="fast"),
+    )
+    monkeypatch.setattr(Partitioner, "partition", pytest.fail)
+    assert partitioner.is_done(DOC_JSON)
+    assert partitioner(iterable=[DOC_JSON]) == [json_path]
+    assert state[pathlib.Path(json_path).stem] == DOC_JSON
+
+    other_config = Partitioner(
+        pipeline_context=get_pipeline_context(tmp_path, state),
+        partition_config=PartitionConfig(strategy="fast", encoding="utf-8"),
+    )
+    assert not other_config.is_done(DOC_JSON)
+    reprocess = Partitioner(
+        pipeline_context=get_pipeline_context(tmp_path, state, reprocess=True),
+        partition_config=PartitionConfig(strategy="fast"),
+    )
+    assert not reprocess.is_done(DOC_JSON)
+    os.remove(json_path)
+    assert not partitioner.is_done(DOC_JSON)
+    state.close()
+
+
+def test_partitioner_registers_its_output_when_run_only(tmp_path, state):
+    partitioner = Partitioner(
+        pipeline_context=get_pipeline_context(tmp_path, state),
+        partition_config=PartitionConfig(strategy="fast"),
+    )
+    json_path = partitioner.get_json_path(DOC_JSON)
+
+    partitioner.is_done(DOC_JSON)
+    assert json_path.stem not in state
+
+    partitioner.initialize()
+    partitioner.run(DOC_JSON)
+    assert state[json_path.stem] == DOC_JSON
+
+
+def test_writer_skips_docs_already_written_to_the_same_destination(tmp_path, state):
+    json_path = str(tmp_path / "partitioned.json")
+    state["partitioned"] = DOC_JSON
+
+    def write(name: str, **kwargs) -> t.List[str]:
+        destination = get_destination(name)
+        Writer(
+            pipeline_context=get_pipeline_context(tmp_path, state, **kwargs),
+            dest_doc_connector=destination,
+        ).run([json_path])
+        return destination.written
+
+    assert write("first") == [TEST_FILE_PATH]
+    assert write("first") == []
+    assert write("second") == [TEST_FILE_PATH]
+    assert write("first", reprocess=True) == [TEST_FILE_PATH]
+
+
+def test_writer_hash_leaves_out_destination_credentials(tmp_path, state):
+    def create_hash(destination: TestDestinationConnector) -> str:
+        return Writer(
+            pipeline_context=get_pipeline_context(tmp_path, state),
+            dest_doc_connector=destination,
+        ).create_hash()
+
+    writer_hash = create_hash(get_destination("first", api_key="first-key"))
+
+    assert create_hash(get_destination("first", api_key="second-key")) == writer_hash
+    assert create_hash(get_destination("second", api_key="first-key")) != writer_hash
+
+
+def test_pipeline_run_resumes_with_one_process(tmp_path):
+    destination = get_destination("first")
+
+    def run_pipeline():
+        processor_config = ProcessorConfig(
+            output_dir=str(tmp_path / "output"),
+            num_processes=1,
+            work_dir=str(tmp_path / "work"),
+        )
+        pipeline_context = PipelineContext.from_dict(processor_config.to_dict())
+        Pipeline(
+            pipeline_context=pipeline_context,
+            doc_factory_node=DocFactory(
+                pipeline_context=pipeline_context,
+                source_doc_connector=LocalSourceConnector(
+                    processor_config=processor_config,
+                    read_config=ReadConfig(),
+                    connector_config=SimpleLocalConfig(input_path=TEST_FILE_PATH),
+                ),
+            ),
+            source_node=Reader(pipeline_context=pipeline_context),
+            partition_node=Partitioner(
+                pipeline_context=pipeline_context,
+                partition_config=PartitionConfig(strategy="fast"),
+            ),
+            write_node=Writer(pipeline_context=pipeline_context, dest_doc_connector=destination),
+        ).run()
+
+    run_pipeline()
+    assert destination.written == [TEST_FILE_PATH]
+
+    # Every doc is already partitioned, so nothing is left to download
+    run_pipeline()
+    assert destination.written == [TEST_FILE_PATH]
+    assert (tmp_path / "output" / "book-war-and-peace-1p.txt.json").is_file()
@@ -0,0 +1,217 @@
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import pytest
+
+from unstructured.ingest.pipeline import streaming
+from unstructured.ingest.pipeline.interfaces import (
+    PROCESS_EXECUTOR,
+    THREAD_EXECUTOR,
+    PipelineContext,
+    PipelineNode,
+    WriteNode,
+)
+from unstructured.ingest.pipeline.streaming import StreamingRunner
+
+DOCS = [f"doc-{i}" for i in range(8)]
+
+
+@dataclass
+class StubNode(PipelineNode):
+    name: str = "stub"
+    workers: int = 1
+    executor_type: str = THREAD_EXECUTOR
+    delay: float = 0.0
+    fail_on: t.Optional[str] = None
+    calls: t.List[str] = field(default_factory=list)
+
+    def run(self, item: str) -> str:
+        self.calls.append(item)
+        time.sleep(self.delay)
+        if item == self.fail_on:
+            raise ValueError(f"failed on {item}")
+        return f"{item}>{self.name}"
+
+    def get_workers(self) -> int:
+        return self.workers
+
+    def get_executor_type(self) -> str:
+        return self.executor_type
+
+
+@dataclass
+class StubWriteNode(WriteNode):
+    dest_doc_connector: t.Any = None
+    batches: t.List[t.List[str]] = field(default_factory=list)
+
+    def run(self, json_paths: t.List[str]):
+        self.batches.append(json_paths)
+
+
+class FakePool:
+    """Runs the tasks given to the worker pool right away in the main process."""
+
+    def __init__(self, *args, **kwargs):
+        self.calls: t.List[str] = []
+
+    def apply_async(self, func, args, callback, error_callback):
+        try:
+            result = func(*args)
+        except Exception as e:
+            error_callback(e)
+        else:
+            callback(result)
+
+    def terminate(self):
+        self.calls.append("terminate")
+
+    def close(self):
+        self.calls.append("close")
+
+    def join(self):
+        self.calls.append("join")
+
+
+class RecordingThreadPoolExecutor(ThreadPoolExecutor):
+    instances: t.List["RecordingThreadPoolExecutor"] = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.shut_down = False
+        self.instances.append(self)
+
+    def shutdown(self, *args, **kwargs):
+        self.shut_down = True
+        super().shutdown(*args, **kwargs)
+
+
+class RecordingStreamingRunner(StreamingRunner):
+    """Records the most documents seen waiting for each node."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_waiting = [0] * len(self.stages)
+
+    def handle_event(self, *args, **kwargs):
+        super().handle_event(*args, **kwargs)
+        self.max_waiting = [
+            max(waiting, len(stage.ready)) for waiting, stage in zip(self.max_waiting, self.stages)
+        ]
+
+
+def get_pipeline_context(**kwargs) -> PipelineContext:
+    return PipelineContext(num_processes=2, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("workers", "executor_type"),
+    [(1, THREAD_EXECUTOR), (3, THREAD_EXECUTOR), (1, PROCESS_EXECUTOR), (3, PROCESS_EXECUTOR)],
+)
+def test_streaming_runner_writes_each_doc_once(monkeypatch, workers, executor_type):
+    monkeypatch.setattr(streaming.mp, "Pool", FakePool)
+    pipeline_context = get_pipeline_context(stream_queue_size=3)
+    nodes = [
+        StubNode(pipeline_context=pipeline_context, name=name, workers=workers)
+        for name in ["a", "b"]
+    ]
+    nodes.append(
+        StubNode(
+            pipeline_context=pipeline_context,
+            name="c",
+            workers=workers,
+            executor_type=executor_type,
+        ),
+    )
+    write_node = StubWriteNode(pipeline_context=pipeline_context)
+
+    outputs = StreamingRunner(pipeline_context, nodes, write_node).run(DOCS)
+
+    expected = sorted(f"{doc}>a>b>c" for doc in DOCS)
+    assert sorted(outputs) == expected
+    assert sorted(path for batch in write_node.batches for path in batch) == expected
+    for node in nodes:
+        assert len(node.calls) == len(DOCS)
+
+
+def test_streaming_runner_bounds_the_docs_waiting_between_nodes():
+    pipeline_context = get_pipeline_context(stream_queue_size=2)
+    nodes = [
+        StubNode(pipeline_context=pipeline_context, name="fast"),
+        StubNode(pipeline_context=pipeline_context, name="slow", delay=0.02),
+    ]
+    runner = RecordingStreamingRunner(pipeline_context, nodes)
+
+    outputs = runner.run(DOCS)
+
+    assert len(outputs) == len(DOCS)
+    # The slow node holds docs back, so its queue fills up but no further
+    assert runner.max_waiting == [2, 2]
+
+
+@pytest.mark.parametrize("executor_type", [THREAD_EXECUTOR, PROCESS_EXECUTOR])
+def test_streaming_runner_stops_on_a_failing_task(monkeypatch, executor_type):
+    pools: t.List[FakePool] = []
+
+    def fake_pool(*args, **kwargs):
+        pools.append(FakePool())
+        return pools[-1]
+
+    monkeypatch.setattr(streaming.mp, "Pool", fake_pool)
+    monkeypatch.setattr(streaming, "ThreadPoolExecutor", RecordingThreadPoolExecutor)
+    RecordingThreadPoolExecutor.instances = []
+    pipeline_context = get_pipeline_context(stream_queue_size=1)
+    nodes = [
+        StubNode(pipeline_context=pipeline_context, name="a", workers=2),
+        StubNode(
+            pipeline_context=pipeline_context,
+            name="b",
+            workers=2,
+            executor_type=executor_type,
+            fail_on="doc-1>a",
+        ),
+    ]
+    write_node = StubWriteNode(pipeline_context=pipeline_context)
+
+    with pytest.raises(ValueError, match="failed on doc-1>a"):
+        StreamingRunner(pipeline_context, nodes, write_node).run(DOCS)
+
+    assert len(nodes[0].calls) < len(DOCS)
+    assert "doc-1>a>b" not in [path for batch in write_node.batches for path in batch]
+    assert RecordingThreadPoolExecutor.instances
+    assert all(executor.shut_down for executor in RecordingThreadPoolExecutor.instances)
+    if executor_type == PROCESS_EXECUTOR:
+        assert [pool.calls for pool in pools] == [["terminate", "join"]]
+
+
+def test_streaming_runner_does_not_start_the_pool_of_the_pipeline_twice(monkeypatch):
+    monkeypatch.setattr(streaming.mp, "Pool", pytest.fail)
+    pipeline_context = get_pipeline_context()
+    pipeline_context.pool = FakePool()
+    nodes = [
+        StubNode(pipeline_context=pipeline_context, workers=2, executor_type=PROCESS_EXECUTOR),
+    ]
+
+    outputs = StreamingRunner(pipeline_context, nodes).run(DOCS)
+
+    assert sorted(outputs) == sorted(f"{doc}>stub" for doc in DOCS)
+    assert pipeline_context.pool.calls == []
+
+
+def test_streaming_runner_starts_docs_at_their_first_stage():
+    pipeline_context = get_pipeline_context()
+    nodes = [
+        StubNode(pipeline_context=pipeline_context, name="a"),
+        StubNode(pipeline_context=pipeline_context, name="b"),
+    ]
+    skipped = set(DOCS[::2])
+
+    outputs = StreamingRunner(pipeline_context, nodes).run(
+        DOCS,
+        first_stage=lambda doc: 1 if doc in skipped else 0,
+    )
+
+    assert sorted(nodes[0].calls) == sorted(set(DOCS) - skipped)
+    assert sorted(nodes[1].calls) == sorted(doc if doc in skipped else f"{doc}>a" for doc in DOCS)
+    assert len(outputs) == len(DOCS)
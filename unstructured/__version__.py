@@ -1 +1 @@
-__version__ = "0.10.20"  # pragma: no cover
+__version__ = "0.10.21-dev25"  # pragma: no cover
@@ -89,6 +89,68 @@ class CliProcessorConfig(ProcessorConfig, CliMixin):
                 show_default=True,
                 help="Number of parallel processes with which to process docs",
             ),
+            click.Option(
+                ["--download-workers"],
+                default=None,
+                type=click.IntRange(min=1),
+                help="Number of docs downloaded concurrently. Defaults to --num-processes.",
+            ),
+            click.Option(
+                ["--partition-workers"],
+                default=None,
+                type=click.IntRange(min=1),
+                help="Number of docs partitioned concurrently. Defaults to --num-processes.",
+            ),
+            click.Option(
+                ["--embed-workers"],
+                default=None,
+                type=click.IntRange(min=1),
+                help="Number of docs embedded concurrently. Defaults to --num-processes.",
+            ),
+            click.Option(
+                ["--download-executor"],
+                default="thread",
+                show_default=True,
+                type=click.Choice(["thread", "process"]),
+                help="Whether docs are downloaded in threads or in worker processes.",
+            ),
+            click.Option(
+                ["--partition-executor"],
+                default="process",
+                show_default=True,
+                type=click.Choice(["thread", "process"]),
+                help="Whether docs are partitioned in threads or in worker processes.",
+            ),
+            click.Option(
+                ["--embed-executor"],
+                default="thread",
+                show_default=True,
+                type=click.Choice(["thread", "process"]),
+                help="Whether docs are embedded in threads or in worker processes.",
+            ),
+            click.Option(
+                ["--streaming"],
+                is_flag=True,
+                default=False,
+                help="Move each doc on to the next step (download, partition, chunk, embed, "
+                "write) as soon as it is done with the previous one, instead of running each "
+                "step over all docs before starting the next.",
+            ),
+            click.Option(
+                ["--stream-queue-size"],
+                default=None,
+                type=click.IntRange(min=1),
+                help="With --streaming, the maximum number of docs waiting between two steps. "
+                "Defaults to --num-processes.",
+            ),
+            click.Option(
+                ["--incremental"],
+                is_flag=True,
+                default=False,
+                help="Only process docs whose version or modification date on the source changed "
+                "since the last run with the same work dir, without downloading the others, and "
+                "write a report of the docs changed or deleted since then to the work dir.",
+            ),
             click.Option(["-v", "--verbose"], is_flag=True, default=False),
         ]
         cmd.params.extend(options)
@@ -213,6 +275,14 @@ class CliPartitionConfig(PartitionConfig, CliMixin):
                 default=None,
                 help="API Key for partition endpoint.",
             ),
+            click.Option(
+                ["--pdf-shard-pages"],
+                default=None,
+                type=click.IntRange(min=1),
+                help="If set, PDFs with more pages partitioned with the hi_res or ocr_only "
+                "strategy are split into ranges of this many pages that are partitioned in "
+                "parallel and merged back into one output.",
+            ),
         ]
         cmd.params.extend(options)
 
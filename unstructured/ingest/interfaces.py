@@ -50,6 +50,7 @@ class PartitionConfig(BaseConfig):
     partition_endpoint: t.Optional[str] = None
     partition_by_api: bool = False
     api_key: t.Optional[str] = None
+    pdf_shard_pages: t.Optional[int] = None
 
 
 @dataclass
@@ -59,6 +60,16 @@ class ProcessorConfig(BaseConfig):
     work_dir: str = str((Path.home() / ".cache" / "unstructured" / "ingest" / "pipeline").resolve())
     output_dir: str = "structured-output"
     num_processes: int = 2
+    # Per node concurrency, defaulting to num_processes
+    download_workers: t.Optional[int] = None
+    partition_workers: t.Optional[int] = None
+    embed_workers: t.Optional[int] = None
+    download_executor: str = "thread"
+    partition_executor: str = "process"
+    embed_executor: str = "thread"
+    streaming: bool = False
+    stream_queue_size: t.Optional[int] = None
+    incremental: bool = False
 
 
 @dataclass
@@ -5,6 +5,7 @@ from pathlib import Path
 from unstructured.ingest.connector.registry import create_ingest_doc_from_json
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import CopyNode
+from unstructured.ingest.pipeline.state import COPY_STAGE
 
 
 class Copier(CopyNode):
@@ -17,3 +18,8 @@ class Copier(CopyNode):
         Path(desired_output).parent.mkdir(parents=True, exist_ok=True)
         logger.info(f"Copying {json_path} -> {desired_output}")
         shutil.copy(json_path, desired_output)
+        self.pipeline_context.state.set_stage_output(
+            ingest_doc_json,
+            COPY_STAGE,
+            str(desired_output),
+        )
@@ -1,11 +1,14 @@
 import os
+import typing as t
 
-from unstructured_inference.models.base import get_model
+from unstructured.ingest.interfaces import PartitionConfig
+from unstructured.ingest.logger import ingest_log_streaming_init, logger
 
 
 def initialize():
     """Download default model or model specified by UNSTRUCTURED_HI_RES_MODEL_NAME environment
     variable (avoids subprocesses all doing the same)"""
+    from unstructured_inference.models.base import get_model
 
     # If more than one model will be supported and left up to user selection
     supported_model = os.environ.get("UNSTRUCTURED_HI_RES_SUPPORTED_MODEL", "")
@@ -14,3 +17,39 @@ def initialize():
             get_model(model_name=model_name)
 
     get_model(os.environ.get("UNSTRUCTURED_HI_RES_MODEL_NAME"))
+
+
+def warm_up(partition_config: t.Optional[PartitionConfig] = None):
+    """Pre-imports the partitioners and, with the hi_res strategy, loads the layout model and
+    the OCR agent, so that the first doc a worker process handles does not pay for them."""
+    if partition_config is not None and partition_config.partition_by_api:
+        return
+    try:
+        import unstructured.partition.auto  # noqa: F401
+
+        if partition_config is not None and partition_config.strategy == "hi_res":
+            from unstructured.partition.ocr import get_entire_page_ocr
+            from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+            initialize()
+            OCRAgent.get_agent(get_entire_page_ocr())
+    except Exception as e:
+        # Failures are left to be reported by the docs that need what could not be loaded
+        logger.warning(f"Could not warm up worker process: {e}")
+
+
+def initialize_worker(
+    log_level: int,
+    initializer: t.Optional[t.Callable[..., None]] = None,
+    initargs: t.Tuple[t.Any, ...] = (),
+):
+    """Initializes a process of the worker pool of a pipeline: sets up logging, then runs the
+    `initializer` hook of the pipeline with `initargs`."""
+    ingest_log_streaming_init(log_level)
+    if initializer is None:
+        return
+    try:
+        initializer(*initargs)
+    except Exception:
+        # A pool keeps restarting workers whose initializer fails, so errors are only logged
+        logger.exception("Worker initializer failed")
@@ -5,7 +5,7 @@ import multiprocessing as mp
 import typing as t
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from multiprocessing.managers import DictProxy
+from multiprocessing.pool import Pool
 from pathlib import Path
 
 from dataclasses_json import DataClassJsonMixin
@@ -17,6 +17,11 @@ from unstructured.ingest.interfaces import (
     ProcessorConfig,
 )
 from unstructured.ingest.logger import ingest_log_streaming_init, logger
+from unstructured.ingest.pipeline.state import PipelineState
+from unstructured.utils import thread_map
+
+THREAD_EXECUTOR = "thread"
+PROCESS_EXECUTOR = "process"
 
 
 @dataclass
@@ -26,17 +31,46 @@ class PipelineContext(ProcessorConfig):
     """
 
     def __post_init__(self):
-        self._ingest_docs_map: t.Optional[DictProxy] = None
+        self._state: t.Optional[PipelineState] = None
+        self._pool: t.Optional[Pool] = None
+
+    def __getstate__(self):
+        # The worker pool is only used from the main process and cannot be pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
+
+    @property
+    def state(self) -> PipelineState:
+        """The state store of the pipeline, with the json of each ingest doc and the stages each
+        doc has completed."""
+        if self._state is None:
+            raise ValueError("state never initialized")
+        return self._state
+
+    @state.setter
+    def state(self, value: PipelineState):
+        self._state = value
 
     @property
-    def ingest_docs_map(self) -> DictProxy:
-        if self._ingest_docs_map is None:
+    def ingest_docs_map(self) -> PipelineState:
+        """The json of each ingest doc by the hashes of its intermediate files, kept in `state`."""
+        if self._state is None:
             raise ValueError("ingest_docs_map never initialized")
-        return self._ingest_docs_map
+        return self._state
 
     @ingest_docs_map.setter
-    def ingest_docs_map(self, value: DictProxy):
-        self._ingest_docs_map = value
+    def ingest_docs_map(self, value: PipelineState):
+        self._state = value
+
+    @property
+    def pool(self) -> t.Optional[Pool]:
+        """The worker pool shared by the nodes of the running pipeline, if any."""
+        return self._pool
+
+    @pool.setter
+    def pool(self, value: t.Optional[Pool]):
+        self._pool = value
 
 
 @dataclass
@@ -55,23 +89,64 @@ class PipelineNode(DataClassJsonMixin, ABC):
                 self.result = self.run(iterable)
             else:
                 self.result = self.run()
-        elif self.pipeline_context.num_processes == 1:
-            if iterable:
-                self.result = [self.run(it) for it in iterable]
-            else:
-                self.result = self.run()
+        elif self.pipeline_context.num_processes == 1 and not iterable:
+            self.result = self.run()
         else:
-            with mp.Pool(
-                processes=self.pipeline_context.num_processes,
-                initializer=ingest_log_streaming_init,
-                initargs=(logging.DEBUG if self.pipeline_context.verbose else logging.INFO,),
-            ) as pool:
-                self.result = pool.map(self.run, iterable)
+            self.result = self.map(self.run, iterable)
         return self.result
 
+    def map(
+        self,
+        func: t.Callable[[t.Any], t.Any],
+        iterable: t.Iterable[t.Any],
+        chunksize: t.Optional[int] = None,
+    ) -> t.List[t.Any]:
+        """Applies `func` to every item of `iterable`, on up to `get_workers()` items at a time, and
+        returns the results in order."""
+        workers = self.get_workers()
+        if workers == 1:
+            return [func(it) for it in iterable]
+        if self.get_executor_type() == THREAD_EXECUTOR:
+            return list(thread_map(func, iterable, max_workers=workers))
+        pool = self.pipeline_context.pool
+        if pool is not None:
+            # The shared pool can have more processes than this node is allowed to use, so each of
+            # `workers` threads waits for one task at a time
+            return list(thread_map(lambda it: pool.apply(func, (it,)), iterable, workers))
+        with mp.Pool(
+            processes=workers,
+            initializer=ingest_log_streaming_init,
+            initargs=(logging.DEBUG if self.pipeline_context.verbose else logging.INFO,),
+        ) as pool:
+            return pool.map(func, iterable, chunksize=chunksize)
+
+    def get_workers(self) -> int:
+        """Returns the number of items the node processes concurrently."""
+        return max(1, self.pipeline_context.num_processes)
+
+    def get_executor_type(self) -> str:
+        """Returns whether items are processed in worker processes (`PROCESS_EXECUTOR`) or in
+        threads of the main process (`THREAD_EXECUTOR`)."""
+        return PROCESS_EXECUTOR
+
     def supported_multiprocessing(self) -> bool:
         return True
 
+    def is_done(self, item: t.Any) -> bool:
+        """Returns whether `item` was already processed by the node, with the same config, in an
+        earlier run recorded in the pipeline state."""
+        return False
+
+    def stream_tasks(self, item: t.Any) -> t.List[t.Tuple[t.Callable[[t.Any], t.Any], t.Any]]:
+        """Returns the (function, argument) tasks run in the worker processes to process `item`
+        when the pipeline is streamed."""
+        return [(self.run, item)]
+
+    def stream_result(self, item: t.Any, results: t.List[t.Any]) -> t.Any:
+        """Returns the output of `item` passed on to the next node when the pipeline is streamed,
+        from the results of its `stream_tasks`."""
+        return results[0]
+
     @abstractmethod
     def run(self, *args, **kwargs) -> t.Optional[t.Any]:
         pass
@@ -120,10 +195,20 @@ class SourceNode(PipelineNode):
         logger.info("Running source node to download data associated with ingest docs")
         super().initialize()
 
+    def get_workers(self) -> int:
+        return self.pipeline_context.download_workers or super().get_workers()
+
+    def get_executor_type(self) -> str:
+        return self.pipeline_context.download_executor
+
     @abstractmethod
     def run(self, ingest_doc_json: str) -> str:
         pass
 
+    def stream_result(self, item: t.Any, results: t.List[t.Any]) -> t.Any:
+        # The partition node reads the ingest doc, not the downloaded file
+        return item
+
 
 @dataclass
 class PartitionNode(PipelineNode):
@@ -142,6 +227,12 @@ class PartitionNode(PipelineNode):
         )
         super().initialize()
 
+    def get_workers(self) -> int:
+        return self.pipeline_context.partition_workers or super().get_workers()
+
+    def get_executor_type(self) -> str:
+        return self.pipeline_context.partition_executor
+
     def create_hash(self) -> str:
         hash_dict = self.partition_config.to_dict()
         hash_dict["partition_kwargs"] = self.partition_kwargs
@@ -202,3 +293,6 @@ class CopyNode(PipelineNode):
     @abstractmethod
     def run(self, json_path: str):
         pass
+
+    def stream_result(self, item: t.Any, results: t.List[t.Any]) -> t.Any:
+        return item
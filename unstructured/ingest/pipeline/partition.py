@@ -1,43 +1,269 @@
 import hashlib
 import json
+import typing as t
 from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_json
 from unstructured.ingest.error import PartitionError
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import PartitionNode
+from unstructured.ingest.pipeline.state import PARTITION_STAGE
 from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
 
+# (ingest doc json, first page, last page, strategy) of a PDF shard, or of a whole document when the
+# page range and strategy are None
+WorkUnit = t.Tuple[str, t.Optional[int], t.Optional[int], t.Optional[str]]
+
+SHARDED_STRATEGIES = ("hi_res", "ocr_only")
+
 
 @dataclass
 class Partitioner(PartitionNode):
+    def __call__(self, iterable: t.Optional[t.Iterable[t.Any]] = None) -> t.Any:
+        if not self.partition_config.pdf_shard_pages or self.partition_config.partition_by_api:
+            return super().__call__(iterable)
+
+        # Long PDFs are split into page ranges that are partitioned as separate work units, so that
+        # one long document does not keep a single process busy while others idle
+        self.initialize()
+        ingest_doc_jsons = list(iterable) if iterable else []
+        work_units = [
+            work_unit
+            for ingest_doc_json in ingest_doc_jsons
+            for work_unit in self.get_work_units(ingest_doc_json)
+        ]
+        self.map(self.run_work_unit, work_units, chunksize=1)
+        self.result = [self.merge_shards(ingest_doc_json) for ingest_doc_json in ingest_doc_jsons]
+        return self.result
+
+    def stream_tasks(
+        self,
+        ingest_doc_json: str,
+    ) -> t.List[t.Tuple[t.Callable[[t.Any], t.Any], t.Any]]:
+        if not self.partition_config.pdf_shard_pages or self.partition_config.partition_by_api:
+            return super().stream_tasks(ingest_doc_json)
+        return [
+            (self.run_work_unit, work_unit) for work_unit in self.get_work_units(ingest_doc_json)
+        ]
+
+    def stream_result(self, ingest_doc_json: str, results: t.List[t.Any]) -> str:
+        if not self.partition_config.pdf_shard_pages or self.partition_config.partition_by_api:
+            json_path = super().stream_result(ingest_doc_json, results)
+        else:
+            json_path = self.merge_shards(ingest_doc_json)
+        # The downloaded file is no longer needed once the doc is partitioned, so it is removed
+        # right away (unless downloads are preserved) to bound the disk usage
+        create_ingest_doc_from_json(ingest_doc_json).cleanup_file()
+        return json_path
+
     @PartitionError.wrap
     def run(self, ingest_doc_json) -> str:
-        doc = create_ingest_doc_from_json(ingest_doc_json)
-        doc_filename_hash = get_ingest_doc_hash(ingest_doc_json)
-        hashed_filename = hashlib.sha256(
-            f"{self.create_hash()}{doc_filename_hash}".encode(),
-        ).hexdigest()[:32]
-        self.pipeline_context.ingest_docs_map[hashed_filename] = ingest_doc_json
-        doc_filename = f"{hashed_filename}.json"
-        json_path = (Path(self.get_path()) / doc_filename).resolve()
+        json_path = self.get_json_path(ingest_doc_json)
+        self.pipeline_context.ingest_docs_map[json_path.stem] = ingest_doc_json
         if not self.pipeline_context.reprocess and json_path.is_file() and json_path.stat().st_size:
             logger.info(f"File exists: {json_path}, skipping partition")
-            return str(json_path)
+        else:
+            elements = self.partition(ingest_doc_json)
+            with open(json_path, "w", encoding="utf8") as output_f:
+                logger.info(f"writing partitioned content to {json_path}")
+                json.dump(elements, output_f, ensure_ascii=False, indent=2)
+        self.pipeline_context.state.set_stage_output(
+            ingest_doc_json,
+            PARTITION_STAGE,
+            str(json_path),
+        )
+        return str(json_path)
+
+    def is_done(self, ingest_doc_json: str) -> bool:
+        if self.pipeline_context.reprocess:
+            return False
+        json_path = self.get_json_path(ingest_doc_json)
+        return (
+            self.pipeline_context.state.get_stage_output(ingest_doc_json, PARTITION_STAGE)
+            == str(json_path)
+            and json_path.is_file()
+        )
+
+    @PartitionError.wrap
+    def run_work_unit(self, work_unit: WorkUnit) -> str:
+        """Partitions a whole document, or the pages `first_page` to `last_page` of a PDF with
+        `strategy` into a shard that is merged into the output of the document by `merge_shards`."""
+        ingest_doc_json, first_page, last_page, strategy = work_unit
+        if first_page is None or last_page is None:
+            return self.run(ingest_doc_json)
+        shard_path = self.get_shard_path(ingest_doc_json, first_page, last_page)
+        # Shards left by an interrupted run are reused
+        if not self.pipeline_context.reprocess and shard_path.is_file():
+            logger.info(f"File exists: {shard_path}, skipping partition")
+            return str(shard_path)
+        elements = self.partition(
+            ingest_doc_json,
+            strategy=strategy,
+            first_page=first_page,
+            last_page=last_page,
+        )
+        with open(shard_path, "w", encoding="utf8") as output_f:
+            logger.info(f"writing partitioned pages {first_page}-{last_page} to {shard_path}")
+            json.dump(elements, output_f, ensure_ascii=False)
+        return str(shard_path)
+
+    def partition(
+        self,
+        ingest_doc_json: str,
+        strategy: t.Optional[str] = None,
+        **partition_kwargs,
+    ) -> t.Optional[t.List[dict]]:
+        doc = create_ingest_doc_from_json(ingest_doc_json)
         languages = (
             self.partition_config.ocr_languages.split("+")
             if self.partition_config.ocr_languages
             else []
         )
-        elements = doc.process_file(
+        return doc.process_file(
             partition_config=self.partition_config,
-            strategy=self.partition_config.strategy,
+            strategy=strategy or self.partition_config.strategy,
             languages=languages,
             encoding=self.partition_config.encoding,
             pdf_infer_table_structure=self.partition_config.pdf_infer_table_structure,
+            **partition_kwargs,
+        )
+
+    def get_work_units(self, ingest_doc_json: str) -> t.List[WorkUnit]:
+        """Returns the (ingest doc, first page, last page, strategy) units a document is
+        partitioned in: one unit per `pdf_shard_pages` pages for longer PDFs partitioned from page
+        images, a single unit with no page range for any other document and none for documents
+        that are already partitioned."""
+        json_path = self.get_json_path(ingest_doc_json)
+        if not self.pipeline_context.reprocess and json_path.is_file() and json_path.stat().st_size:
+            return []
+        page_count = self.get_pdf_page_count(ingest_doc_json)
+        shard_pages = self.partition_config.pdf_shard_pages
+        if page_count is None or shard_pages is None or page_count <= shard_pages:
+            return [(ingest_doc_json, None, None, None)]
+        strategy = self.get_pdf_strategy(ingest_doc_json)
+        # The text based strategies are cheap and fall back to OCR when a page range has no text, so
+        # only the strategies that partition each page from its image are split
+        if strategy not in SHARDED_STRATEGIES:
+            return [(ingest_doc_json, None, None, None)]
+        return [
+            (ingest_doc_json, first_page, min(first_page + shard_pages - 1, page_count), strategy)
+            for first_page in range(1, page_count + 1, shard_pages)
+        ]
+
+    def get_pdf_page_count(self, ingest_doc_json: str) -> t.Optional[int]:
+        """Returns the page count of the document if it is a PDF, and None otherwise."""
+        from unstructured.file_utils.filetype import FileType, detect_filetype
+
+        doc = create_ingest_doc_from_json(ingest_doc_json)
+        filename = str(doc.filename)
+        if not Path(filename).is_file() or detect_filetype(filename=filename) != FileType.PDF:
+            return None
+        from unstructured.partition.pdf import get_pdf_page_count
+
+        try:
+            return get_pdf_page_count(filename=filename)
+        except Exception as e:
+            logger.warning(f"Could not count the pages of {filename}, not splitting it: {e}")
+            return None
+
+    def get_pdf_strategy(self, ingest_doc_json: str) -> str:
+        """Returns the strategy every shard of a PDF is partitioned with, resolved once over the
+        whole document so that "auto" cannot pick a different strategy for each shard."""
+        from unstructured.partition.pdf import determine_pdf_strategy
+
+        doc = create_ingest_doc_from_json(ingest_doc_json)
+        return determine_pdf_strategy(
+            filename=str(doc.filename),
+            strategy=self.partition_config.strategy,
+            infer_table_structure=self.partition_config.pdf_infer_table_structure,
+        )
+
+    def merge_shards(self, ingest_doc_json: str) -> str:
+        """Writes the elements of the shards of a document, in page order, to its output and
+        removes the shards. Documents that were not split are left as they are.
+
+        The ingest partitioner does not request page breaks, so there are none to add between
+        shards: the merged output matches the output of an unsplit run."""
+        json_path = self.get_json_path(ingest_doc_json)
+        self.pipeline_context.ingest_docs_map[json_path.stem] = ingest_doc_json
+        shard_paths = sorted(
+            self.get_shards_path().glob(f"{json_path.stem}-*.json"),
+            key=lambda path: int(path.stem.split("-")[-2]),
         )
+        if not shard_paths:
+            return str(json_path)
+        elements: t.List[dict] = []
+        for shard_path in shard_paths:
+            with open(shard_path, encoding="utf8") as shard_f:
+                elements.extend(json.load(shard_f) or [])
+        self.link_parents(elements)
         with open(json_path, "w", encoding="utf8") as output_f:
-            logger.info(f"writing partitioned content to {json_path}")
+            logger.info(f"writing {len(shard_paths)} merged shards to {json_path}")
             json.dump(elements, output_f, ensure_ascii=False, indent=2)
+        self.pipeline_context.state.set_stage_output(
+            ingest_doc_json,
+            PARTITION_STAGE,
+            str(json_path),
+        )
+        for shard_path in shard_paths:
+            shard_path.unlink()
         return str(json_path)
+
+    def link_parents(self, elements: t.List[dict]) -> None:
+        """Sets the `parent_id` of the merged elements again over the whole document, since the
+        first elements of a shard can belong to a title found in an earlier shard."""
+        from unstructured.partition.common import set_element_hierarchy
+
+        partition_config = self.partition_config
+        if (
+            not {"element_id", "type"}.issubset(partition_config.fields_include)
+            or not (
+                partition_config.flatten_metadata or "metadata" in partition_config.fields_include
+            )
+            or "parent_id" in partition_config.metadata_exclude
+            or (
+                partition_config.metadata_include
+                and "parent_id" not in partition_config.metadata_include
+            )
+        ):
+            return
+        metadatas = [
+            element if partition_config.flatten_metadata else element.get("metadata", {})
+            for element in elements
+        ]
+        # The hierarchy only depends on the id, category and depth of each element
+        proxies = [
+            SimpleNamespace(
+                id=element["element_id"],
+                category=element["type"],
+                metadata=SimpleNamespace(category_depth=metadata.get("category_depth")),
+            )
+            for element, metadata in zip(elements, metadatas)
+        ]
+        set_element_hierarchy(proxies)  # type: ignore[arg-type]
+        for proxy, metadata in zip(proxies, metadatas):
+            if proxy.metadata.parent_id is not None:
+                metadata["parent_id"] = proxy.metadata.parent_id
+            else:
+                metadata.pop("parent_id", None)
+
+    def get_json_path(self, ingest_doc_json: str) -> Path:
+        doc_filename_hash = get_ingest_doc_hash(ingest_doc_json)
+        hashed_filename = hashlib.sha256(
+            f"{self.create_hash()}{doc_filename_hash}".encode(),
+        ).hexdigest()[:32]
+        return (Path(self.get_path()) / f"{hashed_filename}.json").resolve()
+
+    def get_shard_path(self, ingest_doc_json: str, first_page: int, last_page: int) -> Path:
+        json_path = self.get_json_path(ingest_doc_json)
+        return self.get_shards_path() / f"{json_path.stem}-{first_page}-{last_page}.json"
+
+    def get_shards_path(self) -> Path:
+        return self.get_path() / "shards"
+
+    def initialize(self):
+        super().initialize()
+        if self.partition_config.pdf_shard_pages:
+            self.get_shards_path().mkdir(parents=True, exist_ok=True)
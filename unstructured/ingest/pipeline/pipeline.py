@@ -1,13 +1,21 @@
+import hashlib
+import json
 import logging
 import multiprocessing as mp
 import typing as t
-from dataclasses import dataclass, field
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from multiprocessing.pool import Pool
+from pathlib import Path
 
 from dataclasses_json import DataClassJsonMixin
 
+from unstructured.ingest.connector.registry import create_ingest_doc_from_json
 from unstructured.ingest.logger import ingest_log_streaming_init, logger
 from unstructured.ingest.pipeline.copy import Copier
+from unstructured.ingest.pipeline.initialize import initialize_worker, warm_up
 from unstructured.ingest.pipeline.interfaces import (
+    PROCESS_EXECUTOR,
     DocFactoryNode,
     PartitionNode,
     PipelineContext,
@@ -15,7 +23,34 @@ from unstructured.ingest.pipeline.interfaces import (
     SourceNode,
     WriteNode,
 )
-from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
+from unstructured.ingest.pipeline.state import (
+    CHUNK_STAGE,
+    DOWNLOAD_STAGE,
+    EMBED_STAGE,
+    PARTITION_STAGE,
+    PipelineState,
+)
+from unstructured.ingest.pipeline.streaming import StreamingRunner
+from unstructured.ingest.pipeline.utils import (
+    get_config_identity,
+    get_ingest_doc_hash,
+    get_ingest_doc_version,
+)
+
+# The (version, date modified) of a document on its source
+SourceVersion = t.Tuple[t.Optional[str], t.Optional[str]]
+
+
+@dataclass
+class IncrementalReport(DataClassJsonMixin):
+    """The record locators of the documents listed by the source of an incremental run, by how
+    they changed since the last run, and the number of docs with no version to compare."""
+
+    unchanged: t.List[str] = field(default_factory=list)
+    changed: t.List[str] = field(default_factory=list)
+    new: t.List[str] = field(default_factory=list)
+    deleted: t.List[str] = field(default_factory=list)
+    unversioned: int = 0
 
 
 @dataclass
@@ -26,10 +61,45 @@ class Pipeline(DataClassJsonMixin):
     partition_node: PartitionNode
     write_node: t.Optional[WriteNode] = None
     reformat_nodes: t.List[ReformatNode] = field(default_factory=list)
+    # Run once in every worker process, `warm_up` with the partition config by default
+    worker_initializer: t.Optional[t.Callable[..., None]] = None
+    worker_initargs: t.Tuple[t.Any, ...] = ()
 
     def initialize(self):
         ingest_log_streaming_init(logging.DEBUG if self.pipeline_context.verbose else logging.INFO)
 
+    @contextmanager
+    def worker_pool(self) -> t.Iterator[t.Optional[Pool]]:
+        """Starts the pool of worker processes shared by every node for the duration of a run,
+        so that the workers only start, import the partitioners and load the models once."""
+        processes = self.get_pool_processes()
+        if processes == 1:
+            yield None
+            return
+        initializer, initargs = self.worker_initializer, self.worker_initargs
+        if initializer is None:
+            initializer, initargs = warm_up, (self.partition_node.partition_config,)
+        pool = mp.Pool(
+            processes=processes,
+            initializer=initialize_worker,
+            initargs=(
+                logging.DEBUG if self.pipeline_context.verbose else logging.INFO,
+                initializer,
+                initargs,
+            ),
+        )
+        self.pipeline_context.pool = pool
+        try:
+            yield pool
+        except BaseException:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+            self.pipeline_context.pool = None
+
     def get_nodes_str(self):
         nodes = [self.doc_factory_node, self.source_node, self.partition_node]
         nodes.extend(self.reformat_nodes)
@@ -38,22 +108,60 @@ class Pipeline(DataClassJsonMixin):
         nodes.append(Copier(pipeline_context=self.pipeline_context))
         return " -> ".join([node.__class__.__name__ for node in nodes])
 
+    def get_pool_processes(self) -> int:
+        """Returns the number of worker processes needed by the nodes that run in processes."""
+        nodes = [
+            self.source_node,
+            self.partition_node,
+            *self.reformat_nodes,
+            Copier(pipeline_context=self.pipeline_context),
+        ]
+        return max(
+            (node.get_workers() for node in nodes if node.get_executor_type() == PROCESS_EXECUTOR),
+            default=1,
+        )
+
     def run(self):
         logger.info(
             f"running pipeline: {self.get_nodes_str()} "
             f"with config: {self.pipeline_context.to_json()}",
         )
         self.initialize()
-        manager = mp.Manager()
-        self.pipeline_context.ingest_docs_map = manager.dict()
+        work_dir = Path(self.pipeline_context.work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        self.pipeline_context.state = PipelineState(work_dir / "pipeline-state.sqlite3")
+        try:
+            with self.worker_pool():
+                self.run_nodes()
+        finally:
+            self.pipeline_context.state.close()
+
+    def run_nodes(self):
         json_docs = self.doc_factory_node()
+        if self.pipeline_context.incremental:
+            json_docs, versions, report = self.filter_unchanged(json_docs)
         logger.info(
             f"processing {len(json_docs)} docs via "
             f"{self.pipeline_context.num_processes} processes",
         )
-        for doc in json_docs:
-            self.pipeline_context.ingest_docs_map[get_ingest_doc_hash(doc)] = doc
-        self.source_node(iterable=json_docs)
+        self.pipeline_context.ingest_docs_map.update(
+            {get_ingest_doc_hash(doc): doc for doc in json_docs},
+        )
+        # An incremental run can leave no docs to process, which the nodes do not expect
+        if json_docs and self.pipeline_context.streaming:
+            self.run_streaming(json_docs)
+        elif json_docs:
+            self.run_batch(json_docs)
+        if self.pipeline_context.incremental:
+            self.update_manifest(json_docs, versions, report.deleted)
+            self.write_incremental_report(report)
+
+    def run_batch(self, json_docs: t.List[str]):
+        """Runs each node of the pipeline over all docs before starting the next one."""
+        # Docs partitioned by an earlier run with the same config are not downloaded again
+        source_docs = [doc for doc in json_docs if not self.partition_node.is_done(doc)]
+        if source_docs:
+            self.source_node(iterable=source_docs)
         partitioned_jsons = self.partition_node(iterable=json_docs)
         for reformat_node in self.reformat_nodes:
             reformatted_jsons = reformat_node(iterable=partitioned_jsons)
@@ -67,3 +175,137 @@ class Pipeline(DataClassJsonMixin):
 
         if self.write_node:
             self.write_node(iterable=partitioned_jsons)
+
+    def run_streaming(self, json_docs: t.List[str]):
+        """Runs each doc through the nodes of the pipeline as soon as it is done with the previous
+        one, instead of running each node over all docs before starting the next."""
+        copier = Copier(
+            pipeline_context=self.pipeline_context,
+        )
+        nodes = [self.source_node, self.partition_node, *self.reformat_nodes, copier]
+        for node in nodes:
+            node.initialize()
+        if self.write_node:
+            self.write_node.initialize()
+        StreamingRunner(
+            pipeline_context=self.pipeline_context,
+            nodes=nodes,
+            write_node=self.write_node,
+        ).run(
+            json_docs,
+            # Docs partitioned by an earlier run with the same config skip the download
+            first_stage=lambda doc: 1 if self.partition_node.is_done(doc) else 0,
+        )
+
+    def get_manifest_source(self) -> str:
+        """Returns the key the manifest is kept under, which changes with the source connector and
+        the fields of the connector and node configs that identify what they do, not credentials."""
+        connector = self.doc_factory_node.source_doc_connector
+        hash_dict = {
+            "connector": type(connector).__name__,
+            "connector_config": get_config_identity(connector.connector_config),
+            "nodes": [
+                {
+                    config_field.name: get_config_identity(getattr(node, config_field.name))
+                    for config_field in fields(node)
+                    if config_field.name.endswith("_config")
+                }
+                for node in [self.partition_node, *self.reformat_nodes]
+            ],
+            "partition_kwargs": self.partition_node.partition_kwargs,
+            "destination": self.write_node.create_hash() if self.write_node else None,
+        }
+        return hashlib.sha256(
+            json.dumps(hash_dict, sort_keys=True, default=str).encode(),
+        ).hexdigest()[:32]
+
+    def filter_unchanged(
+        self,
+        json_docs: t.List[str],
+    ) -> t.Tuple[t.List[str], t.Dict[str, t.Tuple[str, SourceVersion]], IncrementalReport]:
+        """Leaves out the docs whose version and modification date match the manifest and whose
+        structured output still exists. Returns the docs to process, their versions and a report."""
+        source = self.get_manifest_source()
+        manifest = self.pipeline_context.state.get_manifest(source)
+        changed_docs: t.List[str] = []
+        versions: t.Dict[str, t.Tuple[str, SourceVersion]] = {}
+        report = IncrementalReport()
+        listed: t.Set[str] = set()
+        for doc in json_docs:
+            record_locator, version, date_modified = get_ingest_doc_version(doc)
+            if record_locator is not None:
+                listed.add(record_locator)
+            if record_locator is None or (version is None and date_modified is None):
+                report.unversioned += 1
+                changed_docs.append(doc)
+                continue
+            previous = manifest.get(record_locator)
+            if (
+                not self.pipeline_context.reprocess
+                and previous == (version, date_modified)
+                and create_ingest_doc_from_json(doc).has_output()
+            ):
+                report.unchanged.append(record_locator)
+                continue
+            if previous is not None:
+                self.forget_outputs(doc)
+            (report.new if previous is None else report.changed).append(record_locator)
+            changed_docs.append(doc)
+            versions[doc] = (record_locator, (version, date_modified))
+        logger.info(
+            f"skipping {len(json_docs) - len(changed_docs)} of {len(json_docs)} docs unchanged "
+            "since the last run",
+        )
+        # Docs left out with --max-docs are not deleted
+        if not self.doc_factory_node.source_doc_connector.read_config.max_docs:
+            report.deleted = [
+                record_locator for record_locator in manifest if record_locator not in listed
+            ]
+        return changed_docs, versions, report
+
+    def write_incremental_report(self, report: IncrementalReport):
+        """Writes the report of an incremental run to the work dir, warning about deleted docs."""
+        report_path = Path(self.pipeline_context.work_dir) / "incremental-report.json"
+        report_dict = report.to_dict()
+        for key in ["unchanged", "changed", "new", "deleted"]:
+            report_dict[key] = [json.loads(record_locator) for record_locator in report_dict[key]]
+        with open(report_path, "w", encoding="utf8") as report_f:
+            json.dump(report_dict, report_f, indent=2)
+        logger.info(
+            f"incremental run: {len(report.unchanged)} unchanged, {len(report.changed)} changed, "
+            f"{len(report.new)} new and {len(report.deleted)} deleted docs, see {report_path}",
+        )
+        if report.deleted:
+            logger.warning(
+                f"{len(report.deleted)} docs were deleted from the source since the last run, "
+                f"their record locators are listed in {report_path}",
+            )
+
+    def forget_outputs(self, json_doc: str):
+        """Removes the downloaded file and the intermediate outputs of the previous version of a
+        doc, which are named after its local filename and would otherwise be reused."""
+        outputs = self.pipeline_context.state.pop_stage_outputs(json_doc)
+        for stage in [DOWNLOAD_STAGE, PARTITION_STAGE, CHUNK_STAGE, EMBED_STAGE]:
+            output = outputs.get(stage)
+            if output and Path(output).is_file():
+                logger.debug(f"removing {output} of the previous version of the doc")
+                Path(output).unlink()
+
+    def update_manifest(
+        self,
+        json_docs: t.List[str],
+        versions: t.Dict[str, t.Tuple[str, SourceVersion]],
+        deleted: t.List[str],
+    ):
+        """Records the version of the docs processed by the run that now have a structured
+        output, and removes the docs deleted from the source from the manifest."""
+        source = self.get_manifest_source()
+        self.pipeline_context.state.update_manifest(
+            source,
+            {
+                record_locator: version
+                for doc, (record_locator, version) in versions.items()
+                if create_ingest_doc_from_json(doc).has_output()
+            },
+        )
+        self.pipeline_context.state.remove_from_manifest(source, deleted)
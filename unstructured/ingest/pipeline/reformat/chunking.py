@@ -9,6 +9,7 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import ReformatNode
+from unstructured.ingest.pipeline.state import CHUNK_STAGE
 from unstructured.staging.base import convert_to_dict, elements_from_json
 
 
@@ -47,6 +48,11 @@ class Chunker(ReformatNode):
         with open(json_path, "w", encoding="utf8") as output_f:
             logger.info(f"writing embeddings content to {json_path}")
             json.dump(elements_dict, output_f, ensure_ascii=False, indent=2)
+        self.pipeline_context.state.set_stage_output(
+            self.pipeline_context.ingest_docs_map[hashed_filename],
+            CHUNK_STAGE,
+            str(json_path),
+        )
         return str(json_path)
 
     def get_path(self) -> Path:
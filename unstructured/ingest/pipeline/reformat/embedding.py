@@ -9,6 +9,7 @@ from unstructured.ingest.interfaces import (
 )
 from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import ReformatNode
+from unstructured.ingest.pipeline.state import EMBED_STAGE
 from unstructured.staging.base import convert_to_dict, elements_from_json
 
 
@@ -22,6 +23,12 @@ class Embedder(ReformatNode):
         )
         super().initialize()
 
+    def get_workers(self) -> int:
+        return self.pipeline_context.embed_workers or super().get_workers()
+
+    def get_executor_type(self) -> str:
+        return self.pipeline_context.embed_executor
+
     def create_hash(self) -> str:
         hash_dict = self.embedder_config.to_dict()
         return hashlib.sha256(json.dumps(hash_dict, sort_keys=True).encode()).hexdigest()[:32]
@@ -35,6 +42,9 @@ class Embedder(ReformatNode):
         ]
         json_filename = f"{hashed_filename}.json"
         json_path = (Path(self.get_path()) / json_filename).resolve()
+        self.pipeline_context.ingest_docs_map[
+            hashed_filename
+        ] = self.pipeline_context.ingest_docs_map[filename]
         if not self.pipeline_context.reprocess and json_path.is_file() and json_path.stat().st_size:
             logger.debug(f"File exists: {json_path}, skipping embedding")
             return str(json_path)
@@ -45,6 +55,11 @@ class Embedder(ReformatNode):
         with open(json_path, "w", encoding="utf8") as output_f:
             logger.info(f"writing embeddings content to {json_path}")
             json.dump(elements_dict, output_f, ensure_ascii=False, indent=2)
+        self.pipeline_context.state.set_stage_output(
+            self.pipeline_context.ingest_docs_map[hashed_filename],
+            EMBED_STAGE,
+            str(json_path),
+        )
         return str(json_path)
 
     def get_path(self) -> Path:
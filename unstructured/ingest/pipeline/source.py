@@ -1,27 +1,35 @@
+import threading
 import typing as t
 from dataclasses import dataclass
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_json
 from unstructured.ingest.interfaces import BaseSessionHandle, IngestDocSessionHandleMixin
 from unstructured.ingest.pipeline.interfaces import SourceNode
+from unstructured.ingest.pipeline.state import DOWNLOAD_STAGE
 
-# module-level variable to store session handle
-session_handle: t.Optional[BaseSessionHandle] = None
+# module-level variable to store the session handle of each thread, since the clients of some
+# connectors cannot be shared between the threads downloading docs
+_local = threading.local()
 
 
 @dataclass
 class Reader(SourceNode):
     def run(self, ingest_doc_json: str) -> str:
-        global session_handle
         doc = create_ingest_doc_from_json(ingest_doc_json)
         if isinstance(doc, IngestDocSessionHandleMixin):
+            session_handle: t.Optional[BaseSessionHandle] = getattr(_local, "session_handle", None)
             if session_handle is None:
                 # create via doc.session_handle, which is a property that creates a
                 # session handle if one is not already defined
-                session_handle = doc.session_handle
+                _local.session_handle = doc.session_handle
             else:
                 doc.session_handle = session_handle
         # does the work necessary to load file into filesystem
         # in the future, get_file_handle() could also be supported
         doc.get_file()
+        self.pipeline_context.state.set_stage_output(
+            ingest_doc_json,
+            DOWNLOAD_STAGE,
+            str(doc.filename),
+        )
         return doc.filename
@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+import typing as t
+from pathlib import Path
+
+from unstructured.ingest.pipeline.utils import get_ingest_doc_hash
+
+DOWNLOAD_STAGE = "download"
+PARTITION_STAGE = "partition"
+CHUNK_STAGE = "chunk"
+EMBED_STAGE = "embed"
+COPY_STAGE = "copy"
+WRITE_STAGE = "write"
+
+
+class PipelineState:
+    """State of a pipeline kept in a SQLite database in its work dir, opened separately by every
+    process and thread: the ingest docs, the stages they completed and the source manifest."""
+
+    def __init__(self, path: t.Union[str, Path]):
+        self.path = str(path)
+        self._local = threading.local()
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS docs (hash TEXT PRIMARY KEY, doc_json TEXT NOT NULL)",
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS stages ("
+                "doc_hash TEXT NOT NULL, stage TEXT NOT NULL, output TEXT, "
+                "PRIMARY KEY (doc_hash, stage))",
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS manifest ("
+                "source TEXT NOT NULL, record_locator TEXT NOT NULL, version TEXT, "
+                "date_modified TEXT, PRIMARY KEY (source, record_locator))",
+            )
+
+    def __getstate__(self):
+        # Connections cannot be pickled, each worker opens its own
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=60)
+            # Write-ahead logging lets workers read while another one writes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def __getitem__(self, doc_hash: str) -> str:
+        row = self.connection.execute(
+            "SELECT doc_json FROM docs WHERE hash = ?",
+            (doc_hash,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(doc_hash)
+        return row[0]
+
+    def __setitem__(self, doc_hash: str, doc_json: str):
+        self.update({doc_hash: doc_json})
+
+    def __contains__(self, doc_hash: object) -> bool:
+        return (
+            self.connection.execute("SELECT 1 FROM docs WHERE hash = ?", (doc_hash,)).fetchone()
+            is not None
+        )
+
+    def get(self, doc_hash: str, default: t.Optional[str] = None) -> t.Optional[str]:
+        try:
+            return self[doc_hash]
+        except KeyError:
+            return default
+
+    def update(self, docs: t.Mapping[str, str]):
+        """Stores the json of many docs by hash in a single transaction."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO docs (hash, doc_json) VALUES (?, ?)",
+                docs.items(),
+            )
+
+    def set_stage_output(self, doc_json: str, stage: str, output: t.Optional[str] = None):
+        """Records that the doc completed `stage`, with the path of what it produced."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO stages (doc_hash, stage, output) VALUES (?, ?, ?)",
+                (get_ingest_doc_hash(doc_json), stage, output),
+            )
+
+    def get_stage_output(self, doc_json: str, stage: str) -> t.Optional[str]:
+        """Returns the output recorded for the doc when it completed `stage`, or None if it has
+        not completed it."""
+        row = self.connection.execute(
+            "SELECT output FROM stages WHERE doc_hash = ? AND stage = ?",
+            (get_ingest_doc_hash(doc_json), stage),
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def pop_stage_outputs(self, doc_json: str) -> t.Dict[str, t.Optional[str]]:
+        """Forgets the stages the doc completed and returns their outputs by stage."""
+        doc_hash = get_ingest_doc_hash(doc_json)
+        with self.connection:
+            rows = self.connection.execute(
+                "SELECT stage, output FROM stages WHERE doc_hash = ?",
+                (doc_hash,),
+            ).fetchall()
+            self.connection.execute("DELETE FROM stages WHERE doc_hash = ?", (doc_hash,))
+        return dict(rows)
+
+    def get_manifest(self, source: str) -> t.Dict[str, t.Tuple[t.Optional[str], t.Optional[str]]]:
+        """Returns the (version, date modified) of each document processed from `source` by its
+        record locator."""
+        rows = self.connection.execute(
+            "SELECT record_locator, version, date_modified FROM manifest WHERE source = ?",
+            (source,),
+        )
+        return {
+            record_locator: (version, date_modified)
+            for record_locator, version, date_modified in rows
+        }
+
+    def update_manifest(
+        self,
+        source: str,
+        entries: t.Mapping[str, t.Tuple[t.Optional[str], t.Optional[str]]],
+    ):
+        """Records the (version, date modified) of many documents processed from `source` by
+        their record locator in a single transaction."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO manifest (source, record_locator, version, date_modified) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (source, record_locator, version, date_modified)
+                    for record_locator, (version, date_modified) in entries.items()
+                ),
+            )
+
+    def remove_from_manifest(self, source: str, record_locators: t.Iterable[str]):
+        with self.connection:
+            self.connection.executemany(
+                "DELETE FROM manifest WHERE source = ? AND record_locator = ?",
+                ((source, record_locator) for record_locator in record_locators),
+            )
+
+    def close(self):
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,223 @@
+import logging
+import multiprocessing as mp
+import queue
+import typing as t
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from unstructured.ingest.logger import ingest_log_streaming_init, logger
+from unstructured.ingest.pipeline.interfaces import (
+    PROCESS_EXECUTOR,
+    THREAD_EXECUTOR,
+    PipelineContext,
+    PipelineNode,
+    WriteNode,
+)
+
+
+@dataclass
+class StreamJob:
+    """An item being processed by a stage, done once the results of all its tasks are in."""
+
+    item: t.Any
+    results: t.List[t.Any]
+    remaining: int
+
+
+@dataclass
+class StreamStage:
+    """A node of a streaming pipeline, with the items waiting for it and the jobs it runs."""
+
+    node: PipelineNode
+    ready: t.Deque[t.Any] = field(default_factory=deque)
+    jobs: t.Dict[int, StreamJob] = field(default_factory=dict)
+    executor: t.Optional[ThreadPoolExecutor] = None
+
+    @property
+    def workers(self) -> int:
+        return self.node.get_workers()
+
+
+class StreamingRunner:
+    """Runs each document through the nodes of a pipeline as soon as it is done with the previous
+    one, starting a document only while fewer than `stream_queue_size` wait for the next node."""
+
+    def __init__(
+        self,
+        pipeline_context: PipelineContext,
+        nodes: t.List[PipelineNode],
+        write_node: t.Optional[WriteNode] = None,
+    ):
+        self.pipeline_context = pipeline_context
+        self.stages = [StreamStage(node=node) for node in nodes]
+        self.write_node = write_node
+        self.queue_size = pipeline_context.stream_queue_size or max(
+            1,
+            pipeline_context.num_processes,
+        )
+        self.events: "queue.Queue[t.Tuple[int, int, int, bool, t.Any]]" = queue.Queue()
+        self.next_job_id = 0
+
+    def run(
+        self,
+        items: t.Iterable[t.Any],
+        first_stage: t.Optional[t.Callable[[t.Any], int]] = None,
+    ) -> t.List[t.Any]:
+        """Streams `items` through the nodes and returns the outputs of the last node. Each item
+        starts at the node of index `first_stage(item)`, or at the first node by default."""
+        pending = iter(items)
+        outputs: t.List[t.Any] = []
+        write_batch: t.List[t.Any] = []
+        process_stages = [
+            stage for stage in self.stages if stage.node.get_executor_type() == PROCESS_EXECUTOR
+        ]
+        processes = max((stage.workers for stage in process_stages), default=1)
+        pool = self.pipeline_context.pool if processes > 1 else None
+        own_pool = None
+        if processes > 1 and pool is None:
+            pool = own_pool = mp.Pool(
+                processes=processes,
+                initializer=ingest_log_streaming_init,
+                initargs=(logging.DEBUG if self.pipeline_context.verbose else logging.INFO,),
+            )
+        for stage in self.stages:
+            if stage.node.get_executor_type() == THREAD_EXECUTOR:
+                stage.executor = ThreadPoolExecutor(max_workers=stage.workers)
+        try:
+            while True:
+                # Later nodes are scheduled first so that documents already in the pipeline are
+                # finished before new ones are started
+                for i in reversed(range(len(self.stages))):
+                    self.schedule(i, pool, outputs, write_batch)
+                if self.can_admit():
+                    item = next(pending, None)
+                    if item is not None:
+                        self.stages[first_stage(item) if first_stage else 0].ready.append(item)
+                        continue
+                if len(write_batch) >= self.queue_size:
+                    self.write(write_batch)
+                if not any(stage.jobs or stage.ready for stage in self.stages):
+                    break
+                self.handle_event(self.events.get(), outputs, write_batch)
+                while not self.events.empty():
+                    self.handle_event(self.events.get_nowait(), outputs, write_batch)
+        except BaseException:
+            if own_pool is not None:
+                own_pool.terminate()
+            raise
+        else:
+            if own_pool is not None:
+                own_pool.close()
+        finally:
+            for stage in self.stages:
+                if stage.executor is not None:
+                    stage.executor.shutdown()
+            if own_pool is not None:
+                own_pool.join()
+        self.write(write_batch)
+        return outputs
+
+    def can_admit(self) -> bool:
+        return len(self.stages[0].ready) < self.queue_size
+
+    def schedule(
+        self,
+        i: int,
+        pool: t.Optional[t.Any],
+        outputs: t.List[t.Any],
+        write_batch: t.List[t.Any],
+    ) -> None:
+        """Starts the documents waiting for stage `i` while it has free workers and the queue of
+        the next stage is not full."""
+        stage = self.stages[i]
+        next_stage = self.stages[i + 1] if i + 1 < len(self.stages) else None
+        while stage.ready and len(stage.jobs) < stage.workers:
+            if next_stage is not None and len(next_stage.ready) >= self.queue_size:
+                return
+            item = stage.ready.popleft()
+            tasks = stage.node.stream_tasks(item)
+            job_id = self.next_job_id
+            self.next_job_id += 1
+            job = StreamJob(item=item, results=[None] * len(tasks), remaining=len(tasks))
+            stage.jobs[job_id] = job
+            if not tasks:
+                self.finish_job(i, job_id, outputs, write_batch)
+                continue
+            for task_index, (func, arg) in enumerate(tasks):
+                self.submit(pool, i, job_id, task_index, func, arg)
+
+    def submit(
+        self,
+        pool: t.Optional[t.Any],
+        i: int,
+        job_id: int,
+        task_index: int,
+        func: t.Callable[[t.Any], t.Any],
+        arg: t.Any,
+    ) -> None:
+        executor = self.stages[i].executor
+        if executor is not None:
+            executor.submit(func, arg).add_done_callback(
+                lambda future: self.events.put(
+                    (
+                        (i, job_id, task_index, True, future.result())
+                        if future.exception() is None
+                        else (i, job_id, task_index, False, future.exception())
+                    ),
+                ),
+            )
+            return
+        if pool is None:
+            try:
+                result = func(arg)
+            except Exception as e:
+                self.events.put((i, job_id, task_index, False, e))
+            else:
+                self.events.put((i, job_id, task_index, True, result))
+            return
+        pool.apply_async(
+            func,
+            (arg,),
+            callback=lambda result: self.events.put((i, job_id, task_index, True, result)),
+            error_callback=lambda e: self.events.put((i, job_id, task_index, False, e)),
+        )
+
+    def handle_event(
+        self,
+        event: t.Tuple[int, int, int, bool, t.Any],
+        outputs: t.List[t.Any],
+        write_batch: t.List[t.Any],
+    ) -> None:
+        i, job_id, task_index, succeeded, result = event
+        if not succeeded:
+            raise result
+        job = self.stages[i].jobs[job_id]
+        job.results[task_index] = result
+        job.remaining -= 1
+        if job.remaining == 0:
+            self.finish_job(i, job_id, outputs, write_batch)
+
+    def finish_job(
+        self,
+        i: int,
+        job_id: int,
+        outputs: t.List[t.Any],
+        write_batch: t.List[t.Any],
+    ) -> None:
+        stage = self.stages[i]
+        job = stage.jobs.pop(job_id)
+        output = stage.node.stream_result(job.item, job.results)
+        if i + 1 < len(self.stages):
+            self.stages[i + 1].ready.append(output)
+        else:
+            outputs.append(output)
+            write_batch.append(output)
+
+    def write(self, write_batch: t.List[t.Any]) -> None:
+        if self.write_node is None or not write_batch:
+            write_batch.clear()
+            return
+        logger.info(f"writing {len(write_batch)} finished docs")
+        self.write_node.run(list(write_batch))
+        write_batch.clear()
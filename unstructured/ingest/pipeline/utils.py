@@ -1,8 +1,60 @@
+import dataclasses
 import hashlib
 import json
+import typing as t
+
+# Parts of the names of the config fields that hold credentials, which can change without changing
+# the documents a connector lists or writes to
+SENSITIVE_CONFIG_FIELDS = (
+    "key",
+    "secret",
+    "token",
+    "cred",
+    "password",
+    "client_id",
+    "account_name",
+)
 
 
 def get_ingest_doc_hash(doc: str) -> str:
     json_as_dict = json.loads(doc)
     hashed = hashlib.sha256(json_as_dict.get("filename").encode()).hexdigest()[:32]
     return hashed
+
+
+def get_ingest_doc_version(
+    doc: str,
+) -> t.Tuple[t.Optional[str], t.Optional[str], t.Optional[str]]:
+    """Returns the record locator of the doc as json, with the version and modification date of
+    the document on its source, all serialized with the doc when its connector listed it."""
+    json_as_dict = json.loads(doc)
+    record_locator = json_as_dict.get("record_locator")
+    if record_locator is None:
+        return None, None, None
+    # Some connectors report versions that are not strings, like fsspec checksums
+    version = json_as_dict.get("version")
+    return (
+        json.dumps(record_locator, sort_keys=True),
+        str(version) if version is not None else None,
+        json_as_dict.get("date_modified"),
+    )
+
+
+def get_config_identity(config: t.Any) -> t.Dict[str, t.Any]:
+    """Returns the plain values of the fields of a config that identify what it points to,
+    leaving out credentials, fields hidden from its repr and objects like clients or sessions."""
+    identity: t.Dict[str, t.Any] = {}
+    if not dataclasses.is_dataclass(config):
+        return identity
+    for config_field in dataclasses.fields(config):
+        name = config_field.name
+        if not config_field.repr or any(part in name.lower() for part in SENSITIVE_CONFIG_FIELDS):
+            continue
+        value = getattr(config, name, None)
+        if isinstance(value, (list, tuple)) and all(
+            isinstance(item, (str, int, float, bool)) for item in value
+        ):
+            identity[name] = list(value)
+        elif isinstance(value, (str, int, float, bool, type(None))):
+            identity[name] = value
+    return identity
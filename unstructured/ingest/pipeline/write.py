@@ -1,18 +1,52 @@
+import hashlib
+import json
 import os.path
 import typing as t
 from dataclasses import dataclass
 
 from unstructured.ingest.connector.registry import create_ingest_doc_from_json
+from unstructured.ingest.logger import logger
 from unstructured.ingest.pipeline.interfaces import WriteNode
+from unstructured.ingest.pipeline.state import WRITE_STAGE
+from unstructured.ingest.pipeline.utils import get_config_identity
 
 
 @dataclass
 class Writer(WriteNode):
     def run(self, json_paths: t.List[str]):
+        # The stage is recorded per destination, so docs are only skipped when they were already
+        # written to the same one
+        stage = f"{WRITE_STAGE}-{self.create_hash()}"
         ingest_docs = []
+        written_docs = []
         for json_path in json_paths:
             filename = os.path.basename(json_path)
             doc_hash = os.path.splitext(filename)[0]
             ingest_doc_json = self.pipeline_context.ingest_docs_map[doc_hash]
+            if (
+                not self.pipeline_context.reprocess
+                and self.pipeline_context.state.get_stage_output(ingest_doc_json, stage)
+                == json_path
+            ):
+                logger.debug(f"Already written: {json_path}, skipping write")
+                continue
             ingest_docs.append(create_ingest_doc_from_json(ingest_doc_json))
+            written_docs.append((ingest_doc_json, json_path))
+        if len(ingest_docs) < len(json_paths):
+            logger.info(
+                f"skipping {len(json_paths) - len(ingest_docs)} docs already written to the "
+                "destination, use --reprocess to write them again",
+            )
+        if not ingest_docs:
+            return
         self.dest_doc_connector.write(docs=ingest_docs)
+        for ingest_doc_json, json_path in written_docs:
+            self.pipeline_context.state.set_stage_output(ingest_doc_json, stage, json_path)
+
+    def create_hash(self) -> str:
+        hash_dict = {
+            "connector": type(self.dest_doc_connector).__name__,
+            "connector_config": get_config_identity(self.dest_doc_connector.connector_config),
+            "write_config": get_config_identity(self.dest_doc_connector.write_config),
+        }
+        return hashlib.sha256(json.dumps(hash_dict, sort_keys=True).encode()).hexdigest()[:32]
@@ -232,12 +232,16 @@ def layout_list_to_list_items(
 def set_element_hierarchy(
     elements: List[Element],
     ruleset: Dict[str, List[str]] = HIERARCHY_RULE_SET,
+    stack: Optional[List[Element]] = None,
 ) -> List[Element]:
     """Sets the parent_id for each element in the list of elements
     based on the element's category, depth and a ruleset
 
+    When a document is processed in parts, passing the same `stack` list for each part carries
+    the candidate parents from one part over to the next.
     """
-    stack: List[Element] = []
+    if stack is None:
+        stack = []
     for element in elements:
         parent_id = None
         element_category = getattr(element, "category", None)
@@ -555,77 +559,98 @@ def document_to_element_list(
 ) -> List[Element]:
     """Converts a DocumentLayout object to a list of unstructured elements."""
     elements: List[Element] = []
-    sort_mode = kwargs.get("sort_mode", SORT_MODE_XY_CUT)
 
     num_pages = len(document.pages)
     for i, page in enumerate(document.pages):
-        page_elements: List[Element] = []
+        page_elements = page_to_element_list(
+            page,
+            page_number=i + 1,
+            sortable=sortable,
+            last_modification_date=last_modification_date,
+            infer_list_items=infer_list_items,
+            source_format=source_format,
+            detection_origin=detection_origin,
+            **kwargs,
+        )
 
-        page_image_metadata = _get_page_image_metadata(page)
-        image_format = page_image_metadata.get("format")
-        image_width = page_image_metadata.get("width")
-        image_height = page_image_metadata.get("height")
+        if include_page_breaks and i < num_pages - 1:
+            page_elements.append(PageBreak(text=""))
+        elements.extend(page_elements)
 
-        for layout_element in page.elements:
-            if image_width and image_height and hasattr(layout_element, "coordinates"):
-                coordinate_system = PixelSpace(width=image_width, height=image_height)
-            else:
-                coordinate_system = None
+    return elements
 
-            element = normalize_layout_element(
-                layout_element,
-                coordinate_system=coordinate_system,
-                infer_list_items=infer_list_items,
-                source_format=source_format if source_format else "html",
-            )
-            if isinstance(element, List):
-                for el in element:
-                    if last_modification_date:
-                        el.metadata.last_modified = last_modification_date
-                    el.metadata.page_number = i + 1
-                page_elements.extend(element)
-                continue
-            else:
-                if last_modification_date:
-                    element.metadata.last_modified = last_modification_date
-                element.metadata.text_as_html = (
-                    layout_element.text_as_html if hasattr(layout_element, "text_as_html") else None
-                )
-                try:
-                    if (
-                        isinstance(element, Title) and element.metadata.category_depth is None
-                    ) and any(el.type in ["Headline", "Subheadline"] for el in page.elements):
-                        element.metadata.category_depth = 0
-                except AttributeError:
-                    logger.info("HTML element instance has no attribute type")
-
-                page_elements.append(element)
-            coordinates = (
-                element.metadata.coordinates.points if element.metadata.coordinates else None
-            )
 
-            el_image_path = (
-                layout_element.image_path if hasattr(layout_element, "image_path") else None
-            )
+def page_to_element_list(
+    page: "PageLayout",
+    page_number: int,
+    sortable: bool = False,
+    last_modification_date: Optional[str] = None,
+    infer_list_items: bool = True,
+    source_format: Optional[str] = None,
+    detection_origin: Optional[str] = None,
+    **kwargs,
+) -> List[Element]:
+    """Converts a single PageLayout object to a list of unstructured elements."""
+    page_elements: List[Element] = []
+    sort_mode = kwargs.get("sort_mode", SORT_MODE_XY_CUT)
 
-            _add_element_metadata(
-                element,
-                page_number=i + 1,
-                filetype=image_format,
-                coordinates=coordinates,
-                coordinate_system=coordinate_system,
-                category_depth=element.metadata.category_depth,
-                image_path=el_image_path,
-                detection_origin=detection_origin,
-                **kwargs,
-            )
+    page_image_metadata = _get_page_image_metadata(page)
+    image_format = page_image_metadata.get("format")
+    image_width = page_image_metadata.get("width")
+    image_height = page_image_metadata.get("height")
 
-        sorted_page_elements = page_elements
-        if sortable and sort_mode == SORT_MODE_XY_CUT:
-            sorted_page_elements = sort_page_elements(page_elements, sort_mode)
+    for layout_element in page.elements:
+        if image_width and image_height and hasattr(layout_element, "coordinates"):
+            coordinate_system = PixelSpace(width=image_width, height=image_height)
+        else:
+            coordinate_system = None
 
-        if include_page_breaks and i < num_pages - 1:
-            sorted_page_elements.append(PageBreak(text=""))
-        elements.extend(sorted_page_elements)
+        element = normalize_layout_element(
+            layout_element,
+            coordinate_system=coordinate_system,
+            infer_list_items=infer_list_items,
+            source_format=source_format if source_format else "html",
+        )
+        if isinstance(element, List):
+            for el in element:
+                if last_modification_date:
+                    el.metadata.last_modified = last_modification_date
+                el.metadata.page_number = page_number
+            page_elements.extend(element)
+            continue
+        else:
+            if last_modification_date:
+                element.metadata.last_modified = last_modification_date
+            element.metadata.text_as_html = (
+                layout_element.text_as_html if hasattr(layout_element, "text_as_html") else None
+            )
+            try:
+                if (isinstance(element, Title) and element.metadata.category_depth is None) and any(
+                    el.type in ["Headline", "Subheadline"] for el in page.elements
+                ):
+                    element.metadata.category_depth = 0
+            except AttributeError:
+                logger.info("HTML element instance has no attribute type")
+
+            page_elements.append(element)
+        coordinates = element.metadata.coordinates.points if element.metadata.coordinates else None
+
+        el_image_path = layout_element.image_path if hasattr(layout_element, "image_path") else None
+
+        _add_element_metadata(
+            element,
+            page_number=page_number,
+            filetype=image_format,
+            coordinates=coordinates,
+            coordinate_system=coordinate_system,
+            category_depth=element.metadata.category_depth,
+            image_path=el_image_path,
+            detection_origin=detection_origin,
+            **kwargs,
+        )
 
-    return elements
+    sorted_page_elements = page_elements
+    if sortable and sort_mode == SORT_MODE_XY_CUT:
+        sorted_page_elements = sort_page_elements(page_elements, sort_mode)
+
+    return sorted_page_elements
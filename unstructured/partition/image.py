@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 
 from unstructured.chunking.title import add_chunking_strategy
 from unstructured.documents.elements import Element, process_metadata
@@ -7,7 +7,7 @@ from unstructured.partition.common import exactly_one
 from unstructured.partition.lang import (
     convert_old_ocr_languages_to_languages,
 )
-from unstructured.partition.pdf import partition_pdf_or_image
+from unstructured.partition.pdf import partition_pdf_or_image, partition_pdf_or_image_iter
 
 
 @process_metadata()
@@ -22,6 +22,9 @@ def partition_image(
     strategy: str = "hi_res",
     metadata_last_modified: Optional[str] = None,
     chunking_strategy: Optional[str] = None,
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
     **kwargs,
 ) -> List[Element]:
     """Parses an image into a list of interpreted elements.
@@ -52,6 +55,13 @@ def partition_image(
         The default strategy is `hi_res`.
     metadata_last_modified
         The last modified date for the document.
+    pages
+        The (1-indexed) frames of a multi-page image (e.g. a TIFF) to partition. Defaults to
+        all frames.
+    first_page
+        The first frame to partition. Combined with `pages` if both are given.
+    last_page
+        The last frame to partition. Combined with `pages` if both are given.
     """
     exactly_one(filename=filename, file=file)
 
@@ -86,5 +96,39 @@ def partition_image(
         languages=languages,
         strategy=strategy,
         metadata_last_modified=metadata_last_modified,
+        pages=pages,
+        first_page=first_page,
+        last_page=last_page,
+        **kwargs,
+    )
+
+
+def partition_image_iter(
+    filename: str = "",
+    file: Optional[bytes] = None,
+    include_page_breaks: bool = False,
+    infer_table_structure: bool = False,
+    ocr_languages: Optional[str] = None,
+    languages: Optional[List[str]] = ["eng"],
+    strategy: str = "hi_res",
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Parses an image and yields its elements page by page.
+
+    Takes the same parameters as `partition_image` (except `chunking_strategy`) and yields the
+    same elements, but the elements of each frame of a multi-page image are yielded as soon as the
+    frame is done.
+    """
+    return partition_pdf_or_image_iter(
+        filename=filename,
+        file=file,
+        is_image=True,
+        include_page_breaks=include_page_breaks,
+        infer_table_structure=infer_table_structure,
+        ocr_languages=ocr_languages,
+        languages=languages,
+        strategy=strategy,
+        metadata_last_modified=metadata_last_modified,
         **kwargs,
     )
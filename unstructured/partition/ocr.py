@@ -1,11 +1,9 @@
+import io
 import os
-import tempfile
-from copy import deepcopy
-from typing import BinaryIO, List, Optional, Union, cast
+from copy import copy
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
-import pdf2image
-import unstructured_pytesseract
 
 # NOTE(yuming): Rename PIL.Image to avoid conflict with
 # unstructured.documents.elements.Image
@@ -20,10 +18,23 @@ from unstructured_inference.inference.layout import DocumentLayout, PageLayout
 from unstructured_inference.inference.layoutelement import (
     LayoutElement,
 )
-from unstructured_pytesseract import Output
 
 from unstructured.logger import logger
-from unstructured.partition.utils.constants import SUBREGION_THRESHOLD_FOR_OCR, OCRMode
+from unstructured.partition.utils.constants import (
+    OCR_AGENT_MODULES,
+    OCR_AGENT_PADDLE,
+    OCR_AGENT_TESSERACT,
+    SUBREGION_THRESHOLD_FOR_OCR,
+    OCRMode,
+)
+from unstructured.partition.utils.ocr_cache import (
+    get_ocr_cache,
+    text_regions_from_json,
+    text_regions_to_json,
+)
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.rendered_pages import RenderedPDFPages
+from unstructured.utils import thread_map
 
 # Force tesseract to be single threaded,
 # otherwise we see major performance problems
@@ -38,6 +49,7 @@ def process_data_with_ocr(
     ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
     pdf_image_dpi: int = 200,
+    ocr_workers: int = 1,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given data and supplement the output DocumentLayout
@@ -61,21 +73,36 @@ def process_data_with_ocr(
 
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to 200.
 
+    - ocr_workers (int, optional): The number of pages of a multi-page document, or of the
+        elements of a single page in the "individual_blocks" OCR mode, OCR'd concurrently with
+        tesseract. Defaults to 1.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
-    with tempfile.NamedTemporaryFile() as tmp_file:
-        tmp_file.write(data.read() if hasattr(data, "read") else data)
-        tmp_file.flush()
-        merged_layouts = process_file_with_ocr(
-            filename=tmp_file.name,
-            out_layout=out_layout,
-            is_image=is_image,
+    logger.warning(
+        "process_data_with_ocr will be deprecated in a future version of unstructured. "
+        "partition_pdf and partition_image OCR each page with supplement_page_layout_with_ocr.",
+    )
+    data_bytes = data.read() if hasattr(data, "read") else data
+    if is_image:
+        with PILImage.open(io.BytesIO(data_bytes)) as images:
+            return _supplement_document_layout_with_ocr(
+                out_layout,
+                _iter_image_frames(images),
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                ocr_workers=ocr_workers,
+            )
+
+    with RenderedPDFPages(file=data_bytes) as rendered_pages:
+        return _supplement_document_layout_with_ocr(
+            out_layout,
+            rendered_pages.iter_pages(dpi=pdf_image_dpi),
             ocr_languages=ocr_languages,
             ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
+            ocr_workers=ocr_workers,
         )
-        return merged_layouts
 
 
 def process_file_with_ocr(
@@ -85,6 +112,7 @@ def process_file_with_ocr(
     ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
     pdf_image_dpi: int = 200,
+    ocr_workers: int = 1,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given file and supplement the output DocumentLayout
@@ -107,44 +135,36 @@ def process_file_with_ocr(
 
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to 200.
 
+    - ocr_workers (int, optional): The number of pages of a multi-page document, or of the
+        elements of a single page in the "individual_blocks" OCR mode, OCR'd concurrently with
+        tesseract. Defaults to 1.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
-    merged_page_layouts = []
+    logger.warning(
+        "process_file_with_ocr will be deprecated in a future version of unstructured. "
+        "partition_pdf and partition_image OCR each page with supplement_page_layout_with_ocr.",
+    )
     try:
         if is_image:
             with PILImage.open(filename) as images:
-                format = images.format
-                for i, image in enumerate(ImageSequence.Iterator(images)):
-                    image = image.convert("RGB")
-                    image.format = format
-                    merged_page_layout = supplement_page_layout_with_ocr(
-                        out_layout.pages[i],
-                        image,
-                        ocr_languages=ocr_languages,
-                        ocr_mode=ocr_mode,
-                    )
-                    merged_page_layouts.append(merged_page_layout)
-                return DocumentLayout.from_pages(merged_page_layouts)
+                return _supplement_document_layout_with_ocr(
+                    out_layout,
+                    _iter_image_frames(images),
+                    ocr_languages=ocr_languages,
+                    ocr_mode=ocr_mode,
+                    ocr_workers=ocr_workers,
+                )
         else:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                _image_paths = pdf2image.convert_from_path(
-                    filename,
-                    dpi=pdf_image_dpi,
-                    output_folder=temp_dir,
-                    paths_only=True,
+            with RenderedPDFPages(filename=filename) as rendered_pages:
+                return _supplement_document_layout_with_ocr(
+                    out_layout,
+                    rendered_pages.iter_pages(dpi=pdf_image_dpi),
+                    ocr_languages=ocr_languages,
+                    ocr_mode=ocr_mode,
+                    ocr_workers=ocr_workers,
                 )
-                image_paths = cast(List[str], _image_paths)
-                for i, image_path in enumerate(image_paths):
-                    with PILImage.open(image_path) as image:
-                        merged_page_layout = supplement_page_layout_with_ocr(
-                            out_layout.pages[i],
-                            image,
-                            ocr_languages=ocr_languages,
-                            ocr_mode=ocr_mode,
-                        )
-                        merged_page_layouts.append(merged_page_layout)
-                return DocumentLayout.from_pages(merged_page_layouts)
     except Exception as e:
         if os.path.isdir(filename) or os.path.isfile(filename):
             raise e
@@ -152,27 +172,85 @@ def process_file_with_ocr(
             raise FileNotFoundError(f'File "{filename}" not found!') from e
 
 
+def _iter_image_frames(images: PILImage.Image) -> Iterator[PILImage.Image]:
+    format = images.format
+    for image in ImageSequence.Iterator(images):
+        image = image.convert("RGB")
+        image.format = format
+        yield image
+
+
+def _supplement_document_layout_with_ocr(
+    out_layout: "DocumentLayout",
+    images: Iterable[PILImage.Image],
+    ocr_languages: str = "eng",
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    ocr_workers: int = 1,
+) -> "DocumentLayout":
+    """Supplements each page of `out_layout` with the OCR of its image in `images`. With more
+    than one page, up to `ocr_workers` pages are OCR'd concurrently, and the images are only
+    taken from `images` as workers become free."""
+    page_workers = get_page_ocr_workers(len(out_layout.pages or []), ocr_workers)
+    merged_page_layouts = list(
+        thread_map(
+            lambda page: supplement_page_layout_with_ocr(
+                out_layout.pages[page[0]],
+                page[1],
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                ocr_workers=ocr_workers if page_workers <= 1 else 1,
+            ),
+            enumerate(images),
+            max_workers=page_workers,
+        ),
+    )
+    return DocumentLayout.from_pages(merged_page_layouts)
+
+
+def get_page_ocr_workers(page_count: int, ocr_workers: int = 1) -> int:
+    """Returns the number of pages of a document to OCR concurrently. Single pages are left to
+    OCR their elements concurrently instead, and paddle, which batches the text of a page on its
+    own, processes one page at a time."""
+    if page_count <= 1 or get_entire_page_ocr() == OCR_AGENT_PADDLE:
+        return 1
+    return max(1, min(ocr_workers, page_count))
+
+
+def get_entire_page_ocr() -> str:
+    """Returns the OCR agent set with the ENTIRE_PAGE_OCR environment variable: "tesseract"
+    (the default), "tesserocr", "paddle" or the import path of a custom `OCRAgent` class."""
+    entire_page_ocr = os.getenv("ENTIRE_PAGE_OCR", OCR_AGENT_TESSERACT)
+    if entire_page_ocr.lower() in OCR_AGENT_MODULES:
+        return entire_page_ocr.lower()
+    # TODO(yuming): add tests for paddle with ENTIRE_PAGE_OCR env
+    # see CORE-1886
+    if "." not in entire_page_ocr:
+        raise ValueError(
+            "Environment variable ENTIRE_PAGE_OCR must be set to "
+            f"{', '.join(repr(name) for name in OCR_AGENT_MODULES)} "
+            "or the import path of an OCRAgent class.",
+        )
+    return entire_page_ocr
+
+
 def supplement_page_layout_with_ocr(
     page_layout: "PageLayout",
     image: PILImage,
     ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
+    ocr_workers: int = 1,
 ) -> "PageLayout":
     """
     Supplement an PageLayout with OCR results depending on OCR mode.
     If mode is "entire_page", we get the OCR layout for the entire image and
     merge it with PageLayout.
     If mode is "individual_blocks", we find the elements from PageLayout
-    with no text and add text from OCR to each element.
+    with no text and add text from OCR to each element. Up to `ocr_workers` elements
+    are OCR'd concurrently with tesseract, while paddle recognizes the text of all of
+    them in one batch.
+    The OCR agent is selected with the ENTIRE_PAGE_OCR environment variable.
     """
-    entire_page_ocr = os.getenv("ENTIRE_PAGE_OCR", "tesseract").lower()
-    # TODO(yuming): add tests for paddle with ENTIRE_PAGE_OCR env
-    # see CORE-1886
-    if entire_page_ocr not in ["paddle", "tesseract"]:
-        raise ValueError(
-            "Environment variable ENTIRE_PAGE_OCR",
-            " must be set to 'tesseract' or 'paddle'.",
-        )
+    entire_page_ocr = get_entire_page_ocr()
 
     elements = page_layout.elements
     if ocr_mode == OCRMode.FULL_PAGE.value:
@@ -188,18 +266,18 @@ def supplement_page_layout_with_ocr(
         elements[:] = merged_page_layout_elements
         return page_layout
     elif ocr_mode == OCRMode.INDIVIDUAL_BLOCKS.value:
-        for element in elements:
-            if element.text == "":
-                padded_element = pad_element_bboxes(element, padding=12)
-                cropped_image = image.crop(
-                    (padded_element.x1, padded_element.y1, padded_element.x2, padded_element.y2),
-                )
-                text_from_ocr = get_ocr_text_from_image(
-                    cropped_image,
-                    ocr_languages=ocr_languages,
-                    entire_page_ocr=entire_page_ocr,
-                )
-                element.text = text_from_ocr
+        elements_without_text = [element for element in elements if element.text == ""]
+        cropped_images = [
+            image.crop(get_padded_bbox(element, padding=12)) for element in elements_without_text
+        ]
+        texts_from_ocr = get_ocr_texts_from_images(
+            cropped_images,
+            ocr_languages=ocr_languages,
+            entire_page_ocr=entire_page_ocr,
+            ocr_workers=ocr_workers,
+        )
+        for element, text_from_ocr in zip(elements_without_text, texts_from_ocr):
+            element.text = text_from_ocr
         return page_layout
     else:
         raise ValueError(
@@ -215,7 +293,7 @@ def pad_element_bboxes(
     """Increases (or decreases, if padding is negative) the size of the bounding
     boxes of the element by extending the boundary outward (resp. inward)"""
 
-    out_element = deepcopy(element)
+    out_element = copy(element)
     out_element.x1 -= padding
     out_element.x2 += padding
     out_element.y1 -= padding
@@ -223,62 +301,108 @@ def pad_element_bboxes(
     return out_element
 
 
+def get_padded_bbox(
+    element: "LayoutElement",
+    padding: Union[int, float],
+) -> Tuple[float, float, float, float]:
+    """Returns the (x1, y1, x2, y2) bounding box of the element extended outward by `padding`
+    (or inward, if padding is negative) without copying the element."""
+    return (
+        element.x1 - padding,
+        element.y1 - padding,
+        element.x2 + padding,
+        element.y2 + padding,
+    )
+
+
 def get_ocr_layout_from_image(
     image: PILImage,
     ocr_languages: str = "eng",
-    entire_page_ocr: str = "tesseract",
+    entire_page_ocr: str = OCR_AGENT_TESSERACT,
 ) -> List[TextRegion]:
     """
-    Get the OCR layout from image as a list of text regions with paddle or tesseract.
+    Get the OCR layout from image as a list of text regions with the `entire_page_ocr` OCR
+    agent. If an OCR cache is configured, the layout of an identical image is read from the
+    cache instead.
     """
-    if entire_page_ocr == "paddle":
-        logger.info("Processing entrie page OCR with paddle...")
-        from unstructured.partition.utils.ocr_models import paddle_ocr
-
-        # TODO(yuming): pass in language parameter once we
-        # have the mapping for paddle lang code
-        # see CORE-2034
-        ocr_data = paddle_ocr.load_agent().ocr(np.array(image), cls=True)
-        ocr_layout = parse_ocr_data_paddle(ocr_data)
-    else:
-        ocr_data = unstructured_pytesseract.image_to_data(
-            np.array(image),
-            lang=ocr_languages,
-            output_type=Output.DICT,
-        )
-        ocr_layout = parse_ocr_data_tesseract(ocr_data)
+    ocr_cache = get_ocr_cache()
+    if ocr_cache is not None:
+        cache_key = ocr_cache.make_key(image, ocr_languages, entire_page_ocr, "layout")
+        cached_layout = ocr_cache.get(cache_key)
+        if cached_layout is not None:
+            return text_regions_from_json(cached_layout)
+
+    ocr_agent = OCRAgent.get_agent(entire_page_ocr)
+    ocr_layout = ocr_agent.get_layout_from_image(image, ocr_languages=ocr_languages)
+
+    if ocr_cache is not None:
+        ocr_cache.set(cache_key, text_regions_to_json(ocr_layout))
     return ocr_layout
 
 
 def get_ocr_text_from_image(
     image: PILImage,
     ocr_languages: str = "eng",
-    entire_page_ocr: str = "tesseract",
+    entire_page_ocr: str = OCR_AGENT_TESSERACT,
 ) -> str:
     """
-    Get the OCR text from image as a string with paddle or tesseract.
+    Get the OCR text from image as a string with the `entire_page_ocr` OCR agent. If an OCR
+    cache is configured, the text of an identical image is read from the cache instead.
     """
-    if entire_page_ocr == "paddle":
-        logger.info("Processing entrie page OCR with paddle...")
-        from unstructured.partition.utils.ocr_models import paddle_ocr
-
-        # TODO(yuming): pass in language parameter once we
-        # have the mapping for paddle lang code
-        # see CORE-2034
-        ocr_data = paddle_ocr.load_agent().ocr(np.array(image), cls=True)
-        ocr_layout = parse_ocr_data_paddle(ocr_data)
-        text_from_ocr = ""
-        for text_region in ocr_layout:
-            text_from_ocr += text_region.text
-    else:
-        text_from_ocr = unstructured_pytesseract.image_to_string(
-            np.array(image),
-            lang=ocr_languages,
-            output_type=Output.DICT,
-        )["text"]
+    ocr_cache = get_ocr_cache()
+    if ocr_cache is not None:
+        cache_key = ocr_cache.make_key(image, ocr_languages, entire_page_ocr, "text")
+        cached_text = ocr_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+
+    ocr_agent = OCRAgent.get_agent(entire_page_ocr)
+    text_from_ocr = ocr_agent.get_text_from_image(image, ocr_languages=ocr_languages)
+
+    if ocr_cache is not None:
+        ocr_cache.set(cache_key, text_from_ocr)
     return text_from_ocr
 
 
+def get_ocr_texts_from_images(
+    images: List[PILImage.Image],
+    ocr_languages: str = "eng",
+    entire_page_ocr: str = OCR_AGENT_TESSERACT,
+    ocr_workers: int = 1,
+) -> List[str]:
+    """
+    Get the OCR text of each image with the `entire_page_ocr` OCR agent. Tesseract runs on up
+    to `ocr_workers` images at a time, while paddle detects the text lines of each image and
+    then recognizes the lines of all the images in one batched call. If an OCR cache is
+    configured, only the images that are not in the cache are OCR'd.
+    """
+    if not images:
+        return []
+
+    texts: List[Optional[str]] = [None] * len(images)
+    ocr_cache = get_ocr_cache()
+    cache_keys: List[str] = []
+    if ocr_cache is not None:
+        cache_keys = [
+            ocr_cache.make_key(image, ocr_languages, entire_page_ocr, "text") for image in images
+        ]
+        texts = [ocr_cache.get(cache_key) for cache_key in cache_keys]
+
+    uncached = [i for i, text in enumerate(texts) if text is None]
+    if uncached:
+        ocr_agent = OCRAgent.get_agent(entire_page_ocr)
+        uncached_texts = ocr_agent.get_texts_from_images(
+            [images[i] for i in uncached],
+            ocr_languages=ocr_languages,
+            ocr_workers=ocr_workers,
+        )
+        for i, text in zip(uncached, uncached_texts):
+            texts[i] = text
+            if ocr_cache is not None:
+                ocr_cache.set(cache_keys[i], text)
+    return cast(List[str], texts)
+
+
 def parse_ocr_data_tesseract(ocr_data: dict) -> List[TextRegion]:
     """
     Parse the OCR result data to extract a list of TextRegion objects from
@@ -305,13 +429,13 @@ def parse_ocr_data_tesseract(ocr_data: dict) -> List[TextRegion]:
     levels = ocr_data["level"]
     text_regions = []
     for i, level in enumerate(levels):
-        (l, t, w, h) = (
+        l, t, w, h = (
             ocr_data["left"][i],
             ocr_data["top"][i],
             ocr_data["width"][i],
             ocr_data["height"][i],
         )
-        (x1, y1, x2, y2) = l, t, l + w, t + h
+        x1, y1, x2, y2 = l, t, l + w, t + h
         text = ocr_data["text"][i]
         if text:
             text_region = TextRegion(x1, y1, x2, y2, text=text, source="OCR-tesseract")
@@ -372,12 +496,13 @@ def merge_out_layout_with_ocr_layout(
 
     out_regions_without_text = [region for region in out_layout if not region.text]
 
-    for out_region in out_regions_without_text:
-        out_region.text = aggregate_ocr_text_by_block(
-            ocr_layout,
-            out_region,
-            SUBREGION_THRESHOLD_FOR_OCR,
-        )
+    is_subregion = almost_subregion_matrix(
+        ocr_layout,
+        out_regions_without_text,
+        SUBREGION_THRESHOLD_FOR_OCR,
+    )
+    for j, out_region in enumerate(out_regions_without_text):
+        out_region.text = _join_ocr_text(ocr_layout, is_subregion[:, j])
 
     final_layout = (
         supplement_layout_with_ocr_elements(out_layout, ocr_layout)
@@ -396,16 +521,12 @@ def aggregate_ocr_text_by_block(
     """Extracts the text aggregated from the regions of the ocr layout that lie within the given
     block."""
 
-    extracted_texts = []
+    is_subregion = almost_subregion_matrix(ocr_layout, [region], subregion_threshold)
+    return _join_ocr_text(ocr_layout, is_subregion[:, 0])
 
-    for ocr_region in ocr_layout:
-        ocr_region_is_subregion_of_given_region = ocr_region.is_almost_subregion_of(
-            region,
-            subregion_threshold=subregion_threshold,
-        )
-        if ocr_region_is_subregion_of_given_region and ocr_region.text:
-            extracted_texts.append(ocr_region.text)
 
+def _join_ocr_text(ocr_layout: List[TextRegion], mask: np.ndarray) -> str:
+    extracted_texts = [ocr_layout[i].text for i in np.flatnonzero(mask) if ocr_layout[i].text]
     return " ".join(extracted_texts) if extracted_texts else ""
 
 
@@ -432,25 +553,23 @@ def supplement_layout_with_ocr_elements(
                            elements and the new OCR-derived elements.
 
     Note:
-    - The function relies on `is_almost_subregion_of()` method to determine if an OCR region
-      is a subregion of an existing layout element.
+    - The function relies on `almost_subregion_matrix()` to determine, for all pairs at once,
+      if an OCR region is a subregion of an existing layout element.
     - It also relies on `get_elements_from_ocr_regions()` to convert OCR regions to layout elements.
     - The `SUBREGION_THRESHOLD_FOR_OCR` constant is used to specify the subregion matching
      threshold.
     """
 
-    ocr_regions_to_remove = []
-    for ocr_region in ocr_layout:
-        for el in layout:
-            ocr_region_is_subregion_of_out_el = ocr_region.is_almost_subregion_of(
-                cast(Rectangle, el),
-                SUBREGION_THRESHOLD_FOR_OCR,
-            )
-            if ocr_region_is_subregion_of_out_el:
-                ocr_regions_to_remove.append(ocr_region)
-                break
-
-    ocr_regions_to_add = [region for region in ocr_layout if region not in ocr_regions_to_remove]
+    is_subregion_of_out_el = almost_subregion_matrix(
+        ocr_layout,
+        cast(List[Rectangle], layout),
+        SUBREGION_THRESHOLD_FOR_OCR,
+    ).any(axis=1)
+    ocr_regions_to_add = [
+        region
+        for region, is_subregion in zip(ocr_layout, is_subregion_of_out_el)
+        if not is_subregion
+    ]
     if ocr_regions_to_add:
         ocr_elements_to_add = get_elements_from_ocr_regions(ocr_regions_to_add)
         final_layout = layout + ocr_elements_to_add
@@ -460,6 +579,62 @@ def supplement_layout_with_ocr_elements(
     return final_layout
 
 
+def almost_subregion_matrix(
+    regions: Sequence[Rectangle],
+    others: Sequence[Rectangle],
+    subregion_threshold: float,
+    max_cells: int = 2**22,
+) -> np.ndarray:
+    """
+    Returns a boolean matrix of shape (len(regions), len(others)) whose [i, j] entry is
+    `regions[i].is_almost_subregion_of(others[j], subregion_threshold)`.
+
+    The bounding boxes are compared with NumPy broadcasting instead of one Python call per pair.
+    `regions` are processed in blocks of rows so that no intermediate array has more than
+    `max_cells` entries.
+    """
+    boxes = _bboxes_to_array(regions)
+    other_boxes = _bboxes_to_array(others)
+    matrix = np.zeros((len(boxes), len(other_boxes)), dtype=bool)
+    if matrix.size == 0:
+        return matrix
+
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    other_areas = (other_boxes[:, 2] - other_boxes[:, 0]) * (other_boxes[:, 3] - other_boxes[:, 1])
+    rows_per_block = max(1, max_cells // len(other_boxes))
+    for start in range(0, len(boxes), rows_per_block):
+        block = boxes[start : start + rows_per_block, None, :]  # noqa: E203
+        block_areas = areas[start : start + rows_per_block, None]  # noqa: E203
+        intersection_widths = np.clip(
+            np.minimum(block[..., 2], other_boxes[:, 2])
+            - np.maximum(block[..., 0], other_boxes[:, 0]),
+            0,
+            None,
+        )
+        intersection_heights = np.clip(
+            np.minimum(block[..., 3], other_boxes[:, 3])
+            - np.maximum(block[..., 1], other_boxes[:, 1]),
+            0,
+            None,
+        )
+        # The same guard against zero-area regions as `safe_division`
+        intersection_ratios = (intersection_widths * intersection_heights) / np.maximum(
+            block_areas,
+            np.finfo(float).eps,
+        )
+        matrix[start : start + rows_per_block] = (  # noqa: E203
+            intersection_ratios > subregion_threshold
+        ) & (block_areas <= other_areas)
+    return matrix
+
+
+def _bboxes_to_array(regions: Sequence[Rectangle]) -> np.ndarray:
+    return np.array(
+        [[region.x1, region.y1, region.x2, region.y2] for region in regions],
+        dtype=float,
+    ).reshape(-1, 4)
+
+
 def get_elements_from_ocr_regions(ocr_regions: List[TextRegion]) -> List[LayoutElement]:
     """
     Get layout elements from OCR regions
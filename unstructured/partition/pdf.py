@@ -1,13 +1,30 @@
 import contextlib
+import functools
+import heapq
 import io
+import multiprocessing as mp
 import os
+import random
 import re
 import warnings
 from tempfile import SpooledTemporaryFile
-from typing import IO, Any, BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
-import pdf2image
 import PIL
 from pdfminer.converter import PDFPageAggregator, PDFResourceManager
 from pdfminer.layout import (
@@ -16,12 +33,15 @@ from pdfminer.layout import (
     LTContainer,
     LTImage,
     LTItem,
+    LTPage,
     LTTextBox,
 )
+from pdfminer.pdfdevice import PDFDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
 from pdfminer.pdfinterp import PDFPageInterpreter
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdftypes import PDFObjRef
-from pdfminer.utils import open_filename
+from PIL import ImageSequence
 
 from unstructured.chunking.title import add_chunking_strategy
 from unstructured.cleaners.core import (
@@ -38,20 +58,25 @@ from unstructured.documents.elements import (
     ListItem,
     PageBreak,
     Text,
+    _add_regex_metadata,
     process_metadata,
 )
 from unstructured.file_utils.filetype import (
+    FILETYPE_TO_MIMETYPE,
     FileType,
     add_metadata_with_filetype,
 )
 from unstructured.logger import logger, trace_logger
 from unstructured.nlp.patterns import PARAGRAPH_PATTERN
 from unstructured.partition.common import (
+    _add_element_metadata,
+    _remove_element_metadata,
     convert_to_bytes,
-    document_to_element_list,
     exactly_one,
     get_last_modified_date,
     get_last_modified_date_from_file,
+    page_to_element_list,
+    set_element_hierarchy,
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.lang import (
@@ -60,12 +85,39 @@ from unstructured.partition.lang import (
 )
 from unstructured.partition.strategies import determine_pdf_or_image_strategy
 from unstructured.partition.text import element_from_text, partition_text
-from unstructured.partition.utils.constants import SORT_MODE_BASIC, SORT_MODE_XY_CUT, OCRMode
+from unstructured.partition.utils.checkpoint import PageCheckpoint, get_page_checkpoint
+from unstructured.partition.utils.constants import (
+    OCR_AGENT_TESSERACT,
+    OCR_AGENT_TESSEROCR,
+    PAGE_IMAGE_MAX_PIXELS,
+    PDF_HYBRID_MIN_TEXT_CHARS,
+    PDF_RENDER_CHUNK_MAX_PIXELS,
+    PDF_TEXT_BACKEND_LIGHT,
+    PDF_TEXT_BACKEND_PDFMINER,
+    PDF_TEXT_PROBE_FIRST_PAGES,
+    PDF_TEXT_PROBE_RANDOM_PAGES,
+    SORT_MODE_BASIC,
+    SORT_MODE_XY_CUT,
+    OCRMode,
+)
+from unstructured.partition.utils.ocr_cache import get_ocr_cache
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.rendered_pages import RenderedPDFPages
+from unstructured.partition.utils.resolution import (
+    downscale_image,
+    get_page_dpi,
+    get_page_pixels,
+    get_pdf_page_sizes,
+    rescale_element_coordinates,
+)
 from unstructured.partition.utils.sorting import (
     coord_has_valid_points,
     sort_page_elements,
 )
-from unstructured.utils import requires_dependencies
+from unstructured.utils import requires_dependencies, thread_map
+
+if TYPE_CHECKING:
+    from unstructured_inference.inference.elements import TextRegion
 
 RE_MULTISPACE_INCLUDING_NEWLINES = re.compile(pattern=r"\s+", flags=re.DOTALL)
 
@@ -95,6 +147,9 @@ def partition_pdf(
     metadata_last_modified: Optional[str] = None,
     chunking_strategy: Optional[str] = None,
     links: Sequence[Link] = [],
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
     **kwargs,
 ) -> List[Element]:
     """Parses a pdf document into a list of interpreted elements.
@@ -106,12 +161,15 @@ def partition_pdf(
         A file-like object as bytes --> open(filename, "rb").
     strategy
         The strategy to use for partitioning the PDF. Valid strategies are "hi_res",
-        "ocr_only", and "fast". When using the "hi_res" strategy, the function uses
+        "ocr_only", "fast" and "hybrid". When using the "hi_res" strategy, the function uses
         a layout detection model to identify document elements. When using the
         "ocr_only" strategy, partition_pdf simply extracts the text from the
         document using OCR and processes it. If the "fast" strategy is used, the text
-        is extracted directly from the PDF. The default strategy `auto` will determine
-        when a page can be extracted using `fast` mode, otherwise it will fall back to `hi_res`.
+        is extracted directly from the PDF. The "hybrid" strategy decides page by page:
+        pages with a text layer are extracted as with "fast" and the other pages are
+        processed as a scanned document would be with "auto". The default strategy `auto`
+        will determine when a page can be extracted using `fast` mode, otherwise it will
+        fall back to `hi_res`.
     infer_table_structure
         Only applicable if `strategy=hi_res`.
         If True, any Table elements that are extracted will also have a metadata field
@@ -130,6 +188,13 @@ def partition_pdf(
         processing text/plain content.
     metadata_last_modified
         The last modified date for the document.
+    pages
+        The (1-indexed) page numbers to partition. The other pages are never extracted,
+        rendered or OCR'd. Defaults to all pages.
+    first_page
+        The first page to partition. Combined with `pages` if both are given.
+    last_page
+        The last page to partition. Combined with `pages` if both are given.
     """
     exactly_one(filename=filename, file=file)
 
@@ -159,15 +224,199 @@ def partition_pdf(
         max_partition=max_partition,
         min_partition=min_partition,
         metadata_last_modified=metadata_last_modified,
+        pages=pages,
+        first_page=first_page,
+        last_page=last_page,
         **kwargs,
     )
 
 
+def partition_pdf_iter(
+    filename: str = "",
+    file: Optional[Union[BinaryIO, SpooledTemporaryFile]] = None,
+    include_page_breaks: bool = False,
+    strategy: str = "auto",
+    infer_table_structure: bool = False,
+    ocr_languages: Optional[str] = None,
+    languages: List[str] = ["eng"],
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    include_metadata: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Element]:
+    """Parses a pdf document and yields its elements page by page.
+
+    Takes the same parameters as `partition_pdf` (except `chunking_strategy`) and yields the same
+    elements, but each page's elements are yielded as soon as the page is done and the page's
+    images and layout objects are released afterwards, so that memory use stays bounded no matter
+    how many pages the document has. See `partition_pdf_or_image_iter` for how the strategy is
+    resolved.
+    """
+    return partition_pdf_or_image_iter(
+        filename=filename,
+        file=file,
+        include_page_breaks=include_page_breaks,
+        strategy=strategy,
+        infer_table_structure=infer_table_structure,
+        ocr_languages=ocr_languages,
+        languages=languages,
+        max_partition=max_partition,
+        min_partition=min_partition,
+        include_metadata=include_metadata,
+        metadata_filename=metadata_filename,
+        metadata_last_modified=metadata_last_modified,
+        **kwargs,
+    )
+
+
+class PDFTextCountDevice(PDFDevice):
+    """A pdfminer device that only counts the non-whitespace characters drawn on a page.
+
+    No layout objects are built, which makes it much cheaper than a `PDFPageAggregator` when all
+    that is needed is whether a page has a text layer.
+    """
+
+    def __init__(self, rsrcmgr: PDFResourceManager):
+        super().__init__(rsrcmgr)
+        self.char_count = 0
+
+    def render_string(self, textstate, seq, ncs, graphicstate):
+        font = textstate.font
+        for obj in seq:
+            if not isinstance(obj, bytes):
+                continue
+            for cid in font.decode(obj):
+                try:
+                    char = font.to_unichr(cid)
+                except PDFUnicodeNotDefined:
+                    # pdfminer renders these as "(cid:<n>)", which the full extraction also treats
+                    # as text
+                    self.char_count += 1
+                    continue
+                if char.strip():
+                    self.char_count += 1
+
+
+class PDFMinerDocument:
+    """A PDF parsed by pdfminer at most once per partitioning call.
+
+    Page objects, page sizes and text layer character counts are computed the first time they are
+    requested and cached, so that strategy detection, pdfminer extraction and the image based
+    strategies can share a single parse of the file instead of each opening it again. Page layouts
+    are not cached: each one is released as soon as the elements of its page are built.
+    """
+
+    def __init__(
+        self,
+        filename: str = "",
+        file: Optional[Union[bytes, IO[bytes]]] = None,
+    ):
+        exactly_one(filename=filename, file=file)
+        if isinstance(file, bytes):
+            file = io.BytesIO(file)
+        self.filename = filename
+        self.file = file
+        self._fp: Optional[BinaryIO] = None
+        self._pages: Optional[List[PDFPage]] = None
+        self._page_char_counts: Dict[int, int] = {}
+        self._rsrcmgr = PDFResourceManager()
+
+    def __enter__(self) -> "PDFMinerDocument":
+        return self
+
+    def __exit__(self, *args: Any):
+        self.close()
+
+    def close(self):
+        """Releases the parsed pages and closes the file if it was opened from a filename."""
+        if self._fp is not None and self.filename:
+            self._fp.close()
+        self._fp = None
+        self._pages = None
+
+    @property
+    def pages(self) -> List[PDFPage]:
+        if self._pages is None:
+            if self.filename:
+                self._fp = cast(BinaryIO, open(self.filename, "rb"))  # noqa: SIM115
+            else:
+                self._fp = cast(BinaryIO, self.file)
+                self._fp.seek(0)
+            self._pages = list(PDFPage.get_pages(self._fp))  # type: ignore
+        return self._pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def page_size(self, index: int) -> Tuple[float, float]:
+        """Returns the (width, height) of the zero-indexed page in PDF points."""
+        x1, y1, x2, y2 = self.pages[index].mediabox
+        return abs(x2 - x1), abs(y2 - y1)
+
+    @property
+    def page_sizes(self) -> List[Tuple[float, float]]:
+        return [self.page_size(i) for i in range(self.page_count)]
+
+    def page_layout(self, index: int) -> LTPage:
+        """Runs layout analysis on the zero-indexed page and returns its pdfminer layout, which
+        is not kept by the document."""
+        device = PDFPageAggregator(self._rsrcmgr, laparams=LAParams())
+        PDFPageInterpreter(self._rsrcmgr, device).process_page(self.pages[index])
+        return device.get_result()
+
+    def page_char_count(self, index: int) -> int:
+        """Returns the number of non-whitespace characters in the text layer of the zero-indexed
+        page, counted without layout analysis."""
+        if index not in self._page_char_counts:
+            device = PDFTextCountDevice(self._rsrcmgr)
+            PDFPageInterpreter(self._rsrcmgr, device).process_page(self.pages[index])
+            self._page_char_counts[index] = device.char_count
+        return self._page_char_counts[index]
+
+
+def get_text_probe_page_indices(
+    page_count: int,
+    first_pages: int = PDF_TEXT_PROBE_FIRST_PAGES,
+    random_pages: int = PDF_TEXT_PROBE_RANDOM_PAGES,
+) -> List[int]:
+    """Returns the sorted zero-indexed pages sampled by the text extractability probe: the first
+    `first_pages` pages plus up to `random_pages` pages drawn from the rest of the document. The
+    draw is seeded with the page count so a document is always probed on the same pages."""
+    sampled = list(range(min(first_pages, page_count)))
+    remaining = range(len(sampled), page_count)
+    sampled.extend(random.Random(page_count).sample(remaining, min(random_pages, len(remaining))))
+    return sorted(sampled)
+
+
+def probe_pdf_text_extractable(
+    pdf_document: PDFMinerDocument,
+    first_pages: int = PDF_TEXT_PROBE_FIRST_PAGES,
+    random_pages: int = PDF_TEXT_PROBE_RANDOM_PAGES,
+    page_numbers: Optional[Sequence[int]] = None,
+) -> bool:
+    """Cheaply determines whether the PDF has extractable text by counting the text layer
+    characters on a sample of its pages (or of the 1-indexed `page_numbers`), without building
+    any elements."""
+    page_indices = (
+        [page_number - 1 for page_number in page_numbers]
+        if page_numbers is not None
+        else list(range(pdf_document.page_count))
+    )
+    for i in get_text_probe_page_indices(len(page_indices), first_pages, random_pages):
+        if pdf_document.page_char_count(page_indices[i]):
+            return True
+    return False
+
+
 def extractable_elements(
     filename: str = "",
     file: Optional[Union[bytes, IO[bytes]]] = None,
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
+    pdf_document: Optional[PDFMinerDocument] = None,
     **kwargs: Any,
 ):
     if isinstance(file, bytes):
@@ -177,6 +426,7 @@ def extractable_elements(
         file=file,
         include_page_breaks=include_page_breaks,
         metadata_last_modified=metadata_last_modified,
+        pdf_document=pdf_document,
         **kwargs,
     )
 
@@ -205,14 +455,580 @@ def partition_pdf_or_image(
     max_partition: Optional[int] = 1500,
     min_partition: Optional[int] = 0,
     metadata_last_modified: Optional[str] = None,
+    text_probe_first_pages: int = PDF_TEXT_PROBE_FIRST_PAGES,
+    text_probe_random_pages: int = PDF_TEXT_PROBE_RANDOM_PAGES,
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+    hybrid_min_text_chars: int = PDF_HYBRID_MIN_TEXT_CHARS,
     **kwargs,
 ) -> List[Element]:
-    """Parses a pdf or image document into a list of interpreted elements."""
+    """Parses a pdf or image document into a list of interpreted elements.
+
+    With the "auto" strategy, whether the text of a PDF is extractable is decided by probing the
+    text layer of the first `text_probe_first_pages` pages and `text_probe_random_pages` other
+    pages before any elements are built. Set both to 0 to decide from a full extraction instead.
+
+    `pages`, `first_page` and `last_page` restrict partitioning to a subset of the (1-indexed)
+    pages of a PDF or multi-page image; the pages that are not selected are never extracted,
+    rendered or OCR'd.
+
+    With the "hybrid" strategy, the pages of a PDF with at least `hybrid_min_text_chars`
+    characters in their text layer are extracted with pdfminer and only the other pages are
+    rendered and OCR'd (or sent to the layout model if `infer_table_structure` is True).
+
+    Passing `pdf_text_backend="light"` extracts the text of PDFs for the "fast" strategy with
+    pypdfium2 instead of pdfminer's layout analysis. This is several times faster, but the
+    elements are lines of text with page numbers only: no coordinates, links or reading order
+    sorting. Other backends can be added with `register_pdf_text_backend`.
+
+    For the "hi_res" and "ocr_only" strategies, page images are kept within `max_image_pixels`
+    pixels (`PAGE_IMAGE_MAX_PIXELS` by default, None for no limit): oversized PDF pages are
+    rendered at a lower DPI and large images are downscaled before layout detection and OCR. The
+    coordinates of the elements are mapped back to the page at the requested DPI, or to the
+    original image.
+
+    Passing `checkpoint_dir` (or setting the UNSTRUCTURED_PAGE_CHECKPOINT_DIR environment
+    variable) saves the elements of each page partitioned with the "hi_res" or "ocr_only"
+    strategy to that directory as soon as the page is done. If the call is interrupted, running
+    it again on the same document with the same options resumes from the completed pages.
+    """
     # TODO(alan): Extract information about the filetype to be processed from the template
     # route. Decoding the routing should probably be handled by a single function designed for
     # that task so as routing design changes, those changes are implemented in a single
     # function.
 
+    languages = _check_languages(languages, ocr_languages)
+
+    last_modification_date = get_the_last_modification_date_pdf_or_img(
+        file=file,
+        filename=filename,
+    )
+
+    # The text of the PDF is assumed to be extractable at first. The pdfminer pass only runs when
+    # the strategy could resolve to "fast", and its output is what the "fast" strategy returns, so
+    # no extraction work is thrown away for the "hi_res" or "ocr_only" paths.
+    requested_strategy = strategy
+    strategy = determine_pdf_or_image_strategy(
+        requested_strategy,
+        filename=filename,
+        file=file,
+        is_image=is_image,
+        infer_table_structure=infer_table_structure,
+    )
+
+    pdf_document: Optional[PDFMinerDocument] = None
+    page_selected = pages is not None or first_page is not None or last_page is not None
+    if not is_image and (strategy in ("fast", "hybrid") or page_selected):
+        pdf_document = PDFMinerDocument(filename=filename, file=spooled_to_bytes_io_if_needed(file))
+
+    try:
+        page_numbers: Optional[List[int]] = None
+        if page_selected:
+            page_numbers = _get_selected_page_numbers(
+                filename=filename,
+                file=file,
+                pdf_document=pdf_document,
+                pages=pages,
+                first_page=first_page,
+                last_page=last_page,
+            )
+            if page_numbers == []:
+                return []
+
+        if pdf_document is not None and strategy == "fast":
+            pdf_text_extractable = True
+            if requested_strategy == "auto" and (text_probe_first_pages or text_probe_random_pages):
+                pdf_text_extractable = probe_pdf_text_extractable(
+                    pdf_document,
+                    first_pages=text_probe_first_pages,
+                    random_pages=text_probe_random_pages,
+                    page_numbers=page_numbers,
+                )
+            if pdf_text_extractable:
+                extracted_elements = extractable_elements(
+                    filename=filename,
+                    file=pdf_document.file,
+                    include_page_breaks=include_page_breaks,
+                    metadata_last_modified=metadata_last_modified or last_modification_date,
+                    pdf_document=pdf_document,
+                    page_numbers=page_numbers,
+                    **kwargs,
+                )
+                pdf_text_extractable = any(
+                    isinstance(el, Text) and el.text.strip() for el in extracted_elements
+                )
+            if not pdf_text_extractable:
+                strategy = determine_pdf_or_image_strategy(
+                    requested_strategy,
+                    filename=filename,
+                    file=file,
+                    is_image=is_image,
+                    infer_table_structure=infer_table_structure,
+                    pdf_text_extractable=pdf_text_extractable,
+                )
+        if pdf_document is not None and strategy not in ("ocr_only", "hybrid"):
+            # The image based strategies do not need the parsed PDF
+            pdf_document.close()
+
+        if strategy == "hi_res":
+            # NOTE(robinson): Catches a UserWarning that occurs when detectron is called
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                _layout_elements = _partition_pdf_or_image_local(
+                    filename=filename,
+                    file=spooled_to_bytes_io_if_needed(file),
+                    is_image=is_image,
+                    infer_table_structure=infer_table_structure,
+                    include_page_breaks=include_page_breaks,
+                    languages=languages,
+                    metadata_last_modified=metadata_last_modified or last_modification_date,
+                    page_numbers=page_numbers,
+                    **kwargs,
+                )
+                layout_elements = _reclassify_uncategorized_text(_layout_elements)
+
+        elif strategy == "fast":
+            return extracted_elements
+
+        elif strategy == "hybrid":
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                pdf_document = cast(PDFMinerDocument, pdf_document)
+                return [
+                    element
+                    for page_elements in _iter_hybrid_pages(
+                        pdf_document=pdf_document,
+                        filename=filename,
+                        file=pdf_document.file,
+                        include_page_breaks=include_page_breaks,
+                        infer_table_structure=infer_table_structure,
+                        languages=languages,
+                        max_partition=max_partition,
+                        min_partition=min_partition,
+                        metadata_last_modified=metadata_last_modified or last_modification_date,
+                        page_numbers=page_numbers,
+                        min_text_chars=hybrid_min_text_chars,
+                        **kwargs,
+                    )
+                    for element in page_elements
+                ]
+
+        elif strategy == "ocr_only":
+            # NOTE(robinson): Catches file conversion warnings when running with PDFs
+            with warnings.catch_warnings():
+                return _partition_pdf_or_image_with_ocr(
+                    filename=filename,
+                    file=file,
+                    include_page_breaks=include_page_breaks,
+                    languages=languages,
+                    is_image=is_image,
+                    max_partition=max_partition,
+                    min_partition=min_partition,
+                    metadata_last_modified=metadata_last_modified or last_modification_date,
+                    pdf_document=pdf_document,
+                    ocr_workers=kwargs.get("ocr_workers", 1),
+                    max_image_pixels=kwargs.get("max_image_pixels", PAGE_IMAGE_MAX_PIXELS),
+                    checkpoint_dir=kwargs.get("checkpoint_dir"),
+                    page_numbers=page_numbers,
+                )
+
+        return layout_elements
+    finally:
+        if pdf_document is not None:
+            pdf_document.close()
+
+
+def select_page_numbers(
+    page_count: int,
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> List[int]:
+    """Returns the sorted 1-indexed page numbers of a document with `page_count` pages that are
+    listed in `pages` (all pages if not given) and fall between `first_page` and `last_page`."""
+    first_page = max(first_page or 1, 1)
+    last_page = min(last_page or page_count, page_count)
+    if pages is None:
+        return list(range(first_page, last_page + 1))
+    return sorted({page_number for page_number in pages if first_page <= page_number <= last_page})
+
+
+def _get_selected_page_numbers(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes], SpooledTemporaryFile]] = None,
+    pdf_document: Optional[PDFMinerDocument] = None,
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+) -> Optional[List[int]]:
+    """Returns the 1-indexed page numbers selected from a PDF (when `pdf_document` is given) or
+    a multi-page image, or None when the selection covers every page."""
+    page_count = (
+        pdf_document.page_count
+        if pdf_document is not None
+        else get_image_frame_count(filename=filename, file=file)
+    )
+    page_numbers = select_page_numbers(page_count, pages, first_page, last_page)
+    return None if len(page_numbers) == page_count else page_numbers
+
+
+def get_image_frame_count(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes], SpooledTemporaryFile]] = None,
+) -> int:
+    """Returns the number of frames (pages) of an image file."""
+    image_file = io.BytesIO(convert_to_bytes(file)) if file is not None else filename
+    with PIL.Image.open(image_file) as image:
+        return getattr(image, "n_frames", 1)
+
+
+@requires_dependencies("pypdfium2", extras="pdf")
+def get_pdf_page_count(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes], SpooledTemporaryFile]] = None,
+) -> int:
+    """Returns the number of pages of a PDF, without parsing the content of the pages."""
+    import pypdfium2
+
+    source = convert_to_bytes(file) if file is not None else filename
+    with contextlib.closing(pypdfium2.PdfDocument(source)) as pdf:
+        return len(pdf)
+
+
+def determine_pdf_strategy(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes]]] = None,
+    strategy: str = "auto",
+    infer_table_structure: bool = False,
+    text_probe_first_pages: int = PDF_TEXT_PROBE_FIRST_PAGES,
+    text_probe_random_pages: int = PDF_TEXT_PROBE_RANDOM_PAGES,
+) -> str:
+    """Returns the strategy `strategy` resolves to for the whole PDF, probing its text layer as
+    `partition_pdf` does. Page ranges of a document partitioned separately are given this strategy,
+    since "auto" would otherwise only probe the pages of each range."""
+    pdf_text_extractable = True
+    if strategy == "auto":
+        with PDFMinerDocument(filename=filename, file=file) as pdf_document:
+            if not (text_probe_first_pages or text_probe_random_pages):
+                text_probe_first_pages = pdf_document.page_count
+            pdf_text_extractable = probe_pdf_text_extractable(
+                pdf_document,
+                first_pages=text_probe_first_pages,
+                random_pages=text_probe_random_pages,
+            )
+    return determine_pdf_or_image_strategy(
+        strategy,
+        infer_table_structure=infer_table_structure,
+        pdf_text_extractable=pdf_text_extractable,
+    )
+
+
+def _reclassify_uncategorized_text(elements: List[Element]) -> List[Element]:
+    """Re-derives the element type of text the layout model left uncategorized."""
+    reclassified_elements = []
+    for el in elements:
+        if hasattr(el, "category") and el.category == "UncategorizedText":
+            new_el = element_from_text(cast(Text, el).text)
+            new_el.metadata = el.metadata
+        else:
+            new_el = el
+        reclassified_elements.append(new_el)
+    return reclassified_elements
+
+
+def partition_pdf_or_image_iter(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO, SpooledTemporaryFile]] = None,
+    is_image: bool = False,
+    include_page_breaks: bool = False,
+    strategy: str = "auto",
+    infer_table_structure: bool = False,
+    ocr_languages: Optional[str] = None,
+    languages: Optional[List[str]] = ["eng"],
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    include_metadata: bool = True,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    text_probe_first_pages: int = PDF_TEXT_PROBE_FIRST_PAGES,
+    text_probe_random_pages: int = PDF_TEXT_PROBE_RANDOM_PAGES,
+    pages: Optional[Sequence[int]] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
+    hybrid_min_text_chars: int = PDF_HYBRID_MIN_TEXT_CHARS,
+    **kwargs,
+) -> Iterator[Element]:
+    """Streaming counterpart of `partition_pdf_or_image`. The elements of each page are yielded
+    as soon as the page is done, after which the images and layout objects of the page are
+    released, so memory use does not grow with the number of pages.
+
+    The strategy is resolved as in `partition_pdf_or_image`, except that whether the text of a
+    PDF is extractable is always decided by probing the text layer: on the sampled pages for the
+    "auto" strategy, and on every page otherwise. Chunking is not applied; the pages can be
+    chunked downstream as they arrive.
+    """
+    exactly_one(filename=filename, file=file)
+    languages = _check_languages(languages, ocr_languages)
+
+    last_modification_date = get_the_last_modification_date_pdf_or_img(
+        file=file,
+        filename=filename,
+    )
+    metadata_last_modified = metadata_last_modified or last_modification_date
+    file = spooled_to_bytes_io_if_needed(file)
+
+    requested_strategy = strategy
+    strategy = determine_pdf_or_image_strategy(
+        requested_strategy,
+        filename=filename,
+        file=file,
+        is_image=is_image,
+        infer_table_structure=infer_table_structure,
+    )
+
+    with contextlib.ExitStack() as stack:
+        pdf_document: Optional[PDFMinerDocument] = None
+        page_selected = pages is not None or first_page is not None or last_page is not None
+        if not is_image and (strategy in ("fast", "hybrid") or page_selected):
+            pdf_document = stack.enter_context(PDFMinerDocument(filename=filename, file=file))
+
+        page_numbers: Optional[List[int]] = None
+        if page_selected:
+            page_numbers = _get_selected_page_numbers(
+                filename=filename,
+                file=file,
+                pdf_document=pdf_document,
+                pages=pages,
+                first_page=first_page,
+                last_page=last_page,
+            )
+            if page_numbers == []:
+                return
+
+        if pdf_document is not None and strategy == "fast":
+            if requested_strategy == "auto" and (text_probe_first_pages or text_probe_random_pages):
+                first_pages, random_pages = text_probe_first_pages, text_probe_random_pages
+            else:
+                first_pages, random_pages = len(page_numbers or ()) or pdf_document.page_count, 0
+            if not probe_pdf_text_extractable(
+                pdf_document,
+                first_pages,
+                random_pages,
+                page_numbers=page_numbers,
+            ):
+                strategy = determine_pdf_or_image_strategy(
+                    requested_strategy,
+                    filename=filename,
+                    file=file,
+                    is_image=is_image,
+                    infer_table_structure=infer_table_structure,
+                    pdf_text_extractable=False,
+                )
+
+        pages_elements: Iterator[List[Element]]
+        if strategy == "fast":
+            pages_elements = _iter_pdfminer_pages(
+                pdf_document=cast(PDFMinerDocument, pdf_document),
+                filename=filename,
+                include_page_breaks=include_page_breaks,
+                metadata_last_modified=metadata_last_modified,
+                page_numbers=page_numbers,
+                **kwargs,
+            )
+        elif strategy == "hybrid":
+            pages_elements = _iter_hybrid_pages(
+                pdf_document=cast(PDFMinerDocument, pdf_document),
+                filename=filename,
+                file=file,
+                include_page_breaks=include_page_breaks,
+                infer_table_structure=infer_table_structure,
+                languages=languages,
+                max_partition=max_partition,
+                min_partition=min_partition,
+                metadata_last_modified=metadata_last_modified,
+                page_numbers=page_numbers,
+                min_text_chars=hybrid_min_text_chars,
+                **kwargs,
+            )
+        elif strategy == "ocr_only":
+            pages_elements = _iter_pdf_or_image_with_ocr(
+                filename=filename,
+                file=file,
+                include_page_breaks=include_page_breaks,
+                languages=languages,
+                is_image=is_image,
+                max_partition=max_partition,
+                min_partition=min_partition,
+                metadata_last_modified=metadata_last_modified,
+                pdf_document=pdf_document,
+                ocr_workers=kwargs.get("ocr_workers", 1),
+                max_image_pixels=kwargs.get("max_image_pixels", PAGE_IMAGE_MAX_PIXELS),
+                page_numbers=page_numbers,
+            )
+        else:
+            pages_elements = (
+                _reclassify_uncategorized_text(page_elements)
+                for page_elements in _iter_pdf_or_image_local(
+                    filename=filename,
+                    file=file,
+                    is_image=is_image,
+                    infer_table_structure=infer_table_structure,
+                    include_page_breaks=include_page_breaks,
+                    languages=languages,
+                    metadata_last_modified=metadata_last_modified,
+                    page_numbers=page_numbers,
+                    **kwargs,
+                )
+            )
+
+        yield from _iter_with_document_metadata(
+            pages_elements,
+            filetype=None if is_image else FileType.PDF,
+            filename=metadata_filename or filename,
+            include_metadata=include_metadata,
+            **kwargs,
+        )
+
+
+def classify_pdf_pages(
+    pdf_document: PDFMinerDocument,
+    page_numbers: Optional[Sequence[int]] = None,
+    min_text_chars: int = PDF_HYBRID_MIN_TEXT_CHARS,
+) -> Tuple[List[int], List[int]]:
+    """Splits the 1-indexed pages of the document (or `page_numbers`) into the pages with at
+    least `min_text_chars` characters in their text layer and the pages without, as counted by
+    the text probe without building any layout objects."""
+    if page_numbers is None:
+        page_numbers = range(1, pdf_document.page_count + 1)
+    text_pages: List[int] = []
+    image_pages: List[int] = []
+    for page_number in page_numbers:
+        if pdf_document.page_char_count(page_number - 1) >= min_text_chars:
+            text_pages.append(page_number)
+        else:
+            image_pages.append(page_number)
+    return text_pages, image_pages
+
+
+def _iter_hybrid_pages(
+    pdf_document: PDFMinerDocument,
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes]]] = None,
+    include_page_breaks: bool = False,
+    infer_table_structure: bool = False,
+    languages: Optional[List[str]] = ["eng"],
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    min_text_chars: int = PDF_HYBRID_MIN_TEXT_CHARS,
+    **kwargs,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each page in page order for the "hybrid" strategy. Pages with a
+    text layer are extracted with pdfminer, and the other pages go through the strategy "auto"
+    picks for a PDF without extractable text."""
+    text_pages, image_pages = classify_pdf_pages(pdf_document, page_numbers, min_text_chars)
+    logger.info(
+        f"Extracting {len(text_pages)} page(s) with a text layer and processing "
+        f"{len(image_pages)} page(s) without one.",
+    )
+
+    numbered_pages_elements: List[Iterator[Tuple[int, List[Element]]]] = []
+    if text_pages:
+        text_pages_elements = _iter_pdfminer_pages(
+            pdf_document=pdf_document,
+            filename=filename,
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified,
+            page_numbers=text_pages,
+            **kwargs,
+        )
+        numbered_pages_elements.append(zip(text_pages, text_pages_elements))
+
+    if image_pages:
+        image_strategy = determine_pdf_or_image_strategy(
+            "auto",
+            infer_table_structure=infer_table_structure,
+            pdf_text_extractable=False,
+        )
+        image_pages_elements: Iterator[List[Element]]
+        if image_strategy == "ocr_only":
+            image_pages_elements = _iter_pdf_or_image_with_ocr(
+                filename=filename,
+                file=file,
+                include_page_breaks=include_page_breaks,
+                languages=languages,
+                max_partition=max_partition,
+                min_partition=min_partition,
+                metadata_last_modified=metadata_last_modified,
+                pdf_document=pdf_document,
+                ocr_workers=kwargs.get("ocr_workers", 1),
+                max_image_pixels=kwargs.get("max_image_pixels", PAGE_IMAGE_MAX_PIXELS),
+                page_numbers=image_pages,
+            )
+        else:
+            image_pages_elements = (
+                _reclassify_uncategorized_text(page_elements)
+                for page_elements in _iter_pdf_or_image_local(
+                    filename=filename,
+                    file=file,
+                    infer_table_structure=infer_table_structure,
+                    include_page_breaks=include_page_breaks,
+                    languages=languages,
+                    metadata_last_modified=metadata_last_modified,
+                    page_numbers=image_pages,
+                    **kwargs,
+                )
+            )
+        numbered_pages_elements.append(zip(image_pages, image_pages_elements))
+
+    for _, page_elements in heapq.merge(*numbered_pages_elements, key=lambda page: page[0]):
+        yield page_elements
+
+
+def _iter_with_document_metadata(
+    pages_elements: Iterator[List[Element]],
+    filetype: Optional[FileType] = None,
+    filename: Optional[str] = None,
+    include_metadata: bool = True,
+    regex_metadata: Dict[str, str] = {},
+    unique_element_ids: bool = False,
+    **kwargs,
+) -> Iterator[Element]:
+    """Applies the document-level metadata post-processing of `partition_pdf` and
+    `partition_image` to the elements of each page as they are produced. The element hierarchy
+    is carried across pages."""
+    hierarchy_stack: List[Element] = []
+    for page_elements in pages_elements:
+        if filetype is not None:
+            if include_metadata:
+                set_element_hierarchy(page_elements, stack=hierarchy_stack)
+                for element in page_elements:
+                    if element.metadata.attached_to_filename is None:
+                        _add_element_metadata(
+                            element,
+                            filename=filename,
+                            filetype=FILETYPE_TO_MIMETYPE[filetype],
+                            url=kwargs.get("url"),
+                            text_as_html=kwargs.get("text_as_html"),
+                        )
+            else:
+                page_elements = _remove_element_metadata(page_elements)
+
+        page_elements = _add_regex_metadata(page_elements, regex_metadata)
+        for element in page_elements:
+            if unique_element_ids:
+                element.id_to_uuid()
+            yield element
+
+
+def _check_languages(
+    languages: Optional[List[str]],
+    ocr_languages: Optional[str] = None,
+) -> List[str]:
+    """Validates the languages passed to a partitioner, converting the deprecated
+    `ocr_languages` when it is given instead."""
     # The auto `partition` function uses `None` as a default because the default for
     # `partition_pdf` and `partition_img` conflict with the other partitioners that use ["auto"]
     if languages is None:
@@ -237,113 +1053,325 @@ def partition_pdf_or_image(
                 "Please use languages instead.",
             )
 
-    last_modification_date = get_the_last_modification_date_pdf_or_img(
-        file=file,
+    return languages
+
+
+@requires_dependencies("unstructured_inference")
+def _partition_pdf_or_image_local(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO]] = None,
+    is_image: bool = False,
+    infer_table_structure: bool = False,
+    include_page_breaks: bool = False,
+    languages: Optional[List[str]] = ["eng"],
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    model_name: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    **kwargs,
+) -> List[Element]:
+    """Partition using package installed locally. If `page_numbers` is given, only those
+    (1-indexed) pages are partitioned.
+
+    If `checkpoint_dir` is passed (or the UNSTRUCTURED_PAGE_CHECKPOINT_DIR environment variable
+    is set), the elements of each page are saved as soon as the page is done, and a call that was
+    interrupted resumes from the pages it had completed."""
+    from unstructured.partition.ocr import get_entire_page_ocr
+
+    checkpoint = get_page_checkpoint(
+        kwargs.pop("checkpoint_dir", None),
         filename=filename,
+        file=file,
+        config={
+            "strategy": "hi_res",
+            "is_image": is_image,
+            "infer_table_structure": infer_table_structure,
+            "include_page_breaks": include_page_breaks,
+            "languages": languages,
+            "ocr_mode": ocr_mode,
+            "entire_page_ocr": get_entire_page_ocr(),
+            "model_name": model_name or default_hi_res_model(),
+            "metadata_last_modified": metadata_last_modified,
+            **kwargs,
+        },
     )
+    if checkpoint is not None:
+        page_count = (
+            get_image_frame_count(filename=filename, file=file)
+            if is_image
+            else get_pdf_page_count(filename=filename, file=file)
+        )
+        return _partition_pages_with_checkpoint(
+            checkpoint,
+            lambda selected_page_numbers: _iter_pdf_or_image_local(
+                filename=filename,
+                file=file,
+                is_image=is_image,
+                infer_table_structure=infer_table_structure,
+                include_page_breaks=include_page_breaks,
+                languages=languages,
+                ocr_mode=ocr_mode,
+                model_name=model_name,
+                metadata_last_modified=metadata_last_modified,
+                page_numbers=selected_page_numbers,
+                **kwargs,
+            ),
+            page_count=page_count,
+            page_numbers=page_numbers,
+        )
 
-    if (
-        not is_image
-        and determine_pdf_or_image_strategy(
-            strategy,
+    return [
+        element
+        for page_elements in _iter_pdf_or_image_local(
             filename=filename,
             file=file,
             is_image=is_image,
             infer_table_structure=infer_table_structure,
-        )
-        != "ocr_only"
-    ):
-        extracted_elements = extractable_elements(
-            filename=filename,
-            file=spooled_to_bytes_io_if_needed(file),
             include_page_breaks=include_page_breaks,
-            metadata_last_modified=metadata_last_modified or last_modification_date,
+            languages=languages,
+            ocr_mode=ocr_mode,
+            model_name=model_name,
+            metadata_last_modified=metadata_last_modified,
+            page_numbers=page_numbers,
             **kwargs,
         )
-        pdf_text_extractable = any(
-            isinstance(el, Text) and el.text.strip() for el in extracted_elements
-        )
-    else:
-        pdf_text_extractable = False
+        for element in page_elements
+    ]
 
-    strategy = determine_pdf_or_image_strategy(
-        strategy,
+
+@requires_dependencies("unstructured_inference")
+def _iter_pdf_or_image_local(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO]] = None,
+    is_image: bool = False,
+    infer_table_structure: bool = False,
+    include_page_breaks: bool = False,
+    languages: Optional[List[str]] = ["eng"],
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    model_name: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    **kwargs,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each page partitioned by `_partition_pdf_or_image_local` as soon
+    as the page is done. Each page goes through the layout model and OCR on its own."""
+    ocr_languages = prepare_languages_for_tesseract(languages)
+
+    model_name, pdf_image_dpi, process_with_model_kwargs = _get_hi_res_model_settings(
+        model_name,
+        kwargs,
+    )
+    # NOTE(christine): out_layout = extracted_layout + inferred_layout
+    process_with_model_kwargs.update(_get_layout_model_kwargs(model_name))
+    iter_pages = _iter_image_frames_local if is_image else _iter_pdf_pages_local
+    yield from iter_pages(
         filename=filename,
         file=file,
-        is_image=is_image,
         infer_table_structure=infer_table_structure,
-        pdf_text_extractable=pdf_text_extractable,
+        include_page_breaks=include_page_breaks,
+        ocr_languages=ocr_languages,
+        ocr_mode=ocr_mode,
+        process_with_model_kwargs=process_with_model_kwargs,
+        pdf_image_dpi=pdf_image_dpi,
+        metadata_last_modified=metadata_last_modified,
+        page_numbers=page_numbers,
+        **kwargs,
     )
 
-    if strategy == "hi_res":
-        # NOTE(robinson): Catches a UserWarning that occurs when detectron is called
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            _layout_elements = _partition_pdf_or_image_local(
-                filename=filename,
-                file=spooled_to_bytes_io_if_needed(file),
-                is_image=is_image,
-                infer_table_structure=infer_table_structure,
-                include_page_breaks=include_page_breaks,
-                languages=languages,
-                metadata_last_modified=metadata_last_modified or last_modification_date,
-                **kwargs,
-            )
-            layout_elements = []
-            for el in _layout_elements:
-                if hasattr(el, "category") and el.category == "UncategorizedText":
-                    new_el = element_from_text(cast(Text, el).text)
-                    new_el.metadata = el.metadata
-                else:
-                    new_el = el
-                layout_elements.append(new_el)
-
-    elif strategy == "fast":
-        return extracted_elements
 
-    elif strategy == "ocr_only":
-        # NOTE(robinson): Catches file conversion warnings when running with PDFs
-        with warnings.catch_warnings():
-            return _partition_pdf_or_image_with_ocr(
-                filename=filename,
-                file=file,
-                include_page_breaks=include_page_breaks,
-                languages=languages,
-                is_image=is_image,
-                max_partition=max_partition,
-                min_partition=min_partition,
-                metadata_last_modified=metadata_last_modified or last_modification_date,
-            )
+def _iter_pdf_pages_local(
+    filename: str = "",
+    file: Optional[Union[bytes, BinaryIO]] = None,
+    infer_table_structure: bool = False,
+    include_page_breaks: bool = False,
+    ocr_languages: str = "eng",
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    process_with_model_kwargs: Optional[Dict[str, Any]] = None,
+    pdf_image_dpi: int = 200,
+    metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    **kwargs,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each page of a PDF, in order.
 
-    return layout_elements
+    Each page is rendered once through `RenderedPDFPages`, and the same image is given to the
+    layout model, with the text regions pdfminer finds on the page, and then to OCR. The image and
+    layout of a page are released before its elements are yielded.
+    """
+    from unstructured_inference.inference.layout import PageLayout
+
+    from unstructured.partition.ocr import supplement_page_layout_with_ocr
+
+    process_with_model_kwargs = process_with_model_kwargs or {}
+    if file is None and not os.path.isfile(filename):
+        raise FileNotFoundError(f'File "{filename}" not found!')
+    pdf_bytes = convert_to_bytes(file) if file is not None else None
+    with PDFMinerDocument(filename=filename, file=pdf_bytes) as pdf_document:
+        page_count = pdf_document.page_count
+        selected_page_numbers = (
+            list(page_numbers) if page_numbers is not None else list(range(1, page_count + 1))
+        )
+        max_pixels = kwargs.get("max_image_pixels", PAGE_IMAGE_MAX_PIXELS)
+        # Pages are rendered one at a time from the document pypdfium2 opened, without starting a
+        # process per page, and dropped from the cache once their elements are built, so that at
+        # most one page image and layout are held at a time
+        with RenderedPDFPages(
+            filename=filename,
+            file=pdf_bytes,
+            chunk_size=1,
+            total_pages=page_count,
+        ) as rendered_pages:
+            for i, page_number in enumerate(selected_page_numbers):
+                # Each page is rendered at the highest DPI that keeps it within max_pixels
+                render_dpi = get_page_dpi(
+                    *pdf_document.page_size(page_number - 1),
+                    pdf_image_dpi,
+                    max_pixels,
+                )
+                if render_dpi != pdf_image_dpi:
+                    logger.info(
+                        f"Rendering page {page_number} at {render_dpi} dpi instead of "
+                        f"{pdf_image_dpi} dpi to keep it within {max_pixels} pixels.",
+                    )
+                image = rendered_pages.get_page(page_number, dpi=render_dpi)
+                page_layout = PageLayout.from_image(
+                    image,
+                    number=page_number,
+                    document_filename=filename or None,
+                    layout=_get_pdfminer_text_regions(
+                        pdf_document.page_layout(page_number - 1),
+                        dpi=render_dpi,
+                    ),
+                    extract_tables=infer_table_structure,
+                    **process_with_model_kwargs,
+                )
+                page_layout = supplement_page_layout_with_ocr(
+                    page_layout,
+                    image,
+                    ocr_languages=ocr_languages,
+                    ocr_mode=ocr_mode,
+                    ocr_workers=kwargs.get("ocr_workers", 1),
+                )
+                page_elements = page_to_element_list(
+                    page_layout,
+                    page_number=page_number,
+                    sortable=True,
+                    last_modification_date=metadata_last_modified,
+                    # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized
+                    # "List" block with NLP rules. Otherwise, the assumptions in
+                    # unstructured.partition.common::layout_list_to_list_items often result in
+                    # weird chunking.
+                    infer_list_items=False,
+                    detection_origin="pdf",
+                    **kwargs,
+                )
+                rescale_element_coordinates(page_elements, render_dpi / pdf_image_dpi)
+                del image, page_layout
+                rendered_pages.release_page(page_number, dpi=render_dpi)
+                if include_page_breaks and i < len(selected_page_numbers) - 1:
+                    page_elements.append(PageBreak(text=""))
+                yield _clean_hi_res_elements(page_elements, include_page_breaks=include_page_breaks)
 
 
-@requires_dependencies("unstructured_inference")
-def _partition_pdf_or_image_local(
+def _iter_image_frames_local(
     filename: str = "",
     file: Optional[Union[bytes, BinaryIO]] = None,
-    is_image: bool = False,
     infer_table_structure: bool = False,
     include_page_breaks: bool = False,
-    languages: Optional[List[str]] = ["eng"],
+    ocr_languages: str = "eng",
     ocr_mode: str = OCRMode.FULL_PAGE.value,
-    model_name: Optional[str] = None,
+    process_with_model_kwargs: Optional[Dict[str, Any]] = None,
+    pdf_image_dpi: int = 200,
     metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
     **kwargs,
-) -> List[Element]:
-    """Partition using package installed locally."""
-    from unstructured_inference.inference.layout import (
-        process_data_with_model,
-        process_file_with_model,
-    )
+) -> Iterator[List[Element]]:
+    """Yields the elements of each frame of an image, in order.
 
-    from unstructured.partition.ocr import (
-        process_data_with_ocr,
-        process_file_with_ocr,
-    )
+    Each frame is decoded only when a worker is free to partition it, and goes through the
+    layout model and OCR on its own, so up to `ocr_workers` frames are partitioned concurrently
+    and at most `2 * ocr_workers` decoded frames are held in memory at a time.
+    """
+    from unstructured_inference.inference.layout import PageLayout
+
+    from unstructured.partition.ocr import get_page_ocr_workers, supplement_page_layout_with_ocr
+
+    process_with_model_kwargs = process_with_model_kwargs or {}
+    max_pixels = kwargs.get("max_image_pixels", PAGE_IMAGE_MAX_PIXELS)
+    image_file = io.BytesIO(convert_to_bytes(file)) if file is not None else filename
+    with PIL.Image.open(image_file) as images:
+        selected_page_numbers = (
+            list(page_numbers)
+            if page_numbers is not None
+            else list(range(1, getattr(images, "n_frames", 1) + 1))
+        )
+        frame_workers = get_page_ocr_workers(
+            len(selected_page_numbers),
+            kwargs.get("ocr_workers", 1),
+        )
 
-    ocr_languages = prepare_languages_for_tesseract(languages)
+        def _decode_frames() -> Iterator[Tuple[int, PIL.Image.Image, float]]:
+            format = images.format
+            for page_number in selected_page_numbers:
+                images.seek(page_number - 1)
+                frame, scale = downscale_image(images.convert("RGB"), max_pixels)
+                frame.format = format
+                yield page_number, frame, scale
+
+        def _partition_frame(decoded_frame: Tuple[int, PIL.Image.Image, float]) -> List[Element]:
+            page_number, frame, scale = decoded_frame
+            page_layout = PageLayout.from_image(
+                frame,
+                image_path=filename or None,
+                number=page_number,
+                extract_tables=infer_table_structure,
+                **process_with_model_kwargs,
+            )
+            page_layout = supplement_page_layout_with_ocr(
+                page_layout,
+                frame,
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                ocr_workers=kwargs.get("ocr_workers", 1) if frame_workers <= 1 else 1,
+            )
+            page_elements = page_to_element_list(
+                page_layout,
+                page_number=page_number,
+                sortable=True,
+                last_modification_date=metadata_last_modified,
+                infer_list_items=False,
+                detection_origin="image",
+                **kwargs,
+            )
+            rescale_element_coordinates(page_elements, scale)
+            return page_elements
 
+        page_elements_list = thread_map(
+            _partition_frame,
+            _decode_frames(),
+            max_workers=frame_workers,
+        )
+        for i, page_elements in enumerate(page_elements_list):
+            if include_page_breaks and i < len(selected_page_numbers) - 1:
+                page_elements.append(PageBreak(text=""))
+            yield _clean_hi_res_elements(page_elements, include_page_breaks=include_page_breaks)
+
+
+def _iter_image_frames(images: PIL.Image.Image) -> Iterator[PIL.Image.Image]:
+    """Yields each frame of a (possibly multi-page) image as an RGB image."""
+    format = images.format
+    for frame in ImageSequence.Iterator(images):
+        image = frame.convert("RGB")
+        image.format = format
+        yield image
+
+
+def _get_hi_res_model_settings(
+    model_name: Optional[str],
+    kwargs: Dict[str, Any],
+) -> Tuple[str, int, Dict[str, Any]]:
+    """Resolves the layout model, the DPI PDF pages are rendered at and the extra keyword
+    arguments for the layout model. `pdf_image_dpi` is popped from `kwargs`."""
     model_name = model_name or default_hi_res_model()
     pdf_image_dpi = kwargs.pop("pdf_image_dpi", None)
     if pdf_image_dpi is None:
@@ -367,57 +1395,15 @@ def _partition_pdf_or_image_local(
         if value:
             process_with_model_kwargs[key] = value
 
-    if file is None:
-        # NOTE(christine): out_layout = extracted_layout + inferred_layout
-        out_layout = process_file_with_model(
-            filename,
-            is_image=is_image,
-            extract_tables=infer_table_structure,
-            model_name=model_name,
-            pdf_image_dpi=pdf_image_dpi,
-            **process_with_model_kwargs,
-        )
-        final_layout = process_file_with_ocr(
-            filename,
-            out_layout,
-            is_image=is_image,
-            ocr_languages=ocr_languages,
-            ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
-        )
-    else:
-        out_layout = process_data_with_model(
-            file,
-            is_image=is_image,
-            extract_tables=infer_table_structure,
-            model_name=model_name,
-            pdf_image_dpi=pdf_image_dpi,
-            **process_with_model_kwargs,
-        )
-        if hasattr(file, "seek"):
-            file.seek(0)
-        final_layout = process_data_with_ocr(
-            file,
-            out_layout,
-            is_image=is_image,
-            ocr_languages=ocr_languages,
-            ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
-        )
+    return model_name, pdf_image_dpi, process_with_model_kwargs
 
-    elements = document_to_element_list(
-        final_layout,
-        sortable=True,
-        include_page_breaks=include_page_breaks,
-        last_modification_date=metadata_last_modified,
-        # NOTE(crag): do not attempt to derive ListItem's from a layout-recognized "List"
-        # block with NLP rules. Otherwise, the assumptions in
-        # unstructured.partition.common::layout_list_to_list_items often result in weird chunking.
-        infer_list_items=False,
-        detection_origin="image" if is_image else "pdf",
-        **kwargs,
-    )
 
+def _clean_hi_res_elements(
+    elements: List[Element],
+    include_page_breaks: bool = False,
+) -> List[Element]:
+    """Drops the page breaks (unless requested), garbage image text and empty text elements
+    produced from the layout model output, and normalizes whitespace in the rest."""
     out_elements = []
     for el in elements:
         if isinstance(el, PageBreak) and not include_page_breaks:
@@ -444,12 +1430,63 @@ def _partition_pdf_or_image_local(
     return out_elements
 
 
+def _get_layout_model_kwargs(model_name: str) -> Dict[str, Any]:
+    """Loads the layout model and returns it as the keyword argument `PageLayout.from_image`
+    takes for its type of model."""
+    from unstructured_inference.models.base import get_model
+    from unstructured_inference.models.unstructuredmodel import (
+        UnstructuredElementExtractionModel,
+        UnstructuredObjectDetectionModel,
+    )
+
+    model = get_model(model_name)
+    if isinstance(model, UnstructuredObjectDetectionModel):
+        return {"detection_model": model}
+    elif isinstance(model, UnstructuredElementExtractionModel):
+        return {"element_extraction_model": model}
+    raise ValueError(f"Unsupported model type: {type(model)}")
+
+
+def _get_pdfminer_text_regions(page_layout: LTPage, dpi: int) -> List["TextRegion"]:
+    """Returns the text and image regions pdfminer finds on a page, in the pixel space of the
+    page rendered at `dpi`, as `unstructured_inference` reads them from a PDF file."""
+    from unstructured_inference.constants import Source
+    from unstructured_inference.inference.elements import EmbeddedTextRegion, ImageTextRegion
+    from unstructured_inference.inference.ordering import order_layout
+    from unstructured_inference.inference.pdf import get_images_from_pdf_element
+
+    # Coefficient to rescale bounding boxes from PDF points to the page image
+    coef = dpi / 72
+    height = page_layout.height
+    text_regions = []
+    for element in page_layout:
+        x1, y2, x2, y1 = element.bbox
+        if hasattr(element, "get_text"):
+            text, region_class = element.get_text(), EmbeddedTextRegion
+        elif get_images_from_pdf_element(element):
+            text, region_class = None, ImageTextRegion
+        else:
+            continue
+        text_region = region_class(
+            x1 * coef,
+            (height - y1) * coef,
+            x2 * coef,
+            (height - y2) * coef,
+            text=text,
+            source=Source.PDFMINER,
+        )
+        if text_region.area > 0:
+            text_regions.append(text_region)
+    return order_layout(text_regions)
+
+
 @requires_dependencies("pdfminer", "local-inference")
 def _partition_pdf_with_pdfminer(
     filename: str = "",
     file: Optional[IO[bytes]] = None,
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
+    pdf_document: Optional[PDFMinerDocument] = None,
     **kwargs: Any,
 ) -> List[Element]:
     """Partitions a PDF using PDFMiner instead of using a layoutmodel. Used for faster
@@ -461,21 +1498,18 @@ def _partition_pdf_with_pdfminer(
     ref: https://github.com/pdfminer/pdfminer.six/blob/master/pdfminer/high_level.py
     """
     exactly_one(filename=filename, file=file)
-    if filename:
-        with open_filename(filename, "rb") as fp:
-            fp = cast(BinaryIO, fp)
-            elements = _process_pdfminer_pages(
-                fp=fp,
-                filename=filename,
-                include_page_breaks=include_page_breaks,
-                metadata_last_modified=metadata_last_modified,
-                **kwargs,
-            )
+    if pdf_document is not None:
+        return _process_pdfminer_pages(
+            pdf_document=pdf_document,
+            filename=filename,
+            include_page_breaks=include_page_breaks,
+            metadata_last_modified=metadata_last_modified,
+            **kwargs,
+        )
 
-    elif file:
-        fp = cast(BinaryIO, file)
+    with PDFMinerDocument(filename=filename, file=file) as pdf_document:
         elements = _process_pdfminer_pages(
-            fp=fp,
+            pdf_document=pdf_document,
             filename=filename,
             include_page_breaks=include_page_breaks,
             metadata_last_modified=metadata_last_modified,
@@ -505,7 +1539,7 @@ def _extract_text(item: LTItem) -> str:
 
 
 def _process_pdfminer_pages(
-    fp: BinaryIO,
+    pdf_document: PDFMinerDocument,
     filename: str = "",
     include_page_breaks: bool = False,
     metadata_last_modified: Optional[str] = None,
@@ -513,179 +1547,445 @@ def _process_pdfminer_pages(
 ):
     """Uses PDF miner to split a document into pages and process them."""
     elements: List[Element] = []
+    for page_elements in _iter_pdfminer_pages(
+        pdf_document=pdf_document,
+        filename=filename,
+        include_page_breaks=include_page_breaks,
+        metadata_last_modified=metadata_last_modified,
+        **kwargs,
+    ):
+        elements += page_elements
+    return elements
+
+
+def _iter_pdfminer_pages(
+    pdf_document: PDFMinerDocument,
+    filename: str = "",
+    include_page_breaks: bool = False,
+    metadata_last_modified: Optional[str] = None,
+    page_numbers: Optional[Sequence[int]] = None,
+    **kwargs,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each page of the document (or of the 1-indexed `page_numbers`) in
+    page order.
+
+    The text is extracted with the `pdf_text_backend` registered in `PDF_TEXT_BACKENDS`, by
+    default pdfminer with layout analysis. If `pdfminer_processes` is greater than 1, the pages
+    are split into batches processed in a pool of worker processes, each parsing the document
+    once. The pages are yielded in page order, so the output is the same as a serial run. In a
+    daemonic process, such as the worker of a multiprocessing pool, the pages are processed
+    serially since it cannot start processes of its own."""
     sort_mode = kwargs.get("sort_mode", SORT_MODE_XY_CUT)
+    pdfminer_processes = kwargs.get("pdfminer_processes", 1)
+    pdf_text_backend = kwargs.get("pdf_text_backend", PDF_TEXT_BACKEND_PDFMINER)
+    page_indices = (
+        [page_number - 1 for page_number in page_numbers]
+        if page_numbers is not None
+        else list(range(pdf_document.page_count))
+    )
+
+    if pdf_text_backend != PDF_TEXT_BACKEND_PDFMINER:
+        pages_elements = _iter_text_backend_pages(
+            pdf_document=pdf_document,
+            page_indices=page_indices,
+            pdf_text_backend=pdf_text_backend,
+            filename=filename,
+            metadata_last_modified=metadata_last_modified,
+        )
+    elif pdfminer_processes > 1 and len(page_indices) > 1 and not mp.current_process().daemon:
+        pages_elements = _process_pdfminer_pages_in_parallel(
+            pdf_document=pdf_document,
+            page_indices=page_indices,
+            processes=pdfminer_processes,
+            filename=filename,
+            metadata_last_modified=metadata_last_modified,
+            sort_mode=sort_mode,
+        )
+    else:
+        pages_elements = (
+            _process_pdfminer_page(
+                page_number=i + 1,
+                page=pdf_document.pages[i],
+                page_layout=pdf_document.page_layout(i),
+                filename=filename,
+                metadata_last_modified=metadata_last_modified,
+                sort_mode=sort_mode,
+            )
+            for i in page_indices
+        )
+
+    for page_elements in pages_elements:
+        if include_page_breaks:
+            page_elements.append(PageBreak(text=""))
+        yield page_elements
 
-    rsrcmgr = PDFResourceManager()
-    laparams = LAParams()
-    device = PDFPageAggregator(rsrcmgr, laparams=laparams)
-    interpreter = PDFPageInterpreter(rsrcmgr, device)
 
-    for i, page in enumerate(PDFPage.get_pages(fp)):  # type: ignore
-        interpreter.process_page(page)
-        page_layout = device.get_result()
+PDFTextBackend = Callable[[Union[str, bytes], Sequence[int]], Iterator[str]]
 
-        width, height = page_layout.width, page_layout.height
+PDF_TEXT_BACKENDS: Dict[str, PDFTextBackend] = {}
 
-        page_elements = []
-        annotation_list = []
 
-        coordinate_system = PixelSpace(
-            width=width,
-            height=height,
+def register_pdf_text_backend(name: str, backend: PDFTextBackend):
+    """Registers a PDF text backend that can be selected with `pdf_text_backend=name` for the
+    "fast" strategy. The backend is called with the filename or the bytes of the PDF and the
+    zero-indexed pages to extract, and yields the text layer of each of those pages in order.
+    Each line of the text becomes an element, with no coordinates or links."""
+    PDF_TEXT_BACKENDS[name] = backend
+
+
+def _iter_text_backend_pages(
+    pdf_document: PDFMinerDocument,
+    page_indices: Sequence[int],
+    pdf_text_backend: str,
+    filename: str = "",
+    metadata_last_modified: Optional[str] = None,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each of the zero-indexed `page_indices` of the document extracted
+    with a registered text backend instead of pdfminer's layout analysis."""
+    if pdf_text_backend not in PDF_TEXT_BACKENDS:
+        raise ValueError(
+            f"Invalid pdf_text_backend {pdf_text_backend}. Valid backends are "
+            f"{', '.join([PDF_TEXT_BACKEND_PDFMINER, *PDF_TEXT_BACKENDS])}.",
         )
-        if page.annots:
-            annotation_list = get_uris(page.annots, height, coordinate_system, i + 1)
+    source = pdf_document.filename or convert_to_bytes(pdf_document.file)
+    page_texts = PDF_TEXT_BACKENDS[pdf_text_backend](source, page_indices)
+    for i, page_text in zip(page_indices, page_texts):
+        page_elements: List[Element] = []
+        for _text in re.split(PARAGRAPH_PATTERN, page_text):
+            _text, _ = clean_extra_whitespace_with_index_run(_text)
+            if not _text.strip():
+                continue
+            element = element_from_text(_text)
+            element.metadata = ElementMetadata(
+                filename=filename,
+                page_number=i + 1,
+                last_modified=metadata_last_modified,
+            )
+            element.metadata.detection_origin = pdf_text_backend
+            page_elements.append(element)
+        yield page_elements
 
-        for obj in page_layout:
-            x1, y1, x2, y2 = rect_to_bbox(obj.bbox, height)
-            bbox = (x1, y1, x2, y2)
 
-            urls_metadata = []
+@requires_dependencies("pypdfium2", extras="pdf")
+def _iter_pdfium_page_texts(
+    source: Union[str, bytes], page_indices: Sequence[int]
+) -> Iterator[str]:
+    """Text backend that reads the text layer of each page with pdfium, without any layout
+    analysis. Lines are kept in the order pdfium finds them on the page."""
+    import pypdfium2
 
-            if len(annotation_list) > 0 and isinstance(obj, LTTextBox):
-                annotations_within_element = check_annotations_within_element(
-                    annotation_list,
-                    bbox,
-                    i + 1,
-                )
-                _, words = get_word_bounding_box_from_element(obj, height)
-                for annot in annotations_within_element:
-                    urls_metadata.append(map_bbox_and_index(words, annot))
+    document = pypdfium2.PdfDocument(source)
+    try:
+        for i in page_indices:
+            page = document[i]
+            text_page = page.get_textpage()
+            try:
+                yield text_page.get_text_range()
+            finally:
+                text_page.close()
+                page.close()
+    finally:
+        document.close()
 
-            if hasattr(obj, "get_text"):
-                _text_snippets = [obj.get_text()]
-            else:
-                _text = _extract_text(obj)
-                _text_snippets = re.split(PARAGRAPH_PATTERN, _text)
-
-            for _text in _text_snippets:
-                _text, moved_indices = clean_extra_whitespace_with_index_run(_text)
-                if _text.strip():
-                    points = ((x1, y1), (x1, y2), (x2, y2), (x2, y1))
-                    element = element_from_text(
-                        _text,
-                        coordinates=points,
-                        coordinate_system=coordinate_system,
-                    )
-                    coordinates_metadata = CoordinatesMetadata(
-                        points=points,
-                        system=coordinate_system,
-                    )
 
-                    links: List[Link] = []
-                    for url in urls_metadata:
-                        with contextlib.suppress(IndexError):
-                            links.append(
-                                {
-                                    "text": url["text"],
-                                    "url": url["uri"],
-                                    "start_index": index_adjustment_after_clean_extra_whitespace(
-                                        url["start_index"],
-                                        moved_indices,
-                                    ),
-                                },
-                            )
-
-                    element.metadata = ElementMetadata(
-                        filename=filename,
-                        page_number=i + 1,
-                        coordinates=coordinates_metadata,
-                        last_modified=metadata_last_modified,
-                        links=links,
-                    )
-                    element.metadata.detection_origin = "pdfminer"
-                    page_elements.append(element)
-        list_item = 0
-        updated_page_elements = []  # type: ignore
-        coordinate_system = PixelSpace(width=width, height=height)
-        for page_element in page_elements:
-            if isinstance(page_element, ListItem):
-                list_item += 1
-                list_page_element = page_element
-                list_item_text = page_element.text
-                list_item_coords = page_element.metadata.coordinates
-            elif list_item > 0 and check_coords_within_boundary(
-                page_element.metadata.coordinates,
-                list_item_coords,
-            ):
-                text = page_element.text  # type: ignore
-                list_item_text = list_item_text + " " + text
-                x1 = min(
-                    list_page_element.metadata.coordinates.points[0][0],
-                    page_element.metadata.coordinates.points[0][0],
-                )
-                x2 = max(
-                    list_page_element.metadata.coordinates.points[2][0],
-                    page_element.metadata.coordinates.points[2][0],
-                )
-                y1 = min(
-                    list_page_element.metadata.coordinates.points[0][1],
-                    page_element.metadata.coordinates.points[0][1],
-                )
-                y2 = max(
-                    list_page_element.metadata.coordinates.points[1][1],
-                    page_element.metadata.coordinates.points[1][1],
-                )
+register_pdf_text_backend(PDF_TEXT_BACKEND_LIGHT, _iter_pdfium_page_texts)
+
+
+def _process_pdfminer_pages_in_parallel(
+    pdf_document: PDFMinerDocument,
+    page_indices: Sequence[int],
+    processes: int,
+    filename: str = "",
+    metadata_last_modified: Optional[str] = None,
+    sort_mode: str = SORT_MODE_XY_CUT,
+) -> Iterator[List[Element]]:
+    """Processes the zero-indexed `page_indices` of the document in batches across a pool of
+    processes and yields the elements of each page in page order."""
+    # Two batches per process so a few dense pages do not leave the other processes idle at the end
+    # of the document
+    batch_size = max(1, -(-len(page_indices) // (processes * 2)))
+    page_batches = [
+        page_indices[start : start + batch_size]  # noqa: E203
+        for start in range(0, len(page_indices), batch_size)
+    ]
+    source = pdf_document.filename or convert_to_bytes(pdf_document.file)
+    with mp.Pool(
+        processes=min(processes, len(page_batches)),
+        initializer=_open_pdfminer_worker_document,
+        initargs=(source,),
+    ) as pool:
+        for batch_elements in pool.imap(
+            functools.partial(
+                _process_pdfminer_page_batch,
+                filename=filename,
+                metadata_last_modified=metadata_last_modified,
+                sort_mode=sort_mode,
+            ),
+            page_batches,
+        ):
+            yield from batch_elements
+
+
+# The document parsed once by each worker of `_process_pdfminer_pages_in_parallel` and shared by the
+# page batches the worker processes
+_worker_pdf_document: Optional[PDFMinerDocument] = None
+
+
+def _open_pdfminer_worker_document(source: Union[str, bytes]):
+    global _worker_pdf_document
+    _worker_pdf_document = (
+        PDFMinerDocument(filename=source)
+        if isinstance(source, str)
+        else PDFMinerDocument(file=source)
+    )
+
+
+def _process_pdfminer_page_batch(
+    page_indices: Sequence[int],
+    filename: str = "",
+    metadata_last_modified: Optional[str] = None,
+    sort_mode: str = SORT_MODE_XY_CUT,
+) -> List[List[Element]]:
+    """Worker for `_process_pdfminer_pages_in_parallel`. Returns the elements of each of the
+    zero-indexed `page_indices` of the document opened by the worker."""
+    pdf_document = cast(PDFMinerDocument, _worker_pdf_document)
+    return [
+        _process_pdfminer_page(
+            page_number=i + 1,
+            page=pdf_document.pages[i],
+            page_layout=pdf_document.page_layout(i),
+            filename=filename,
+            metadata_last_modified=metadata_last_modified,
+            sort_mode=sort_mode,
+        )
+        for i in page_indices
+    ]
+
+
+def _process_pdfminer_page(
+    page_number: int,
+    page: PDFPage,
+    page_layout: LTPage,
+    filename: str = "",
+    metadata_last_modified: Optional[str] = None,
+    sort_mode: str = SORT_MODE_XY_CUT,
+) -> List[Element]:
+    """Converts the pdfminer layout of a single page into sorted elements."""
+    width, height = page_layout.width, page_layout.height
+
+    page_elements = []
+    annotation_list = []
+
+    coordinate_system = PixelSpace(
+        width=width,
+        height=height,
+    )
+    if page.annots:
+        annotation_list = get_uris(page.annots, height, coordinate_system, page_number)
+
+    objs = list(page_layout)
+    bboxes = [rect_to_bbox(obj.bbox, height) for obj in objs]
+    annotations_by_obj: List[List[dict]] = [[] for _ in objs]
+    if annotation_list:
+        # The annotations of the page are matched against all of its text boxes at once, so only the
+        # boxes that contain a link have their word boxes built
+        text_box_indices = [i for i, obj in enumerate(objs) if isinstance(obj, LTTextBox)]
+        annotations_within_elements = check_annotations_within_elements(
+            annotation_list,
+            [bboxes[i] for i in text_box_indices],
+            page_number,
+        )
+        for i, annotations_within_element in zip(text_box_indices, annotations_within_elements):
+            annotations_by_obj[i] = annotations_within_element
+
+    for obj, bbox, annotations_within_element in zip(objs, bboxes, annotations_by_obj):
+        x1, y1, x2, y2 = bbox
+
+        urls_metadata = []
+
+        if annotations_within_element:
+            _, words = get_word_bounding_box_from_element(obj, height)
+            urls_metadata = map_bboxes_and_indices(words, annotations_within_element)
+
+        if hasattr(obj, "get_text"):
+            _text_snippets = [obj.get_text()]
+        else:
+            _text = _extract_text(obj)
+            _text_snippets = re.split(PARAGRAPH_PATTERN, _text)
+
+        for _text in _text_snippets:
+            _text, moved_indices = clean_extra_whitespace_with_index_run(_text)
+            if _text.strip():
                 points = ((x1, y1), (x1, y2), (x2, y2), (x2, y1))
-                list_page_element.text = list_item_text
-                list_page_element.metadata.coordinates = CoordinatesMetadata(
+                element = element_from_text(
+                    _text,
+                    coordinates=points,
+                    coordinate_system=coordinate_system,
+                )
+                coordinates_metadata = CoordinatesMetadata(
                     points=points,
                     system=coordinate_system,
                 )
-                page_element = list_page_element
-                updated_page_elements.pop(0)
-
-            updated_page_elements.append(page_element)
-
-        page_elements = updated_page_elements
-        del updated_page_elements
 
-        # NOTE(crag, christine): always do the basic sort first for determinsitic order across
-        # python versions.
-        sorted_page_elements = sort_page_elements(page_elements, SORT_MODE_BASIC)
-        if sort_mode != SORT_MODE_BASIC:
-            sorted_page_elements = sort_page_elements(sorted_page_elements, sort_mode)
+                links: List[Link] = []
+                for url in urls_metadata:
+                    with contextlib.suppress(IndexError):
+                        links.append(
+                            {
+                                "text": url["text"],
+                                "url": url["uri"],
+                                "start_index": index_adjustment_after_clean_extra_whitespace(
+                                    url["start_index"],
+                                    moved_indices,
+                                ),
+                            },
+                        )
+
+                element.metadata = ElementMetadata(
+                    filename=filename,
+                    page_number=page_number,
+                    coordinates=coordinates_metadata,
+                    last_modified=metadata_last_modified,
+                    links=links,
+                )
+                element.metadata.detection_origin = "pdfminer"
+                page_elements.append(element)
+    list_item = 0
+    updated_page_elements = []  # type: ignore
+    coordinate_system = PixelSpace(width=width, height=height)
+    for page_element in page_elements:
+        if isinstance(page_element, ListItem):
+            list_item += 1
+            list_page_element = page_element
+            list_item_text = page_element.text
+            list_item_coords = page_element.metadata.coordinates
+        elif list_item > 0 and check_coords_within_boundary(
+            page_element.metadata.coordinates,
+            list_item_coords,
+        ):
+            text = page_element.text  # type: ignore
+            list_item_text = list_item_text + " " + text
+            x1 = min(
+                list_page_element.metadata.coordinates.points[0][0],
+                page_element.metadata.coordinates.points[0][0],
+            )
+            x2 = max(
+                list_page_element.metadata.coordinates.points[2][0],
+                page_element.metadata.coordinates.points[2][0],
+            )
+            y1 = min(
+                list_page_element.metadata.coordinates.points[0][1],
+                page_element.metadata.coordinates.points[0][1],
+            )
+            y2 = max(
+                list_page_element.metadata.coordinates.points[1][1],
+                page_element.metadata.coordinates.points[1][1],
+            )
+            points = ((x1, y1), (x1, y2), (x2, y2), (x2, y1))
+            list_page_element.text = list_item_text
+            list_page_element.metadata.coordinates = CoordinatesMetadata(
+                points=points,
+                system=coordinate_system,
+            )
+            page_element = list_page_element
+            updated_page_elements.pop(0)
 
-        elements += sorted_page_elements
+        updated_page_elements.append(page_element)
 
-        if include_page_breaks:
-            elements.append(PageBreak(text=""))
+    page_elements = updated_page_elements
+    del updated_page_elements
 
-    return elements
+    # NOTE(crag, christine): always do the basic sort first for determinsitic order across
+    # python versions.
+    sorted_page_elements = sort_page_elements(page_elements, SORT_MODE_BASIC)
+    if sort_mode != SORT_MODE_BASIC:
+        sorted_page_elements = sort_page_elements(sorted_page_elements, sort_mode)
+    return sorted_page_elements
 
 
 def convert_pdf_to_images(
     filename: str = "",
     file: Optional[Union[bytes, IO[bytes]]] = None,
     chunk_size: int = 10,
+    total_pages: Optional[int] = None,
+    dpi: int = 200,
+    page_numbers: Optional[Sequence[int]] = None,
+    max_pixels: Optional[int] = None,
 ) -> Iterator[PIL.Image.Image]:
+    """Renders the pages of a PDF at `dpi` through `RenderedPDFPages`, up to `chunk_size` pages
+    at a time.
+
+    If `max_pixels` is given, pages too large to fit in that many pixels at `dpi` (posters,
+    engineering drawings) are rendered at a lower DPI instead, and chunks are kept within
+    `PDF_RENDER_CHUNK_MAX_PIXELS` pixels. The DPI each page was rendered at is stored in the
+    `dpi` info of its image.
+    """
     # Convert a PDF in small chunks of pages at a time (e.g. 1-10, 11-20... and so on)
     exactly_one(filename=filename, file=file)
-    if file is not None:
-        f_bytes = convert_to_bytes(file)
-        info = pdf2image.pdfinfo_from_bytes(f_bytes)
-    else:
-        f_bytes = None
-        info = pdf2image.pdfinfo_from_path(filename)
-
-    total_pages = info["Pages"]
-    for start_page in range(1, total_pages + 1, chunk_size):
-        end_page = min(start_page + chunk_size - 1, total_pages)
-        if f_bytes is not None:
-            chunk_images = pdf2image.convert_from_bytes(
-                f_bytes,
-                first_page=start_page,
-                last_page=end_page,
-            )
-        else:
-            chunk_images = pdf2image.convert_from_path(
-                filename,
-                first_page=start_page,
-                last_page=end_page,
-            )
-
-        for image in chunk_images:
-            yield image
+    f_bytes = convert_to_bytes(file) if file is not None else None
+
+    page_dpis: Optional[Dict[int, int]] = None
+    page_pixels: Optional[Dict[int, int]] = None
+    if max_pixels:
+        # The page sizes are read with pypdfium2, which also gives the page count
+        page_sizes = get_pdf_page_sizes(f_bytes if f_bytes is not None else filename)
+        if page_numbers is None:
+            page_numbers = range(1, len(page_sizes) + 1)
+        page_dpis = {}
+        page_pixels = {}
+        for page_number in page_numbers:
+            width, height = page_sizes[page_number - 1]
+            page_dpis[page_number] = get_page_dpi(width, height, dpi, max_pixels)
+            page_pixels[page_number] = get_page_pixels(width, height, page_dpis[page_number])
+
+    with RenderedPDFPages(
+        filename=filename,
+        file=f_bytes,
+        total_pages=total_pages,
+    ) as rendered_pages:
+        if page_numbers is None:
+            page_numbers = range(1, rendered_pages.page_count + 1)
+        for start_page, end_page in _group_page_numbers(
+            page_numbers,
+            chunk_size,
+            page_dpis=page_dpis,
+            page_pixels=page_pixels,
+            max_chunk_pixels=PDF_RENDER_CHUNK_MAX_PIXELS,
+        ):
+            chunk_dpi = page_dpis[start_page] if page_dpis is not None else dpi
+            for image in rendered_pages.render_pages(start_page, end_page, dpi=chunk_dpi):
+                image.info["dpi"] = (chunk_dpi, chunk_dpi)
+                yield image
+
+
+def _group_page_numbers(
+    page_numbers: Sequence[int],
+    chunk_size: int = 10,
+    page_dpis: Optional[Dict[int, int]] = None,
+    page_pixels: Optional[Dict[int, int]] = None,
+    max_chunk_pixels: Optional[int] = None,
+) -> Iterator[Tuple[int, int]]:
+    """Groups sorted page numbers into (first_page, last_page) runs of consecutive pages, with at
+    most `chunk_size` pages in each run. If given, the pages of a run also share the same DPI in
+    `page_dpis` and, unless a single page is larger, their `page_pixels` add up to at most
+    `max_chunk_pixels`."""
+    run: List[int] = []
+    run_pixels = 0
+    for page_number in page_numbers:
+        pixels = page_pixels[page_number] if page_pixels is not None else 0
+        if run and (
+            page_number != run[-1] + 1
+            or len(run) == chunk_size
+            or (page_dpis is not None and page_dpis[page_number] != page_dpis[run[-1]])
+            or (max_chunk_pixels is not None and run_pixels + pixels > max_chunk_pixels)
+        ):
+            yield run[0], run[-1]
+            run = []
+            run_pixels = 0
+        run.append(page_number)
+        run_pixels += pixels
+    if run:
+        yield run[0], run[-1]
 
 
 def _get_element_box(
@@ -783,48 +2083,203 @@ def _partition_pdf_or_image_with_ocr(
     max_partition: Optional[int] = 1500,
     min_partition: Optional[int] = 0,
     metadata_last_modified: Optional[str] = None,
+    pdf_document: Optional[PDFMinerDocument] = None,
+    ocr_workers: int = 1,
+    page_numbers: Optional[Sequence[int]] = None,
+    max_image_pixels: Optional[int] = PAGE_IMAGE_MAX_PIXELS,
+    checkpoint_dir: Optional[str] = None,
 ):
     """Partitions an image or PDF using Tesseract OCR. For PDFs, each page is converted
-    to an image prior to processing."""
-    import unstructured_pytesseract
+    to an image prior to processing. If the PDF was already parsed while determining the
+    strategy, `pdf_document` provides its page count. With `ocr_workers` greater than 1,
+    up to that many PDF pages are OCR'd concurrently. If `page_numbers` is given, only those
+    (1-indexed) pages are rendered and OCR'd. Pages and images larger than `max_image_pixels`
+    pixels are OCR'd at a lower resolution, and the coordinates of their elements are mapped back
+    to the full size page. The pages of a PDF are checkpointed in `checkpoint_dir` as in
+    `_partition_pdf_or_image_local`."""
+    checkpoint = (
+        get_page_checkpoint(
+            checkpoint_dir,
+            filename=filename,
+            file=file,
+            config={
+                "strategy": "ocr_only",
+                "include_page_breaks": include_page_breaks,
+                "languages": languages,
+                "max_partition": max_partition,
+                "min_partition": min_partition,
+                "metadata_last_modified": metadata_last_modified,
+                "max_image_pixels": max_image_pixels,
+                "ocr_agent": _get_ocr_only_agent(),
+            },
+        )
+        if not is_image
+        else None
+    )
+    if checkpoint is not None:
+        return _partition_pages_with_checkpoint(
+            checkpoint,
+            lambda selected_page_numbers: _iter_pdf_or_image_with_ocr(
+                filename=filename,
+                file=file,
+                include_page_breaks=include_page_breaks,
+                languages=languages,
+                max_partition=max_partition,
+                min_partition=min_partition,
+                metadata_last_modified=metadata_last_modified,
+                pdf_document=pdf_document,
+                ocr_workers=ocr_workers,
+                page_numbers=selected_page_numbers,
+                max_image_pixels=max_image_pixels,
+            ),
+            page_count=(
+                pdf_document.page_count
+                if pdf_document is not None
+                else get_pdf_page_count(filename=filename, file=file)
+            ),
+            page_numbers=page_numbers,
+        )
+
+    elements: List[Element] = []
+    for page_elements in _iter_pdf_or_image_with_ocr(
+        filename=filename,
+        file=file,
+        include_page_breaks=include_page_breaks,
+        languages=languages,
+        is_image=is_image,
+        max_partition=max_partition,
+        min_partition=min_partition,
+        metadata_last_modified=metadata_last_modified,
+        pdf_document=pdf_document,
+        ocr_workers=ocr_workers,
+        page_numbers=page_numbers,
+        max_image_pixels=max_image_pixels,
+    ):
+        elements.extend(page_elements)
+    return elements
+
 
+def _partition_pages_with_checkpoint(
+    checkpoint: PageCheckpoint,
+    iter_pages: Callable[[Optional[Sequence[int]]], Iterator[List[Element]]],
+    page_count: int,
+    page_numbers: Optional[Sequence[int]] = None,
+) -> List[Element]:
+    """Partitions the selected pages of a document (all of its `page_count` pages by default)
+    that are not in `checkpoint` yet with `iter_pages`, which yields the elements of each of the
+    page numbers it is given, saving each page to the checkpoint as soon as it is done. Returns
+    the elements of every selected page and clears the checkpoint."""
+    selected_page_numbers = (
+        list(page_numbers) if page_numbers is not None else list(range(1, page_count + 1))
+    )
+    pages_elements = checkpoint.load()
+    remaining_page_numbers = [
+        page_number for page_number in selected_page_numbers if page_number not in pages_elements
+    ]
+    if len(remaining_page_numbers) < len(selected_page_numbers):
+        logger.info(
+            f"Resuming from a checkpoint with {len(pages_elements)} of "
+            f"{len(selected_page_numbers)} pages already partitioned.",
+        )
+    if remaining_page_numbers:
+        # Pages are only selected when some of them are done, so that the whole document is not
+        # copied for a first run
+        for page_number, page_elements in zip(
+            remaining_page_numbers,
+            iter_pages(
+                (
+                    remaining_page_numbers
+                    if page_numbers is not None or len(remaining_page_numbers) < page_count
+                    else None
+                ),
+            ),
+        ):
+            checkpoint.save(page_number, page_elements)
+            pages_elements[page_number] = page_elements
+
+    elements = [
+        element
+        for page_number in selected_page_numbers
+        for element in pages_elements.get(page_number, [])
+    ]
+    checkpoint.clear()
+    return elements
+
+
+@requires_dependencies("unstructured_pytesseract")
+def _iter_pdf_or_image_with_ocr(
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes]]] = None,
+    include_page_breaks: bool = False,
+    languages: Optional[List[str]] = ["eng"],
+    is_image: bool = False,
+    max_partition: Optional[int] = 1500,
+    min_partition: Optional[int] = 0,
+    metadata_last_modified: Optional[str] = None,
+    pdf_document: Optional[PDFMinerDocument] = None,
+    ocr_workers: int = 1,
+    page_numbers: Optional[Sequence[int]] = None,
+    max_image_pixels: Optional[int] = PAGE_IMAGE_MAX_PIXELS,
+) -> Iterator[List[Element]]:
+    """Yields the elements of each page OCR'd by `_partition_pdf_or_image_with_ocr` as soon as
+    the page is done. Only the pages in flight are held in memory."""
     ocr_languages = prepare_languages_for_tesseract(languages)
 
     if is_image:
-        if file is not None:
-            image = PIL.Image.open(file)
-            text, _bboxes = unstructured_pytesseract.run_and_get_multiple_output(
-                np.array(image),
-                extensions=["txt", "box"],
-                lang=ocr_languages,
-            )
-        else:
-            image = PIL.Image.open(filename)
-            text, _bboxes = unstructured_pytesseract.run_and_get_multiple_output(
-                np.array(image),
-                extensions=["txt", "box"],
-                lang=ocr_languages,
+        ocr_agent = OCRAgent.get_agent(_get_ocr_only_agent(), require_text_and_boxes=True)
+        with PIL.Image.open(file if file is not None else filename) as images:
+            # Without a page selection only the first frame is OCR'd, as before page selection was
+            # added, and its elements have no page number
+            selected_page_numbers: List[Optional[int]] = (
+                list(page_numbers) if page_numbers is not None else [None]
             )
-        elements = partition_text(
-            text=text,
-            max_partition=max_partition,
-            min_partition=min_partition,
-            metadata_last_modified=metadata_last_modified,
-            detection_origin="OCR",
-        )
-        width, height = image.size
-        _add_pytesseract_bboxes_to_elements(
-            elements=cast(List[Text], elements),
-            bboxes_string=_bboxes,
-            width=width,
-            height=height,
-        )
+            for i, page_number in enumerate(selected_page_numbers):
+                if page_number is not None:
+                    images.seek(page_number - 1)
+                image, scale = downscale_image(images, max_image_pixels)
+                text, _bboxes = ocr_agent.get_text_and_boxes_from_image(
+                    np.array(image),
+                    ocr_languages=ocr_languages,
+                )
+                elements = partition_text(
+                    text=text,
+                    max_partition=max_partition,
+                    min_partition=min_partition,
+                    metadata_last_modified=metadata_last_modified,
+                    detection_origin="OCR",
+                )
+                if page_number is not None:
+                    for element in elements:
+                        element.metadata.page_number = page_number
+                width, height = image.size
+                _add_pytesseract_bboxes_to_elements(
+                    elements=cast(List[Text], elements),
+                    bboxes_string=_bboxes,
+                    width=width,
+                    height=height,
+                )
+                rescale_element_coordinates(elements, scale)
+                if include_page_breaks and i < len(selected_page_numbers) - 1:
+                    elements.append(PageBreak(text=""))
+                yield elements
 
     else:
-        elements = []
-        page_number = 0
-        for image in convert_pdf_to_images(filename, file):
-            page_number += 1
+        total_pages = pdf_document.page_count if pdf_document is not None else None
+        if page_numbers is None:
+            page_numbers = range(1, total_pages + 1) if total_pages is not None else None
+        ocr_pages = _ocr_pdf_pages(
+            convert_pdf_to_images(
+                filename,
+                file,
+                total_pages=total_pages,
+                page_numbers=page_numbers,
+                max_pixels=max_image_pixels,
+            ),
+            ocr_languages=ocr_languages,
+            ocr_workers=ocr_workers,
+        )
+        for i, (image, _text, _bboxes) in enumerate(ocr_pages):
+            page_number = page_numbers[i] if page_numbers is not None else i + 1
             metadata = ElementMetadata(
                 filename=filename,
                 page_number=page_number,
@@ -832,11 +2287,6 @@ def _partition_pdf_or_image_with_ocr(
                 languages=languages,
             )
             metadata.detection_origin = "OCR"
-            _text, _bboxes = unstructured_pytesseract.run_and_get_multiple_output(
-                image,
-                extensions=["txt", "box"],
-                lang=ocr_languages,
-            )
             width, height = image.size
 
             _elements = partition_text(
@@ -854,11 +2304,57 @@ def _partition_pdf_or_image_with_ocr(
                 width=width,
                 height=height,
             )
+            # Pages too large for `max_image_pixels` are rendered below the default 200 dpi
+            page_dpi = image.info.get("dpi", (200, 200))[0]
+            rescale_element_coordinates(cast(List[Element], _elements), page_dpi / 200)
 
-            elements.extend(_elements)
             if include_page_breaks:
-                elements.append(PageBreak(text=""))
-    return elements
+                _elements.append(PageBreak(text=""))
+            yield _elements
+
+
+def _get_ocr_only_agent() -> str:
+    """Returns the OCR agent used by the ocr_only strategy, "tesserocr" if ENTIRE_PAGE_OCR is
+    set to it and "tesseract" otherwise, since it needs the character boxes that only the
+    tesseract based agents produce."""
+    entire_page_ocr = os.getenv("ENTIRE_PAGE_OCR", OCR_AGENT_TESSERACT).lower()
+    if entire_page_ocr == OCR_AGENT_TESSEROCR:
+        return OCR_AGENT_TESSEROCR
+    return OCR_AGENT_TESSERACT
+
+
+def _ocr_pdf_pages(
+    images: Iterator[PIL.Image.Image],
+    ocr_languages: str = "eng",
+    ocr_workers: int = 1,
+) -> Iterator[Tuple[PIL.Image.Image, str, str]]:
+    """Runs tesseract on each rendered page and yields (image, text, boxes) in page order.
+
+    With more than one worker, the pages are OCR'd concurrently in a thread pool; each tesseract
+    call runs in its own single threaded process, or its own engine with the tesserocr agent.
+    Rendering continues while the workers are busy, but at most `2 * ocr_workers` pages are held
+    in memory ahead of the page being consumed.
+    """
+    entire_page_ocr = _get_ocr_only_agent()
+    ocr_agent = OCRAgent.get_agent(entire_page_ocr, require_text_and_boxes=True)
+    ocr_cache = get_ocr_cache()
+
+    def _ocr(image: PIL.Image.Image) -> Tuple[str, str]:
+        if ocr_cache is not None:
+            cache_key = ocr_cache.make_key(image, ocr_languages, entire_page_ocr, "txt+box")
+            cached_output = ocr_cache.get(cache_key)
+            if cached_output is not None:
+                text, boxes = cached_output
+                return text, boxes
+        text, boxes = ocr_agent.get_text_and_boxes_from_image(
+            image,
+            ocr_languages=ocr_languages,
+        )
+        if ocr_cache is not None:
+            ocr_cache.set(cache_key, [text, boxes])
+        return text, boxes
+
+    yield from thread_map(lambda image: (image, *_ocr(image)), images, max_workers=ocr_workers)
 
 
 def check_coords_within_boundary(
@@ -1111,6 +2607,54 @@ def check_annotations_within_element(
     return annotations_within_element
 
 
+def check_annotations_within_elements(
+    annotation_list: List[dict],
+    element_bboxes: Sequence[Tuple[float, float, float, float]],
+    page_number: int,
+    threshold: float = 0.9,
+) -> List[List[dict]]:
+    """
+    Filter the annotations that are within or highly overlap with each of the specified elements
+    on a page, like `check_annotations_within_element` but with the overlaps of every annotation
+    and element computed at once.
+
+    Args:
+        annotation_list (List[dict]): A list of dictionaries, each containing information
+            about an annotation.
+        element_bboxes (Sequence[Tuple[float, float, float, float]]): The bounding box
+            coordinates of the elements in the bbox format (x1, y1, x2, y2).
+        page_number (int): The page number to which the annotations and elements belong.
+        threshold (float, optional): The threshold value (between 0.0 and 1.0) that determines
+            the minimum overlap required for an annotation to be considered within an element.
+            Default is 0.9.
+
+    Returns:
+        List[List[dict]]: For each element, the annotations that are within or highly overlap
+        with it, in the order of `annotation_list`.
+    """
+    annotations = [
+        annotation for annotation in annotation_list if annotation["page_number"] == page_number
+    ]
+    if not annotations or not len(element_bboxes):
+        return [[] for _ in element_bboxes]
+
+    annotation_bboxes = np.array([annotation["bbox"] for annotation in annotations], dtype=float)
+    element_bboxes_array = np.array(element_bboxes, dtype=float)
+
+    x1 = np.maximum(element_bboxes_array[:, None, 0], annotation_bboxes[None, :, 0])
+    y1 = np.maximum(element_bboxes_array[:, None, 1], annotation_bboxes[None, :, 1])
+    x2 = np.minimum(element_bboxes_array[:, None, 2], annotation_bboxes[None, :, 2])
+    y2 = np.minimum(element_bboxes_array[:, None, 3], annotation_bboxes[None, :, 3])
+    intersection_areas = np.where((x1 < x2) & (y1 < y2), (x2 - x1) * (y2 - y1), 0.0)
+    annotation_areas = (annotation_bboxes[:, 2] - annotation_bboxes[:, 0]) * (
+        annotation_bboxes[:, 3] - annotation_bboxes[:, 1]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        within = (annotation_areas != 0) & (intersection_areas / annotation_areas > threshold)
+
+    return [[annotations[j] for j in np.flatnonzero(row)] for row in within]
+
+
 def get_word_bounding_box_from_element(
     obj: LTTextBox,
     height: float,
@@ -1188,33 +2732,55 @@ def map_bbox_and_index(words: List[dict], annot: dict):
         dict: The updated annotation dictionary with "text" representing the mapped text and
             "start_index" representing the start index of the mapped text in the list of words.
     """
+    return map_bboxes_and_indices(words, [annot])[0]
+
+
+def map_bboxes_and_indices(words: List[dict], annots: List[dict]) -> List[dict]:
+    """
+    Maps each bounding box annotation to the corresponding text and start index within a list of
+    words, like `map_bbox_and_index` but with the distances between every annotation and word
+    computed at once.
+
+    Args:
+        words (List[dict]): A list of dictionaries, each containing information about a word,
+            including its text, bounding box, and start index.
+        annots (List[dict]): The annotation dictionaries to be mapped, which will be updated with
+            "text" and "start_index" fields.
+
+    Returns:
+        List[dict]: The updated annotation dictionaries.
+    """
     if len(words) == 0:
-        annot["text"] = ""
-        annot["start_index"] = -1
-        return annot
+        for annot in annots:
+            annot["text"] = ""
+            annot["start_index"] = -1
+        return annots
+
+    word_bboxes = np.array([word["bbox"] for word in words], dtype=float)
+    annot_bboxes = np.array([annot["bbox"] for annot in annots], dtype=float)
     distance_from_bbox_start = np.sqrt(
-        (annot["bbox"][0] - np.array([word["bbox"][0] for word in words])) ** 2
-        + (annot["bbox"][1] - np.array([word["bbox"][1] for word in words])) ** 2,
+        (annot_bboxes[:, None, 0] - word_bboxes[None, :, 0]) ** 2
+        + (annot_bboxes[:, None, 1] - word_bboxes[None, :, 1]) ** 2,
     )
     distance_from_bbox_end = np.sqrt(
-        (annot["bbox"][2] - np.array([word["bbox"][2] for word in words])) ** 2
-        + (annot["bbox"][3] - np.array([word["bbox"][3] for word in words])) ** 2,
+        (annot_bboxes[:, None, 2] - word_bboxes[None, :, 2]) ** 2
+        + (annot_bboxes[:, None, 3] - word_bboxes[None, :, 3]) ** 2,
     )
-    closest_start = try_argmin(distance_from_bbox_start)
-    closest_end = try_argmin(distance_from_bbox_end)
-
-    # NOTE(klaijan) - get the word from closest start only if the end index comes after start index
-    text = ""
-    if closest_end >= closest_start:
-        for _ in range(closest_start, closest_end + 1):
-            text += " "
-            text += words[_]["text"]
-    else:
-        text = words[closest_start]["text"]
+    closest_starts = np.argmin(distance_from_bbox_start, axis=1)
+    closest_ends = np.argmin(distance_from_bbox_end, axis=1)
+
+    for annot, closest_start, closest_end in zip(annots, closest_starts, closest_ends):
+        # NOTE(klaijan) - get the word from closest start only if the end index comes after
+        # start index
+        if closest_end >= closest_start:
+            matched_words = words[closest_start : closest_end + 1]  # noqa: E203
+            text = " ".join(word["text"] for word in matched_words)
+        else:
+            text = words[closest_start]["text"]
 
-    annot["text"] = text.strip()
-    annot["start_index"] = words[closest_start]["start_index"]
-    return annot
+        annot["text"] = text.strip()
+        annot["start_index"] = words[closest_start]["start_index"]
+    return annots
 
 
 def try_argmin(array: np.ndarray) -> int:
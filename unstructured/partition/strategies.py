@@ -20,6 +20,9 @@ VALID_STRATEGIES: Dict[str, List[str]] = {
     "fast": [
         "pdf",
     ],
+    "hybrid": [
+        "pdf",
+    ],
 }
 
 
@@ -48,7 +51,8 @@ def determine_pdf_or_image_strategy(
     if is_image:
         # Note(yuming): There is no fast strategy for images,
         # use hi_res as a fallback plan since it is the auto default.
-        if strategy == "fast":
+        # Images have no text layer to extract pages from with the hybrid strategy either
+        if strategy in ("fast", "hybrid"):
             strategy = "hi_res"
         validate_strategy(strategy, "image")
         pdf_text_extractable = False
@@ -99,6 +103,13 @@ def determine_pdf_or_image_strategy(
             logger.warning("Falling back to partitioning with fast.")
             return "fast"
 
+    elif strategy == "hybrid" and not (unstructured_inference_installed or pytesseract_installed):
+        logger.warning(
+            "Neither unstructured_inference nor pytesseract is installed. Cannot use the hybrid "
+            "partitioning strategy. Falling back to partitioning with fast.",
+        )
+        return "fast"
+
     elif strategy == "ocr_only" and not pytesseract_installed:
         logger.warning(
             "pytesseract is not installed. Cannot use the ocr_only partitioning "
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import IO, Any, Dict, List, Optional, Union
+
+from unstructured.documents.elements import Element
+from unstructured.logger import logger
+from unstructured.partition.common import convert_to_bytes
+from unstructured.staging.base import convert_to_dict, isd_to_elements
+
+
+class PageCheckpoint:
+    """Keeps the elements of each page partitioned from a document on disk, so that a call
+    interrupted part way through a long document resumes from the pages it had completed.
+
+    Pages are stored as one JSON file per page in a directory of `directory` named after a hash
+    of the document and of the configuration it is partitioned with, so a retry only reuses pages
+    partitioned from the same bytes with the same options. The directory is removed with `clear`
+    once the whole document is done.
+    """
+
+    def __init__(self, directory: str, key: str):
+        self.path = os.path.join(directory, key)
+        os.makedirs(self.path, exist_ok=True)
+
+    @staticmethod
+    def make_key(
+        filename: str = "",
+        file: Optional[Union[bytes, IO[bytes]]] = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Returns the checkpoint key of partitioning the document with options `config`."""
+        digest = hashlib.sha256()
+        if file is not None:
+            digest.update(convert_to_bytes(file))
+        else:
+            with open(filename, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def load(self) -> Dict[int, List[Element]]:
+        """Returns the elements of the completed pages by page number."""
+        pages: Dict[int, List[Element]] = {}
+        for entry in os.scandir(self.path):
+            if not (entry.name.startswith("page-") and entry.name.endswith(".json")):
+                continue
+            page_number = int(entry.name[len("page-") : -len(".json")])  # noqa: E203
+            try:
+                with open(entry.path, encoding="utf-8") as f:
+                    pages[page_number] = isd_to_elements(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read the checkpoint of page {page_number}: {e}")
+        return pages
+
+    def save(self, page_number: int, elements: List[Element]) -> None:
+        """Stores the elements of a completed page."""
+        element_dicts = convert_to_dict(elements)
+        for element, element_dict in zip(elements, element_dicts):
+            detection_origin = getattr(element.metadata, "detection_origin", None)
+            if detection_origin is not None:
+                element_dict["metadata"]["detection_origin"] = detection_origin
+        # Written to a temporary file first so that a page interrupted while it is being written is
+        # not read back as completed
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(element_dicts, f)
+        os.replace(tmp_path, os.path.join(self.path, f"page-{page_number}.json"))
+
+    def clear(self) -> None:
+        """Removes the checkpoint once the document is completely partitioned."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_page_checkpoint(
+    checkpoint_dir: Optional[str],
+    filename: str = "",
+    file: Optional[Union[bytes, IO[bytes]]] = None,
+    config: Optional[Dict[str, Any]] = None,
+) -> Optional[PageCheckpoint]:
+    """Returns the checkpoint of partitioning the document with options `config` in
+    `checkpoint_dir`, or in the UNSTRUCTURED_PAGE_CHECKPOINT_DIR environment variable if it is not
+    given. Returns None if checkpointing is off."""
+    checkpoint_dir = checkpoint_dir or os.environ.get("UNSTRUCTURED_PAGE_CHECKPOINT_DIR")
+    if not checkpoint_dir:
+        return None
+    return PageCheckpoint(
+        checkpoint_dir,
+        PageCheckpoint.make_key(filename=filename, file=file, config=config),
+    )
@@ -12,3 +12,41 @@ SORT_MODE_BASIC = "basic"
 
 SUBREGION_THRESHOLD_FOR_OCR = 0.5
 UNSTRUCTURED_INCLUDE_DEBUG_METADATA = os.getenv("UNSTRUCTURED_INCLUDE_DEBUG_METADATA", False)
+
+# OCR agents that can be selected by name with the ENTIRE_PAGE_OCR environment variable
+OCR_AGENT_TESSERACT = "tesseract"
+OCR_AGENT_TESSEROCR = "tesserocr"
+OCR_AGENT_PADDLE = "paddle"
+OCR_AGENT_MODULES = {
+    OCR_AGENT_TESSERACT: "unstructured.partition.utils.ocr_models.tesseract_ocr.OCRAgentTesseract",
+    OCR_AGENT_TESSEROCR: "unstructured.partition.utils.ocr_models.tesserocr_ocr.OCRAgentTesserocr",
+    OCR_AGENT_PADDLE: "unstructured.partition.utils.ocr_models.paddle_ocr.OCRAgentPaddle",
+}
+
+# Pages sampled to decide whether the text of a PDF is extractable for the "auto" strategy
+PDF_TEXT_PROBE_FIRST_PAGES = 5
+PDF_TEXT_PROBE_RANDOM_PAGES = 5
+
+# Backends that extract the text layer of PDFs for the "fast" strategy. "pdfminer" runs pdfminer's
+# layout analysis; "light" only reads the text of each page, with pypdfium2
+PDF_TEXT_BACKEND_PDFMINER = "pdfminer"
+PDF_TEXT_BACKEND_LIGHT = "light"
+
+# Text layer characters a PDF page needs for the "hybrid" strategy to extract it with pdfminer
+# instead of OCR'ing it
+PDF_HYBRID_MIN_TEXT_CHARS = 20
+
+# Rendered PDF pages kept in memory for reuse before spilling to disk, about 45 letter pages at 200
+# dpi
+PDF_RENDER_CACHE_MAX_MEMORY_BYTES = 512 * 1024 * 1024
+
+# Pages are rendered, and images downscaled, to at most this many pixels before layout detection and
+# OCR. An A3 page at 300 dpi is about 17.4 million pixels
+PAGE_IMAGE_MAX_PIXELS = 20_000_000
+
+# Pixels of the PDF pages rendered together in one chunk by `convert_pdf_to_images`, about 17 letter
+# pages at 200 dpi
+PDF_RENDER_CHUNK_MAX_PIXELS = 64_000_000
+
+# Default size limit of the on-disk OCR cache enabled with UNSTRUCTURED_OCR_CACHE_DIR
+OCR_CACHE_MAX_BYTES = 1024 * 1024 * 1024
@@ -0,0 +1,144 @@
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Any, List, Optional
+
+from PIL import Image as PILImage
+from unstructured_inference.inference.elements import TextRegion
+
+from unstructured.logger import logger
+from unstructured.partition.utils.constants import OCR_CACHE_MAX_BYTES
+
+
+class OCRCache:
+    """An on-disk cache of OCR results, so that pages with identical pixels (reprocessed
+    documents, boilerplate cover sheets or fax headers) are only OCR'd once.
+
+    Results are keyed by an exact hash of the image together with the OCR languages, the OCR
+    engine and the kind of output, and stored as one JSON file per key in `directory`. Reading
+    an entry refreshes its modification time; once the entries take more than `max_size_bytes`,
+    the least recently used ones are removed. The directory can be shared between processes.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int = OCR_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_size_bytes = max_size_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size_bytes = sum(entry.stat().st_size for entry in self._entries())
+
+    @staticmethod
+    def make_key(
+        image: PILImage.Image,
+        ocr_languages: str,
+        entire_page_ocr: str,
+        output: str,
+    ) -> str:
+        """Returns the cache key of the `output` ("layout", "text", ...) of OCR'ing `image`."""
+        digest = hashlib.sha256()
+        digest.update(f"{entire_page_ocr}\0{ocr_languages}\0{output}\0".encode())
+        digest.update(f"{image.mode}\0{image.size}\0".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the value stored under `key`, or None if there is none."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores the JSON serializable `value` under `key`, evicting the least recently used
+        entries if the cache grows past its size limit."""
+        # Written to a temporary file first so that concurrent readers never see a partially written
+        # entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            size_bytes = os.path.getsize(tmp_path)
+            try:
+                size_bytes -= os.path.getsize(self._path(key))
+            except OSError:
+                pass
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write to the OCR cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            self._size_bytes += size_bytes
+            if self._size_bytes > self.max_size_bytes:
+                self._evict()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _entries(self) -> List[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+
+    def _evict(self) -> None:
+        # The size is recounted from disk, since other processes may share the directory
+        entries = []
+        for entry in self._entries():
+            try:
+                entries.append((entry.stat().st_mtime, entry.stat().st_size, entry.path))
+            except OSError:
+                continue
+        entries.sort()
+        self._size_bytes = sum(size for _, size, _ in entries)
+        # Evicts down to 90% of the limit so that every write does not trigger a scan
+        target_bytes = int(self.max_size_bytes * 0.9)
+        for _, size, path in entries:
+            if self._size_bytes <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size_bytes -= size
+
+
+@functools.lru_cache(maxsize=None)
+def _load_ocr_cache(directory: str, max_size_bytes: int) -> OCRCache:
+    return OCRCache(directory, max_size_bytes=max_size_bytes)
+
+
+def get_ocr_cache() -> Optional[OCRCache]:
+    """Returns the OCR cache configured with the UNSTRUCTURED_OCR_CACHE_DIR (and optionally
+    UNSTRUCTURED_OCR_CACHE_MAX_BYTES) environment variables, or None if OCR caching is off."""
+    directory = os.environ.get("UNSTRUCTURED_OCR_CACHE_DIR")
+    if not directory:
+        return None
+    max_size_bytes = int(os.environ.get("UNSTRUCTURED_OCR_CACHE_MAX_BYTES", OCR_CACHE_MAX_BYTES))
+    return _load_ocr_cache(directory, max_size_bytes)
+
+
+def text_regions_to_json(text_regions: List[TextRegion]) -> List[list]:
+    return [
+        [
+            float(region.x1),
+            float(region.y1),
+            float(region.x2),
+            float(region.y2),
+            region.text,
+            region.source,
+        ]
+        for region in text_regions
+    ]
+
+
+def text_regions_from_json(value: List[list]) -> List[TextRegion]:
+    return [
+        TextRegion(x1, y1, x2, y2, text, source=source) for x1, y1, x2, y2, text, source in value
+    ]
@@ -0,0 +1,93 @@
+import functools
+import importlib
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from PIL import Image as PILImage
+from unstructured_inference.inference.elements import TextRegion
+
+from unstructured.partition.utils.constants import OCR_AGENT_MODULES
+
+
+class OCRAgent(ABC):
+    """Interface of the OCR engines used by `unstructured.partition.ocr`. An agent is created
+    once per process by `get_agent` and reused for every image, so implementations can keep
+    expensive state such as loaded models between calls."""
+
+    @staticmethod
+    def get_agent(
+        ocr_agent: str = "tesseract",
+        require_text_and_boxes: bool = False,
+    ) -> "OCRAgent":
+        """Returns the agent registered under `ocr_agent` ("tesseract", "tesserocr" or
+        "paddle"), or the agent class at the dotted path `ocr_agent` for custom engines. With
+        `require_text_and_boxes`, agents that do not implement `get_text_and_boxes_from_image`
+        are rejected."""
+        module_path = OCR_AGENT_MODULES.get(ocr_agent.lower(), ocr_agent)
+        if "." not in module_path:
+            raise ValueError(
+                f"Unknown OCR agent {ocr_agent}. Valid OCR agents are "
+                f"{', '.join(OCR_AGENT_MODULES)} or the import path of an OCRAgent class.",
+            )
+        agent = _load_agent(module_path)
+        if require_text_and_boxes and not agent.supports_text_and_boxes:
+            raise ValueError(
+                f"OCR agent {ocr_agent} does not produce the character boxes needed by the "
+                "ocr_only strategy. Use a tesseract based agent such as tesseract or tesserocr.",
+            )
+        return agent
+
+    @property
+    def supports_text_and_boxes(self) -> bool:
+        """Whether the agent implements `get_text_and_boxes_from_image`."""
+        return (
+            type(self).get_text_and_boxes_from_image is not OCRAgent.get_text_and_boxes_from_image
+        )
+
+    @abstractmethod
+    def get_layout_from_image(
+        self,
+        image: PILImage.Image,
+        ocr_languages: str = "eng",
+    ) -> List[TextRegion]:
+        """Returns the words OCR'd from the image as text regions."""
+
+    @abstractmethod
+    def get_text_from_image(self, image: PILImage.Image, ocr_languages: str = "eng") -> str:
+        """Returns the text OCR'd from the image."""
+
+    def get_texts_from_images(
+        self,
+        images: List[PILImage.Image],
+        ocr_languages: str = "eng",
+        ocr_workers: int = 1,
+    ) -> List[str]:
+        """Returns the text OCR'd from each image, running on up to `ocr_workers` images at
+        a time."""
+        get_text = functools.partial(self.get_text_from_image, ocr_languages=ocr_languages)
+        if ocr_workers <= 1 or len(images) <= 1:
+            return [get_text(image) for image in images]
+        # tesseract runs outside of the GIL, in a single threaded process or engine per call (see
+        # OMP_THREAD_LIMIT), so a thread pool is enough to keep `ocr_workers` cores busy
+        with ThreadPoolExecutor(max_workers=min(ocr_workers, len(images))) as executor:
+            return list(executor.map(get_text, images))
+
+    def get_text_and_boxes_from_image(
+        self,
+        image: PILImage.Image,
+        ocr_languages: str = "eng",
+    ) -> Tuple[str, str]:
+        """Returns the text OCR'd from the image and its characters as a tesseract box file,
+        for the ocr_only strategy. Only tesseract based agents implement this, which
+        `supports_text_and_boxes` reports."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not produce tesseract box output.",
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _load_agent(module_path: str) -> OCRAgent:
+    module_name, class_name = module_path.rsplit(".", 1)
+    agent_class = getattr(importlib.import_module(module_name), class_name)
+    return agent_class()
@@ -1,7 +1,14 @@
 import functools
+from typing import List
 
+import numpy as np
+from PIL import Image as PILImage
+from unstructured_inference.inference.elements import TextRegion
 from unstructured_inference.logger import logger
 
+from unstructured.partition.ocr import parse_ocr_data_paddle
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
 
 @functools.lru_cache(maxsize=None)
 def load_agent(language: str = "en"):
@@ -40,3 +47,120 @@ def load_agent(language: str = "en"):
             show_log=False,
         )
     return paddle_ocr
+
+
+# Internals of the PaddleOCR agent that batched recognition relies on, which are not part of its
+# public API and may change between versions of unstructured_paddleocr
+BATCHED_RECOGNITION_ATTRIBUTES = (
+    "text_detector",
+    "text_classifier",
+    "text_recognizer",
+    "use_angle_cls",
+    "drop_score",
+    "args",
+)
+
+
+def supports_batched_recognition(agent) -> bool:
+    """Returns whether the PaddleOCR agent exposes the internals used by
+    `get_texts_from_images` to recognize the lines of several images in one batch."""
+    if not all(hasattr(agent, name) for name in BATCHED_RECOGNITION_ATTRIBUTES):
+        return False
+    if not hasattr(agent.args, "det_box_type"):
+        return False
+    try:
+        from unstructured_paddleocr.paddle_tools.infer.predict_system import (  # noqa: F401
+            sorted_boxes,
+        )
+        from unstructured_paddleocr.paddle_tools.infer.utility import (  # noqa: F401
+            get_minarea_rect_crop,
+            get_rotate_crop_image,
+        )
+    except ImportError:
+        return False
+    return True
+
+
+def get_texts_from_images(images: List[np.ndarray]) -> List[str]:
+    """Returns the text of each image. The text lines of each image are detected one image at a
+    time, then the lines of all the images are recognized together in batches of the agent's
+    `rec_batch_num`, instead of one recognition call per image. Agents that do not expose the
+    internals this relies on OCR each image with their public `ocr` method instead."""
+    agent = load_agent()
+    if not supports_batched_recognition(agent):
+        logger.debug("Batched recognition is not supported by this version of paddle.")
+        return [
+            "".join(
+                text_region.text
+                for text_region in parse_ocr_data_paddle(agent.ocr(image, cls=True))
+            )
+            for image in images
+        ]
+
+    from unstructured_paddleocr.paddle_tools.infer.predict_system import sorted_boxes
+    from unstructured_paddleocr.paddle_tools.infer.utility import (
+        get_minarea_rect_crop,
+        get_rotate_crop_image,
+    )
+
+    line_images = []
+    line_counts = []
+    for image in images:
+        dt_boxes, _ = agent.text_detector(image.copy())
+        dt_boxes = sorted_boxes(dt_boxes) if dt_boxes is not None else []
+        for box in dt_boxes:
+            if agent.args.det_box_type == "quad":
+                line_images.append(get_rotate_crop_image(image, box.copy()))
+            else:
+                line_images.append(get_minarea_rect_crop(image, box.copy()))
+        line_counts.append(len(dt_boxes))
+
+    if not line_images:
+        return ["" for _ in images]
+    if agent.use_angle_cls:
+        line_images, _, _ = agent.text_classifier(line_images)
+    line_results, _ = agent.text_recognizer(line_images)
+
+    texts = []
+    start = 0
+    for line_count in line_counts:
+        texts.append(
+            "".join(
+                text
+                for text, score in line_results[start : start + line_count]  # noqa: E203
+                if text and score >= agent.drop_score
+            ),
+        )
+        start += line_count
+    return texts
+
+
+class OCRAgentPaddle(OCRAgent):
+    """OCR agent backed by the PaddleOCR agent loaded once per process by `load_agent`."""
+
+    def get_layout_from_image(
+        self,
+        image: PILImage.Image,
+        ocr_languages: str = "eng",
+    ) -> List[TextRegion]:
+        logger.info("Processing entrie page OCR with paddle...")
+        # TODO(yuming): pass in language parameter once we
+        # have the mapping for paddle lang code
+        # see CORE-2034
+        ocr_data = load_agent().ocr(np.array(image), cls=True)
+        return parse_ocr_data_paddle(ocr_data)
+
+    def get_text_from_image(self, image: PILImage.Image, ocr_languages: str = "eng") -> str:
+        ocr_layout = self.get_layout_from_image(image, ocr_languages=ocr_languages)
+        return "".join(text_region.text for text_region in ocr_layout)
+
+    def get_texts_from_images(
+        self,
+        images: List[PILImage.Image],
+        ocr_languages: str = "eng",
+        ocr_workers: int = 1,
+    ) -> List[str]:
+        """Returns the text of each image, recognizing the lines of all the images in batches
+        with `get_texts_from_images` rather than running on the images concurrently."""
+        logger.info(f"Processing OCR on {len(images)} image(s) with paddle...")
+        return get_texts_from_images([np.array(image) for image in images])
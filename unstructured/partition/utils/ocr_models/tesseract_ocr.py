@@ -0,0 +1,45 @@
+from typing import List, Tuple
+
+import numpy as np
+import unstructured_pytesseract
+from PIL import Image as PILImage
+from unstructured_inference.inference.elements import TextRegion
+from unstructured_pytesseract import Output
+
+from unstructured.partition.ocr import parse_ocr_data_tesseract
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+
+class OCRAgentTesseract(OCRAgent):
+    """OCR agent that runs the tesseract command line for every image."""
+
+    def get_layout_from_image(
+        self,
+        image: PILImage.Image,
+        ocr_languages: str = "eng",
+    ) -> List[TextRegion]:
+        ocr_data = unstructured_pytesseract.image_to_data(
+            np.array(image),
+            lang=ocr_languages,
+            output_type=Output.DICT,
+        )
+        return parse_ocr_data_tesseract(ocr_data)
+
+    def get_text_from_image(self, image: PILImage.Image, ocr_languages: str = "eng") -> str:
+        return unstructured_pytesseract.image_to_string(
+            np.array(image),
+            lang=ocr_languages,
+            output_type=Output.DICT,
+        )["text"]
+
+    def get_text_and_boxes_from_image(
+        self,
+        image: PILImage.Image,
+        ocr_languages: str = "eng",
+    ) -> Tuple[str, str]:
+        text, boxes = unstructured_pytesseract.run_and_get_multiple_output(
+            image,
+            extensions=["txt", "box"],
+            lang=ocr_languages,
+        )
+        return text, boxes
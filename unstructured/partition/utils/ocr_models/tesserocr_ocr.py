@@ -0,0 +1,103 @@
+import threading
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+from PIL import Image as PILImage
+from unstructured_inference.inference.elements import TextRegion
+
+from unstructured.partition.ocr import parse_ocr_data_tesseract
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.utils import requires_dependencies
+
+TSV_COLUMNS = [
+    "level",
+    "page_num",
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+]
+
+
+class OCRAgentTesserocr(OCRAgent):
+    """OCR agent that runs tesseract in process through tesserocr.
+
+    Instead of starting a tesseract process and writing the image to a temporary file for every
+    call, each thread keeps one tesseract engine per language set, loaded on first use, and
+    passes it the pixels of the image directly. Engines are not shared between threads, so
+    images can be OCR'd concurrently with `get_texts_from_images`.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def get_layout_from_image(
+        self,
+        image: Union[PILImage.Image, np.ndarray],
+        ocr_languages: str = "eng",
+    ) -> List[TextRegion]:
+        api = self._get_api(ocr_languages)
+        _set_image(api, image)
+        return parse_ocr_data_tesseract(parse_tsv_text(api.GetTSVText(0)))
+
+    def get_text_from_image(
+        self,
+        image: Union[PILImage.Image, np.ndarray],
+        ocr_languages: str = "eng",
+    ) -> str:
+        api = self._get_api(ocr_languages)
+        _set_image(api, image)
+        return api.GetUTF8Text()
+
+    def get_text_and_boxes_from_image(
+        self,
+        image: Union[PILImage.Image, np.ndarray],
+        ocr_languages: str = "eng",
+    ) -> Tuple[str, str]:
+        api = self._get_api(ocr_languages)
+        _set_image(api, image)
+        # The page is recognized once and both outputs are read from the same result
+        return api.GetUTF8Text(), api.GetBoxText(0)
+
+    @requires_dependencies("tesserocr", extras="tesserocr")
+    def _get_api(self, ocr_languages: str):
+        import tesserocr
+
+        apis: Dict[str, "tesserocr.PyTessBaseAPI"] = self._local.__dict__.setdefault("apis", {})
+        if ocr_languages not in apis:
+            apis[ocr_languages] = tesserocr.PyTessBaseAPI(lang=ocr_languages)
+        return apis[ocr_languages]
+
+
+def _set_image(api, image: Union[PILImage.Image, np.ndarray]) -> None:
+    if isinstance(image, PILImage.Image) and image.mode not in ("L", "RGB"):
+        image = image.convert("RGB")
+    pixels = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    bytes_per_pixel = pixels.shape[2] if pixels.ndim == 3 else 1
+    api.SetImageBytes(pixels.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+
+
+def parse_tsv_text(tsv_text: str) -> Dict[str, list]:
+    """Parses the TSV output of tesseract into the dictionary of columns returned by
+    `unstructured_pytesseract.image_to_data` with `output_type=Output.DICT`."""
+    ocr_data: Dict[str, list] = {column: [] for column in TSV_COLUMNS}
+    for line in tsv_text.splitlines():
+        values = line.split("\t", len(TSV_COLUMNS) - 1)
+        # Skips the header, which tesseract only writes for the command line output
+        if len(values) < len(TSV_COLUMNS) or not values[0].isdigit():
+            continue
+        for column, value in zip(TSV_COLUMNS, values):
+            if column == "text":
+                ocr_data[column].append(value)
+            elif column == "conf":
+                ocr_data[column].append(float(value))
+            else:
+                ocr_data[column].append(int(value))
+    return ocr_data
@@ -0,0 +1,169 @@
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import IO, Dict, Iterator, List, Optional, Tuple, Union
+
+from PIL import Image as PILImage
+
+from unstructured.partition.common import convert_to_bytes, exactly_one
+from unstructured.partition.utils.constants import PDF_RENDER_CACHE_MAX_MEMORY_BYTES
+from unstructured.utils import requires_dependencies
+
+RenderedPageKey = Tuple[str, int, int]
+
+
+class RenderedPDFPages:
+    """Renders the pages of a PDF with pypdfium2 and keeps them so that every stage that needs
+    the same rasterization of a page can reuse it instead of rendering it again.
+
+    Pages are keyed by (source, page number, dpi) and rendered in chunks of `chunk_size` pages
+    starting at the first page requested. Rendered pages are held in memory up to
+    `max_memory_bytes`; past that, the least recently used pages are spilled to uncompressed PPM
+    files in a temporary directory and read back on demand.
+
+    The document is opened once, from `filename` or from the bytes of `file`, and pages are
+    rendered from it in memory, so a PDF gives the same images whichever way it is passed.
+    """
+
+    def __init__(
+        self,
+        filename: str = "",
+        file: Optional[Union[bytes, IO[bytes]]] = None,
+        max_memory_bytes: int = PDF_RENDER_CACHE_MAX_MEMORY_BYTES,
+        chunk_size: int = 10,
+        total_pages: Optional[int] = None,
+    ):
+        exactly_one(filename=filename, file=file)
+        self.filename = filename
+        self.max_memory_bytes = max_memory_bytes
+        self.chunk_size = chunk_size
+        self._bytes = convert_to_bytes(file) if file is not None else None
+        self._source = filename or hashlib.sha1(self._bytes).hexdigest()
+        self._page_count = total_pages
+        self._memory: "OrderedDict[RenderedPageKey, PILImage.Image]" = OrderedDict()
+        self._memory_bytes = 0
+        self._spilled: Dict[RenderedPageKey, str] = {}
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._pdfium_document = None
+
+    def __enter__(self) -> "RenderedPDFPages":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Drops the pages held in memory and removes any pages spilled to disk."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        self._spilled.clear()
+        if self._spill_dir is not None:
+            self._spill_dir.cleanup()
+            self._spill_dir = None
+        if self._pdfium_document is not None:
+            self._pdfium_document.close()
+            self._pdfium_document = None
+
+    @property
+    def page_count(self) -> int:
+        if self._page_count is None:
+            self._page_count = len(self._get_pdfium_document())
+        return self._page_count
+
+    def get_page(self, page_number: int, dpi: int = 200) -> PILImage.Image:
+        """Returns the image of the given (1-indexed) page rendered at `dpi`. The image is shared
+        with other consumers of the cache and must not be modified in place."""
+        key = (self._source, page_number, dpi)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        if key in self._spilled:
+            with PILImage.open(self._spilled[key]) as spilled_image:
+                image = spilled_image.copy()
+            self._store(key, image)
+            return image
+
+        last_page = min(page_number + self.chunk_size - 1, self.page_count)
+        image, *rest = self.render_pages(page_number, last_page, dpi)
+        for offset, rendered_image in enumerate(rest, start=1):
+            rendered_key = (self._source, page_number + offset, dpi)
+            if rendered_key not in self._memory:
+                self._store(rendered_key, rendered_image)
+        # The requested page is stored last so that storing the rest of its chunk cannot spill it
+        # before it is returned
+        self._store(key, image)
+        return image
+
+    def release_page(self, page_number: int, dpi: int = 200) -> None:
+        """Drops the image of the given (1-indexed) page rendered at `dpi` from the cache, for
+        consumers that are done with the page."""
+        key = (self._source, page_number, dpi)
+        image = self._memory.pop(key, None)
+        if image is not None:
+            self._memory_bytes -= _image_nbytes(image)
+        spilled_path = self._spilled.pop(key, None)
+        if spilled_path is not None:
+            os.remove(spilled_path)
+
+    def iter_pages(self, dpi: int = 200) -> Iterator[PILImage.Image]:
+        """Yields the image of every page of the document rendered at `dpi`, in page order."""
+        for page_number in range(1, self.page_count + 1):
+            yield self.get_page(page_number, dpi=dpi)
+
+    def _get_pdfium_document(self):
+        if self._pdfium_document is None:
+            source = self._bytes if self._bytes is not None else self.filename
+            self._pdfium_document = _open_pdfium_document(source)
+        return self._pdfium_document
+
+    def render_pages(self, first_page: int, last_page: int, dpi: int = 200) -> List[PILImage.Image]:
+        """Renders the (1-indexed) pages from `first_page` to `last_page` at `dpi` without keeping
+        them, for consumers that use each page only once."""
+        document = self._get_pdfium_document()
+        return [
+            _render_pdfium_page(document, page_number, dpi)
+            for page_number in range(first_page, last_page + 1)
+        ]
+
+    def _store(self, key: RenderedPageKey, image: PILImage.Image) -> None:
+        self._memory[key] = image
+        self._memory_bytes += _image_nbytes(image)
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            spilled_key, spilled_image = self._memory.popitem(last=False)
+            self._memory_bytes -= _image_nbytes(spilled_image)
+            self._spill(spilled_key, spilled_image)
+
+    def _spill(self, key: RenderedPageKey, image: PILImage.Image) -> None:
+        if key in self._spilled:
+            return
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory()
+        _, page_number, dpi = key
+        path = os.path.join(self._spill_dir.name, f"page-{page_number}-{dpi}.ppm")
+        image.save(path, format="PPM")
+        self._spilled[key] = path
+
+
+@requires_dependencies("pypdfium2", extras="pdf")
+def _open_pdfium_document(source: Union[str, bytes]):
+    import pypdfium2
+
+    return pypdfium2.PdfDocument(source)
+
+
+def _render_pdfium_page(document, page_number: int, dpi: int) -> PILImage.Image:
+    page = document[page_number - 1]
+    try:
+        # pdfium renders at 72 dpi for a scale of 1, the same as poppler's default
+        bitmap = page.render(scale=dpi / 72)
+        # The bitmap is BGR, so converting it to an RGB PIL image copies it and the image stays
+        # valid after the page is closed
+        return bitmap.to_pil()
+    finally:
+        page.close()
+
+
+def _image_nbytes(image: PILImage.Image) -> int:
+    return image.width * image.height * len(image.getbands())
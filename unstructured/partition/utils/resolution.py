@@ -0,0 +1,74 @@
+import contextlib
+import math
+from typing import List, Optional, Tuple, Union
+
+from PIL import Image as PILImage
+
+from unstructured.documents.coordinates import PixelSpace
+from unstructured.documents.elements import Element
+from unstructured.utils import requires_dependencies
+
+
+def get_page_dpi(width: float, height: float, dpi: int, max_pixels: Optional[int]) -> int:
+    """Returns the DPI to render a page of `width` x `height` points at: `dpi`, or the highest
+    lower DPI at which the page fits in `max_pixels` pixels."""
+    if not max_pixels or width <= 0 or height <= 0:
+        return dpi
+    max_dpi = int(72 * math.sqrt(max_pixels / (width * height)))
+    return max(1, min(dpi, max_dpi))
+
+
+def get_page_pixels(width: float, height: float, dpi: int) -> int:
+    """Returns the number of pixels of a page of `width` x `height` points rendered at `dpi`."""
+    return int(width * dpi / 72) * int(height * dpi / 72)
+
+
+@requires_dependencies("pypdfium2", extras="pdf")
+def get_pdf_page_sizes(source: Union[str, bytes]) -> List[Tuple[float, float]]:
+    """Returns the (width, height) in points of every page of a PDF, without parsing the
+    content of the pages."""
+    import pypdfium2
+
+    with contextlib.closing(pypdfium2.PdfDocument(source)) as pdf:
+        return [pdf.get_page_size(i) for i in range(len(pdf))]
+
+
+def downscale_image(
+    image: PILImage.Image,
+    max_pixels: Optional[int],
+) -> Tuple[PILImage.Image, float]:
+    """Returns `image` resized to fit in `max_pixels` pixels, keeping its aspect ratio, and the
+    factor it was scaled by. Images that already fit are returned as they are, with a factor
+    of 1."""
+    width, height = image.size
+    if not max_pixels or width * height <= max_pixels:
+        return image, 1.0
+    factor = math.sqrt(max_pixels / (width * height))
+    size = (max(1, int(width * factor)), max(1, int(height * factor)))
+    format = image.format
+    # Palette and bilevel images can only be resized with nearest neighbor resampling, which would
+    # drop the thin strokes of text
+    if image.mode not in ("L", "RGB"):
+        image = image.convert("RGB")
+    resized_image = image.resize(size, PILImage.LANCZOS, reducing_gap=3.0)
+    resized_image.format = format
+    return resized_image, size[0] / width
+
+
+def rescale_element_coordinates(elements: List[Element], scale: float) -> None:
+    """Maps the coordinates of elements found on a page image scaled by `scale` back to the pixel
+    space of the unscaled page, in place."""
+    if scale == 1.0:
+        return
+    # Elements can share their metadata, so coordinates are only converted once
+    converted_ids = set()
+    for element in elements:
+        coordinates = element.metadata.coordinates
+        if coordinates is None or coordinates.system is None or id(coordinates) in converted_ids:
+            continue
+        converted_ids.add(id(coordinates))
+        system = coordinates.system
+        element.convert_coordinates_to_new_system(
+            PixelSpace(width=round(system.width / scale), height=round(system.height / scale)),
+            in_place=True,
+        )
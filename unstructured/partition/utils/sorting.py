@@ -9,7 +9,7 @@ from unstructured.partition.utils.constants import (
     SORT_MODE_BASIC,
     SORT_MODE_XY_CUT,
 )
-from unstructured.partition.utils.xycut import recursive_xy_cut, recursive_xy_cut_swapped
+from unstructured.partition.utils.xycut import xy_cut
 
 
 def coordinates_to_bbox(coordinates: CoordinatesMetadata) -> Tuple[int, int, int, int]:
@@ -57,6 +57,32 @@ def shrink_bbox(bbox: Tuple[int, int, int, int], shrink_factor) -> Tuple[int, in
     return int(left), int(top), int(new_right), int(new_bottom)
 
 
+def coordinates_to_bboxes(
+    coordinates_list: List[CoordinatesMetadata],
+    shrink_factor: float = 1.0,
+) -> np.ndarray:
+    """
+    Convert the coordinates of a page to an (N, 4) array of bounding boxes, each shrunk by
+    `shrink_factor` like `shrink_bbox`.
+
+    Parameters:
+        coordinates_list (List[CoordinatesMetadata]): The coordinates of the elements of the page,
+        each with 4 valid points.
+        shrink_factor (float): The factor by which to shrink the bounding boxes (0.0 to 1.0).
+
+    Returns:
+        np.ndarray: An integer array whose rows are the bounding boxes in the format
+        (left, top, right, bottom).
+    """
+
+    points = np.array([coordinates.points for coordinates in coordinates_list], dtype=float)
+    left_top = np.trunc(points[:, 0])
+    right_bottom = np.trunc(points[:, 2])
+    size = right_bottom - left_top
+    new_right_bottom = right_bottom - (size - size * shrink_factor)
+    return np.hstack([left_top, np.trunc(new_right_bottom)]).astype(int)
+
+
 def coord_has_valid_points(coordinates: CoordinatesMetadata) -> bool:
     """
     Verifies all 4 points in a coordinate exist and are positive.
@@ -90,8 +116,7 @@ def sort_page_elements(
      should have metadata containing coordinates.
     - sort_mode (str, optional): The mode by which the elements will be sorted. Default is
      SORT_MODE_XY_CUT.
-        - SORT_MODE_XY_CUT: Sorts elements based on XY-cut sorting approach. Requires the
-         recursive_xy_cut function and coordinates_to_bbox function to be defined. And requires all
+        - SORT_MODE_XY_CUT: Sorts elements based on XY-cut sorting approach. Requires all
          elements to have valid cooridnates
         - SORT_MODE_BASIC: Sorts elements based on their coordinates. Elements without coordinates
          will be pushed to the end.
@@ -135,21 +160,17 @@ def sort_page_elements(
     if sort_mode == SORT_MODE_XY_CUT:
         if not _coords_ok(strict_points=True):
             return page_elements
-        shrunken_bboxes = []
-        for coords in coordinates_list:
-            bbox = coordinates_to_bbox(coords)
-            shrunken_bbox = shrink_bbox(bbox, shrink_factor)
-            shrunken_bboxes.append(shrunken_bbox)
-
-        res: List[int] = []
-        xy_cut_sorting_func = (
-            recursive_xy_cut_swapped if xy_cut_primary_direction == "x" else recursive_xy_cut
-        )
-        xy_cut_sorting_func(
-            np.asarray(shrunken_bboxes).astype(int),
+        shrunken_bboxes = coordinates_to_bboxes(coordinates_list, shrink_factor)
+        res = xy_cut(
+            shrunken_bboxes,
             np.arange(len(shrunken_bboxes)),
-            res,
+            primary_axis=0 if xy_cut_primary_direction == "x" else 1,
         )
+        # Boxes with no width or height that fall in a gap between the cuts are not placed by
+        # xy-cut, so they are kept at the end in their original order
+        if len(res) < len(page_elements):
+            placed = set(res)
+            res.extend(i for i in range(len(page_elements)) if i not in placed)
         sorted_page_elements = [page_elements[i] for i in res]
     elif sort_mode == SORT_MODE_BASIC:
         if not _coords_ok(strict_points=False):
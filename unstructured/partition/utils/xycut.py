@@ -29,11 +29,16 @@ def projection_by_bboxes(boxes: np.ndarray, axis: int) -> np.ndarray:
 
     assert axis in [0, 1]
     length = np.max(boxes[:, axis::2])
-    res = np.zeros(length, dtype=int)
-    # TODO: how to remove for loop?
-    for start, end in boxes[:, axis::2]:
-        res[start:end] += 1
-    return res
+    starts = np.clip(boxes[:, axis], 0, length)
+    ends = np.clip(boxes[:, axis + 2], 0, length)
+    nonempty = starts < ends
+    # Each box adds 1 at its start and -1 at its end, so the cumulative sum counts the boxes
+    # covering each pixel without a Python loop over the boxes
+    changes = np.bincount(starts[nonempty], minlength=length + 1) - np.bincount(
+        ends[nonempty],
+        minlength=length + 1,
+    )
+    return np.cumsum(changes[:length])
 
 
 # from: https://dothinking.github.io/2021-06-19-%E9%80%92%E5%BD%92%E6%8A%95%E5%BD%B1
@@ -83,63 +88,124 @@ def split_projection_profile(arr_values: np.ndarray, min_value: float, min_gap:
     return arr_start, arr_end
 
 
-def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
+def split_boxes_by_projection(starts: np.ndarray, ends: np.ndarray):
+    """Returns the start and end indexes of the groups that the projection of the boxes
+    spanning [starts, ends) on an axis splits into, the same as
+    `split_projection_profile(projection, 0, 1)` but without building the per-pixel projection.
+    `starts` must be sorted.
+
+    Returns:
+        tuple: Start indexes and end indexes of split groups, or None if no box has a positive
+        length on the axis.
     """
+    nonempty = starts < ends
+    starts = starts[nonempty]
+    ends = ends[nonempty]
+    if not len(starts):
+        return
 
-    Args:
-        boxes: (N, 4)
-        indices: during the recursion process, the index of box in the original data
-         is always represented.
-        res: save output
+    # A box starts a new group when it starts past the end of every box before it, i.e. when there
+    # is at least one uncovered pixel between them
+    max_ends = np.maximum.accumulate(ends)
+    new_group = np.empty(len(starts), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] > max_ends[:-1]
+    group_starts = np.flatnonzero(new_group)
+    group_ends = np.append(group_starts[1:], len(starts)) - 1
+    return starts[group_starts], max_ends[group_ends]
+
+
+def xy_cut(
+    boxes: np.ndarray,
+    indices: np.ndarray,
+    primary_axis: int = 1,
+    max_depth: int = 1000,
+) -> List[int]:
+    """
+    Returns the indices of the boxes in XY-cut reading order.
+
+    The boxes are split into groups along `primary_axis` (1 cuts on y first, 0 on x), each
+    group is split along the other axis, and every group that is split again is cut the same
+    way. The groups are processed with an explicit stack instead of recursion, in the same
+    order as the recursive implementation, so deeply nested layouts do not hit the recursion
+    limit. Past `max_depth` nested cuts, the remaining boxes are ordered by their top left
+    corner, starting with the coordinate on the primary axis.
 
+    Args:
+        boxes: (N, 4) - Numpy array representing bounding boxes with shape (N, 4)
+        where each row is (left, top, right, bottom)
+        indices: An array representing indices that correspond to boxes in the original data
+        primary_axis: The axis of the first cut, 1 for y and 0 for x
+        max_depth: The number of nested cuts after which the boxes are ordered by corner
     """
-    # project to the y-axis
     assert len(boxes) == len(indices)
+    assert primary_axis in [0, 1]
+    secondary_axis = 1 - primary_axis
+
+    res: List[int] = []
+    # The stack holds either the (boxes, indices, depth) of a group that remains to be cut or the
+    # indices of a group that cannot be split any further, pushed in reverse order
+    stack: list = [(boxes, indices, 0)]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, tuple):
+            res.extend(item)
+            continue
 
-    _indices = boxes[:, 1].argsort()
-    y_sorted_boxes = boxes[_indices]
-    y_sorted_indices = indices[_indices]
+        boxes, indices, depth = item
+        if depth >= max_depth:
+            order = np.lexsort((boxes[:, secondary_axis], boxes[:, primary_axis]))
+            res.extend(indices[order])
+            continue
 
-    # debug_vis(y_sorted_boxes, y_sorted_indices)
+        children = []
+        _, _, chunks = _split_boxes(boxes, indices, primary_axis)
+        for chunk_boxes, chunk_indices in chunks:
+            _, sorted_indices, groups = _split_boxes(chunk_boxes, chunk_indices, secondary_axis)
+            if len(groups) == 1:
+                # The chunk cannot be divided along the secondary axis
+                children.append(sorted_indices)
+                continue
+            children.extend(
+                (group_boxes, group_indices, depth + 1) for group_boxes, group_indices in groups
+            )
+        stack.extend(reversed(children))
+    return res
 
-    y_projection = projection_by_bboxes(boxes=y_sorted_boxes, axis=1)
-    pos_y = split_projection_profile(y_projection, 0, 1)
-    if not pos_y:
-        return
 
-    arr_y0, arr_y1 = pos_y
-    for r0, r1 in zip(arr_y0, arr_y1):
-        # [r0, r1] means that the areas with bbox will be divided horizontally, and these areas
-        # will be divided vertically.
-        _indices = (r0 <= y_sorted_boxes[:, 1]) & (y_sorted_boxes[:, 1] < r1)
+def _split_boxes(boxes: np.ndarray, indices: np.ndarray, axis: int):
+    """Sorts the boxes by their start on `axis` and splits them into the groups separated by
+    a gap in their projection on the axis. Returns the sorted boxes and indices and the
+    (boxes, indices) of each group; boxes that start inside a gap are in no group."""
+    _indices = boxes[:, axis].argsort()
+    sorted_boxes = boxes[_indices]
+    sorted_indices = indices[_indices]
 
-        y_sorted_boxes_chunk = y_sorted_boxes[_indices]
-        y_sorted_indices_chunk = y_sorted_indices[_indices]
+    pos = split_boxes_by_projection(sorted_boxes[:, axis], sorted_boxes[:, axis + 2])
+    if not pos:
+        return sorted_boxes, sorted_indices, []
 
-        _indices = y_sorted_boxes_chunk[:, 0].argsort()
-        x_sorted_boxes_chunk = y_sorted_boxes_chunk[_indices]
-        x_sorted_indices_chunk = y_sorted_indices_chunk[_indices]
+    # The boxes are sorted by their start, so the boxes starting in each group are a contiguous
+    # slice
+    arr_start, arr_end = pos
+    lower = np.searchsorted(sorted_boxes[:, axis], arr_start, side="left")
+    upper = np.searchsorted(sorted_boxes[:, axis], arr_end, side="left")
+    groups = [(sorted_boxes[i:j], sorted_indices[i:j]) for i, j in zip(lower, upper)]  # noqa: E203
+    return sorted_boxes, sorted_indices, groups
 
-        # project in the x direction
-        x_projection = projection_by_bboxes(boxes=x_sorted_boxes_chunk, axis=0)
-        pos_x = split_projection_profile(x_projection, 0, 1)
-        if not pos_x:
-            continue
 
-        arr_x0, arr_x1 = pos_x
-        if len(arr_x0) == 1:
-            # x-direction cannot be divided
-            res.extend(x_sorted_indices_chunk)
-            continue
+def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
+    """
 
-        # can be separated in the x-direction and continue to call recursively
-        for c0, c1 in zip(arr_x0, arr_x1):
-            _indices = (c0 <= x_sorted_boxes_chunk[:, 0]) & (x_sorted_boxes_chunk[:, 0] < c1)
-            recursive_xy_cut(
-                x_sorted_boxes_chunk[_indices],
-                x_sorted_indices_chunk[_indices],
-                res,
-            )
+    Args:
+        boxes: (N, 4)
+        indices: during the recursion process, the index of box in the original data
+         is always represented.
+        res: save output
+
+    Cuts on y first. Kept for compatibility, see `xy_cut`.
+    """
+    res.extend(xy_cut(boxes, indices, primary_axis=1))
 
 
 def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
@@ -149,57 +215,10 @@ def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[i
         where each row is (left, top, right, bottom)
         indices: An array representing indices that correspond to boxes in the original data
         res: A list to save the output results
-    """
-
-    # Sort the bounding boxes based on x-coordinates (flipped)
-    assert len(boxes) == len(indices)
-    _indices = boxes[:, 0].argsort()
-    x_sorted_boxes = boxes[_indices]
-    x_sorted_indices = indices[_indices]
-
-    # Project the boxes onto the x-axis and split the projection profile
-    x_projection = projection_by_bboxes(boxes=x_sorted_boxes, axis=0)
-    pos_x = split_projection_profile(x_projection, 0, 1)
 
-    if not pos_x:
-        return
-
-    arr_x0, arr_x1 = pos_x
-
-    # Loop over the segments obtained from the x-axis projection
-    for c0, c1 in zip(arr_x0, arr_x1):
-        # Obtain sub-boxes in the x-axis segment
-        _indices = (c0 <= x_sorted_boxes[:, 0]) & (x_sorted_boxes[:, 0] < c1)
-        x_sorted_boxes_chunk = x_sorted_boxes[_indices]
-        x_sorted_indices_chunk = x_sorted_indices[_indices]
-
-        # Sort the sub-boxes based on y-coordinates (flipped)
-        _indices = x_sorted_boxes_chunk[:, 1].argsort()
-        y_sorted_boxes_chunk = x_sorted_boxes_chunk[_indices]
-        y_sorted_indices_chunk = x_sorted_indices_chunk[_indices]
-
-        # Project the sub-boxes onto the y-axis and split the projection profile
-        y_projection = projection_by_bboxes(boxes=y_sorted_boxes_chunk, axis=1)
-        pos_y = split_projection_profile(y_projection, 0, 1)
-
-        if not pos_y:
-            continue
-
-        arr_y0, arr_y1 = pos_y
-
-        if len(arr_y0) == 1:
-            # If there's no splitting along the y-axis, add the indices to the result
-            res.extend(y_sorted_indices_chunk)
-            continue
-
-        # Recursive call for sub-boxes along the y-axis segments
-        for r0, r1 in zip(arr_y0, arr_y1):
-            _indices = (r0 <= y_sorted_boxes_chunk[:, 1]) & (y_sorted_boxes_chunk[:, 1] < r1)
-            recursive_xy_cut_swapped(
-                y_sorted_boxes_chunk[_indices],
-                y_sorted_indices_chunk[_indices],
-                res,
-            )
+    Cuts on x first. Kept for compatibility, see `xy_cut`.
+    """
+    res.extend(xy_cut(boxes, indices, primary_axis=0))
 
 
 def points_to_bbox(points):
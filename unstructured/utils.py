@@ -1,9 +1,24 @@
 import functools
 import importlib
 import json
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typing_extensions import ParamSpec
 
@@ -11,6 +26,7 @@ DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d+%H:%M:%S", "%Y-%m-%dT
 
 
 _T = TypeVar("_T")
+_R = TypeVar("_R")
 _P = ParamSpec("_P")
 
 
@@ -133,6 +149,32 @@ def read_from_jsonl(filename: str) -> List[Dict]:
         return [json.loads(line) for line in input_file]
 
 
+def thread_map(
+    func: Callable[[_T], _R],
+    iterable: Iterable[_T],
+    max_workers: int = 1,
+) -> Iterator[_R]:
+    """Yields `func(item)` for each item of `iterable`, in order.
+
+    With more than one worker, items are processed concurrently in a thread pool. Items are only
+    taken from `iterable` as results are consumed, so at most `2 * max_workers` of them are in
+    flight at a time and a lazy iterable (e.g. of decoded pages) is never fully held in memory.
+    """
+    if max_workers <= 1:
+        for item in iterable:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: Deque[Future] = deque()
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 def requires_dependencies(
     dependencies: Union[str, List[str]],
     extras: Optional[str] = None,